@@ -5,7 +5,7 @@ import importlib.metadata as metadata
 
 ########################################################################################################################
 
-from .abstract_generator import detect_generators
+from .registry import detect_generators
 
 ########################################################################################################################
 
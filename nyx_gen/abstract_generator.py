@@ -2,54 +2,192 @@
 ########################################################################################################################
 
 import os
-import re
 import abc
+import sys
 import shutil
+import json
 import typing
+import hashlib
 import argparse
+import tempfile
+import contextlib
+import concurrent.futures
+import importlib.metadata as metadata
 
-from jinja2 import Environment, StrictUndefined
+from jinja2 import Environment, FileSystemBytecodeCache, FunctionLoader, StrictUndefined, Template
 
 ########################################################################################################################
 
-NYX_NUMBER_INT    = 0
-NYX_NUMBER_UINT   = 1
-NYX_NUMBER_LONG   = 2
-NYX_NUMBER_ULONG  = 3
-NYX_NUMBER_DOUBLE = 4
+from .model import Element, Node, pascalcase
+from .cmake import BUILD_PROFILES, DEFAULT_BUILD_PROFILE, CMAKE_BUILD_TEMPLATE
+from .formats import NYX_NUMBER_INT, NYX_NUMBER_UINT, NYX_NUMBER_LONG, NYX_NUMBER_ULONG, NYX_NUMBER_DOUBLE, get_number_type
+from .manifest import Manifest, content_digest
+from .profiling import Profiler
 
 ########################################################################################################################
 
-FORMAT_RE = re.compile(r'%([0-9.*+-]*)?(?P<long>l)?(?P<type>[a-zA-Z])')
+def get_cache_dir() -> typing.Optional[str]:
+
+    ####################################################################################################################
+
+    result = os.environ.get('NYX_GEN_CACHE_DIR')
+
+    if not result:
+
+        if sys.platform == 'win32':
+            base = os.environ.get('LOCALAPPDATA') or os.path.expanduser(os.path.join('~', 'AppData', 'Local'))
+        elif sys.platform == 'darwin':
+            base = os.path.expanduser(os.path.join('~', 'Library', 'Caches'))
+        else:
+            base = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser(os.path.join('~', '.cache'))
+
+        result = os.path.join(base, 'nyx-gen')
+
+    ####################################################################################################################
+
+    try:
+
+        os.makedirs(result, exist_ok = True)
+
+    except OSError:
+
+        return None
+
+    ####################################################################################################################
+
+    return result
+
+########################################################################################################################
+
+class _BytecodeCache(FileSystemBytecodeCache):
+
+    ####################################################################################################################
+
+    def load_bytecode(self, bucket) -> None:
+
+        try:
+
+            super().load_bytecode(bucket)
+
+        except OSError:
+
+            pass
+
+    ####################################################################################################################
+
+    def dump_bytecode(self, bucket) -> None:
+
+        try:
+
+            super().dump_bytecode(bucket)
+
+        except OSError:
+
+            pass
+
+########################################################################################################################
+
+_template_sources: typing.Dict[str, str] = {}
+
+########################################################################################################################
+
+def _load_template(name: str) -> typing.Tuple[str, None, typing.Callable[[], bool]]:
+
+    return _template_sources[name], None, lambda: True
 
 ########################################################################################################################
 
-def get_number_type(fmt: str) -> int:
+def _get_version() -> str:
+
+    try:
+
+        return metadata.version('nyx-gen')
+
+    except metadata.PackageNotFoundError:
+
+        return 'local'
+
+########################################################################################################################
+
+def _create_bytecode_cache() -> typing.Optional[_BytecodeCache]:
+
+    cache_dir = get_cache_dir()
+
+    return _BytecodeCache(cache_dir, f'__nyx_gen_{_get_version()}_%s.cache') if cache_dir else None
+
+########################################################################################################################
+
+class Fragment:
 
     ####################################################################################################################
 
-    m = FORMAT_RE.search(fmt)
+    __slots__ = ('text', 'key', 'future')
 
-    if not m:
+    ####################################################################################################################
 
-        raise ValueError(f'Invalid format: {fmt}')
+    def __init__(self, text: typing.Optional[str], key: typing.Optional[str] = None, future: typing.Optional[concurrent.futures.Future] = None):
+
+        self.text = text
+        self.key = key
+        self.future = future
 
     ####################################################################################################################
 
-    l = m.group('long') \
-                    is not None
-    t = m.group('type')
+    def resolve(self) -> 'Fragment':
+
+        if self.future is not None:
+
+            self.text = self.future.result()
+
+            self.future = None
+
+        return self
 
     ####################################################################################################################
 
-    if t in ('d', 'i'):
-        return NYX_NUMBER_LONG if l else NYX_NUMBER_INT
-    elif t in ('u', 'o', 'x', 'X'):
-        return NYX_NUMBER_ULONG if l else NYX_NUMBER_UINT
-    elif t in ('f', 'F', 'e', 'E', 'g', 'G', 'a', 'A', 'm'):
-        return NYX_NUMBER_DOUBLE
+    def __str__(self) -> str:
+
+        return self.resolve().text
+
+########################################################################################################################
+
+def _get_file_mode() -> int:
+
+    umask = os.umask(0)
+
+    os.umask(umask)
+
+    return 0o666 & ~umask
+
+########################################################################################################################
+
+def _digest_default(value: typing.Any) -> typing.Any:
+
+    if isinstance(value, Fragment):
+        return value.key
+    elif isinstance(value, Element):
+        return value.to_dict()
+    else:
+        return str(value)
+
+########################################################################################################################
+
+def _render_job(template: str, context: typing.Dict[str, typing.Any]) -> str:
+
+    return compile_template(template).render(**context)
+
+########################################################################################################################
+
+def _completed_future(value: typing.Any = None, exception: typing.Optional[BaseException] = None) -> concurrent.futures.Future:
+
+    result = concurrent.futures.Future()
+
+    if exception is not None:
+        result.set_exception(exception)
     else:
-        raise ValueError(f'Unsupported type specifier: %{t}')
+        result.set_result(value)
+
+    return result
 
 ########################################################################################################################
 
@@ -79,7 +217,7 @@ class AbstractGenerator(abc.ABC):
 
     ####################################################################################################################
 
-    _env = Environment(undefined = StrictUndefined, trim_blocks = False, lstrip_blocks = False, keep_trailing_newline = True, newline_sequence = '\n', finalize = (lambda v:
+    _env = Environment(loader = FunctionLoader(_load_template), bytecode_cache = _create_bytecode_cache(), auto_reload = False, undefined = StrictUndefined, trim_blocks = False, lstrip_blocks = False, keep_trailing_newline = True, newline_sequence = '\n', finalize = (lambda v:
         (v.replace('\r\n', '\\n').replace('\r', '\\n').replace('\n', '\\n').replace('\t', '\\t'))
         if isinstance(v, str) else v
     ))
@@ -96,19 +234,31 @@ class AbstractGenerator(abc.ABC):
         self._override_main: str = args.override_main
         self._override_cmake: str = args.override_cmake
 
+        self._build_profile: typing.Optional[str] = args.build_profile
+        self._march: typing.Optional[str] = args.march
+
         self._descr = descr
 
+        self._written_files: typing.List[str] = []
+        self._unchanged_files: typing.List[str] = []
+
         ################################################################################################################
 
-        self._devices = sorted((dict(d) for d in descr['devices'].values()), key = lambda x: x['rank'])
+        self._jobs: int = max(1, args.jobs)
+
+        self._executor: typing.Optional[concurrent.futures.Executor] = None
+
+        self._pending_files: typing.List[typing.Tuple[str, concurrent.futures.Future, typing.Optional[str]]] = []
 
-        for device in self._devices:
+        self._pending_fragments: typing.List[Fragment] = []
 
-            device['vectors'] = sorted((dict(vectors) for vectors in device['vectors'].values()), key = lambda x: x['rank'])
+        self.profiler: typing.Optional[Profiler] = None
 
-            for vector in device['vectors']:
+        ################################################################################################################
+
+        self._node = Node(descr)
 
-                vector['defs'] = sorted((dict(vector_defs) for vector_defs in vector['defs'].values()), key = lambda x: x['rank'])
+        self._devices = self._node.devices
 
         ################################################################################################################
 
@@ -118,6 +268,44 @@ class AbstractGenerator(abc.ABC):
 
             shutil.rmtree(self._driver_path)
 
+        ################################################################################################################
+
+        self._manifest: typing.Optional[Manifest] = Manifest(self._driver_path, get_cache_dir()) if args.incremental else None
+
+        if self._manifest is not None:
+
+            self._node_digest = self._digest({key: value for key, value in descr.items() if key != 'devices'})
+
+            self._digests = {id(device): self._digest(device) for device in self._devices}
+
+            self._digests[id(self._devices)] = self._digest([self._digests[id(device)] for device in self._devices])
+
+    ####################################################################################################################
+
+    def _render_cmake_build(self, lang: str) -> Fragment:
+
+        ################################################################################################################
+
+        build_profile = self._build_profile or self._descr.get('buildProfile', DEFAULT_BUILD_PROFILE)
+
+        if build_profile not in BUILD_PROFILES:
+
+            raise ValueError(f'Invalid build profile `{build_profile}` (expected one of {", ".join(BUILD_PROFILES)})')
+
+        ################################################################################################################
+
+        march = self._march if self._march is not None else self._descr.get('march', '')
+
+        ################################################################################################################
+
+        return self.render_fragment(
+            CMAKE_BUILD_TEMPLATE,
+            lang = lang,
+            build_profile = build_profile,
+            build_profiles = BUILD_PROFILES,
+            march = march
+        )
+
     ####################################################################################################################
 
     def create_directories(self) -> None:
@@ -128,7 +316,7 @@ class AbstractGenerator(abc.ABC):
 
     ####################################################################################################################
 
-    def render(self, template: str, /, **context: typing.Any) -> str:
+    def _render_context(self, context: typing.Dict[str, typing.Any]) -> typing.Dict[str, typing.Any]:
 
         context = dict(context)
 
@@ -138,7 +326,348 @@ class AbstractGenerator(abc.ABC):
         context['src_ext'] = self.__class__._src_ext
         context['head_ext'] = self.__class__._head_ext
 
-        return AbstractGenerator._env.from_string(template).render(**context)
+        return context
+
+    ####################################################################################################################
+
+    def render(self, template: str, /, **context: typing.Any) -> str:
+
+        return compile_template(template).render(**self._render_context(context))
+
+    ####################################################################################################################
+
+    def render_stream(self, template: str, /, **context: typing.Any) -> typing.Iterator[str]:
+
+        return compile_template(template).generate(**self._render_context(context))
+
+    ####################################################################################################################
+
+    def _render_async(self, template: str, context: typing.Dict[str, typing.Any]) -> concurrent.futures.Future:
+
+        ################################################################################################################
+
+        try:
+
+            for value in context.values():
+
+                if isinstance(value, Fragment):
+                    value = [value]
+
+                if isinstance(value, list):
+
+                    for item in value:
+
+                        if isinstance(item, Fragment):
+
+                            item.resolve()
+
+            return self._executor.submit(_render_job, template, self._render_context(context))
+
+        ################################################################################################################
+
+        except Exception as e:
+
+            return _completed_future(exception = e)
+
+    ####################################################################################################################
+
+    @staticmethod
+    def _digest(value: typing.Any) -> str:
+
+        return content_digest(json.dumps(value, sort_keys = True, default = _digest_default))
+
+    ####################################################################################################################
+
+    def _digest_inputs(self, template: str, context: typing.Dict[str, typing.Any]) -> str:
+
+        ################################################################################################################
+
+        result = hashlib.sha256()
+
+        result.update(f'{_get_version()}:{self.__class__.__name__}:{self._node_digest}:'.encode('utf-8'))
+
+        result.update(template.encode('utf-8'))
+
+        ################################################################################################################
+
+        for key, value in sorted(context.items()):
+
+            digest = self._digests.get(id(value))
+
+            result.update(f':{key}={digest if digest is not None else self._digest(value)}'.encode('utf-8'))
+
+        ################################################################################################################
+
+        return result.hexdigest()
+
+    ####################################################################################################################
+
+    def render_fragment(self, template: str, /, **context: typing.Any) -> Fragment:
+
+        ################################################################################################################
+
+        if self._manifest is not None:
+
+            key = self._digest_inputs(template, context)
+
+            text = self._manifest.get_fragment(key)
+
+            if text is not None:
+
+                return Fragment(text, key)
+
+        else:
+
+            key = None
+
+        ################################################################################################################
+
+        if self._executor is not None:
+
+            result = Fragment(None, key, self._render_async(template, context))
+
+            self._pending_fragments.append(result)
+
+        else:
+
+            result = Fragment(self.render(template, **context), key)
+
+            if self._manifest is not None:
+
+                self._manifest.set_fragment(key, result.text)
+
+        ################################################################################################################
+
+        return result
+
+    ####################################################################################################################
+
+    def render_file(self, filename: str, template: str, /, **context: typing.Any) -> None:
+
+        ################################################################################################################
+
+        if self._manifest is not None:
+
+            inputs = self._digest_inputs(template, context)
+
+            if self._manifest.is_fresh(filename, inputs):
+
+                self._unchanged_files.append(filename)
+
+                return
+
+        else:
+
+            inputs = None
+
+        ################################################################################################################
+
+        if self._executor is not None:
+
+            self._pending_files.append((filename, self._render_async(template, context), inputs))
+
+        else:
+
+            self._write_file(filename, self.render_stream(template, **context), inputs)
+
+    ####################################################################################################################
+
+    def write_file(self, filename: str, content: str) -> None:
+
+        if self._executor is not None:
+
+            self._pending_files.append((filename, _completed_future(content), None))
+
+        else:
+
+            self._write_file(filename, content, None)
+
+    ####################################################################################################################
+
+    def _flush(self) -> None:
+
+        ################################################################################################################
+
+        errors = []
+
+        for filename, future, inputs in self._pending_files:
+
+            try:
+
+                self._write_file(filename, future.result(), inputs)
+
+            except Exception as e:
+
+                errors.append(f'{os.path.relpath(filename, self._driver_path)}: {e.__str__()}')
+
+        ################################################################################################################
+
+        if self._manifest is not None:
+
+            for fragment in self._pending_fragments:
+
+                if fragment.future is None or fragment.future.exception() is None:
+
+                    self._manifest.set_fragment(fragment.key, fragment.resolve().text)
+
+        ################################################################################################################
+
+        self._pending_files = []
+
+        self._pending_fragments = []
+
+        ################################################################################################################
+
+        if errors:
+
+            raise RuntimeError(f'{len(errors)} output(s) failed: {"; ".join(errors)}')
+
+    ####################################################################################################################
+
+    def _section(self, name: str, kind: str) -> typing.ContextManager:
+
+        return self.profiler.section(name, kind) if self.profiler is not None else contextlib.nullcontext()
+
+    ####################################################################################################################
+
+    def _write_file(self, filename: str, content: typing.Union[str, typing.Iterable[str]], inputs: typing.Optional[str]) -> None:
+
+        with self._section(os.path.relpath(filename, self._driver_path), 'file'):
+
+            self._write_file_atomic(filename, content, inputs)
+
+    ####################################################################################################################
+
+    def _write_file_atomic(self, filename: str, content: typing.Union[str, typing.Iterable[str]], inputs: typing.Optional[str]) -> None:
+
+        ################################################################################################################
+
+        if isinstance(content, str):
+
+            content = (content, )
+
+        ################################################################################################################
+
+        sha256 = hashlib.sha256()
+
+        fd, temp_filename = tempfile.mkstemp(prefix = f'.{os.path.basename(filename)}.', suffix = '.tmp', dir = os.path.dirname(filename))
+
+        try:
+
+            with open(fd, 'wt', encoding = 'utf-8') as f:
+
+                for chunk in content:
+
+                    sha256.update(chunk.encode('utf-8'))
+
+                    f.write(chunk)
+
+            digest = sha256.hexdigest()
+
+            ############################################################################################################
+
+            if self._manifest is not None and self._manifest.is_up_to_date(filename, digest, inputs):
+
+                os.unlink(temp_filename)
+
+                self._unchanged_files.append(filename)
+
+                return
+
+            ############################################################################################################
+
+            if os.path.isfile(filename):
+                shutil.copymode(filename, temp_filename)
+            else:
+                os.chmod(temp_filename, _get_file_mode())
+
+            os.replace(temp_filename, filename)
+
+        except BaseException:
+
+            if os.path.exists(temp_filename):
+
+                os.unlink(temp_filename)
+
+            raise
+
+        ################################################################################################################
+
+        if self._manifest is not None:
+
+            self._manifest.update(filename, digest, inputs)
+
+        self._written_files.append(filename)
+
+    ####################################################################################################################
+
+    @property
+    def written_files(self) -> typing.List[str]:
+
+        return list(self._written_files)
+
+    ####################################################################################################################
+
+    @property
+    def unchanged_files(self) -> typing.List[str]:
+
+        return list(self._unchanged_files)
+
+    ####################################################################################################################
+
+    def run(self) -> typing.List[str]:
+
+        ################################################################################################################
+
+        self.create_directories()
+
+        if self._manifest is not None:
+
+            self._manifest.load()
+
+        ################################################################################################################
+
+        if self.profiler is not None:
+
+            for name in dir(type(self)):
+
+                if name.startswith('_generate') and callable(getattr(type(self), name)):
+
+                    setattr(self, name, self.profiler.wrap(name, 'method', getattr(self, name)))
+
+        ################################################################################################################
+
+        if self._jobs > 1:
+
+            self._executor = concurrent.futures.ProcessPoolExecutor(max_workers = self._jobs)
+
+        try:
+
+            with self._section('generate', 'phase'):
+
+                self.generate()
+
+            with self._section('flush', 'phase') if self._executor is not None else contextlib.nullcontext():
+
+                self._flush()
+
+        finally:
+
+            if self._executor is not None:
+
+                self._executor.shutdown()
+
+                self._executor = None
+
+        ################################################################################################################
+
+        if self._manifest is not None:
+
+            self._manifest.save()
+
+        ################################################################################################################
+
+        return self.written_files
 
     ####################################################################################################################
 
@@ -149,34 +678,29 @@ class AbstractGenerator(abc.ABC):
 
 ########################################################################################################################
 
-# noinspection PyProtectedMember
-def detect_generators() -> typing.Dict[str, typing.Type[AbstractGenerator]]:
+def compile_template(template: str) -> Template:
 
     ####################################################################################################################
 
-    from .generators.posix_c import PosixCGenerator
-    from .generators.posix_cpp import PosixCPPGenerator
-    from .generators.gnuradio import GNURadioGenerator
-    from .generators.arduino_eth import ArduinoEthGenerator
-    from .generators.arduino_wifi import ArduinoWifiGenerator
+    key = hashlib.sha1(template.encode('utf-8')).hexdigest()
+
+    _template_sources.setdefault(key, template)
 
     ####################################################################################################################
 
-    result = {
-        PosixCGenerator._name: PosixCGenerator,
-        PosixCPPGenerator._name: PosixCPPGenerator,
-        GNURadioGenerator._name: GNURadioGenerator,
-        ArduinoEthGenerator._name: ArduinoEthGenerator,
-        ArduinoWifiGenerator._name: ArduinoWifiGenerator,
-    }
+    return AbstractGenerator._env.get_template(key)
 
-    ####################################################################################################################
+########################################################################################################################
 
-    return result
+def detect_generators() -> typing.Mapping[str, typing.Type[AbstractGenerator]]:
+
+    from .registry import detect_generators as registry_detect_generators
+
+    return registry_detect_generators()
 
 ########################################################################################################################
 
-AbstractGenerator._env.filters['pascalcase'] = lambda s: ''.join(part.capitalize() for part in s.split('_') if part)
+AbstractGenerator._env.filters['pascalcase'] = pascalcase
 
 AbstractGenerator._env.globals['NYX_NUMBER_INT'] = NYX_NUMBER_INT
 AbstractGenerator._env.globals['NYX_NUMBER_UINT'] = NYX_NUMBER_UINT
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import os
+import glob
+import json
+import typing
+import concurrent.futures
+
+########################################################################################################################
+
+from .server import run_job
+
+########################################################################################################################
+
+def collect_descriptions(paths: typing.List[str]) -> typing.List[str]:
+
+    ####################################################################################################################
+
+    result = []
+
+    for path in paths:
+
+        if os.path.isdir(path):
+
+            matches = sorted(glob.glob(os.path.join(path, '*.json')))
+
+        elif glob.has_magic(path):
+
+            matches = sorted(glob.glob(path, recursive = True))
+
+        else:
+
+            matches = [path]
+
+        for match in matches:
+
+            if match not in result:
+
+                result.append(match)
+
+    ####################################################################################################################
+
+    return result
+
+########################################################################################################################
+
+def _output_folder(path: str, options: dict) -> typing.Optional[str]:
+
+    try:
+
+        with open(path, 'rt') as f:
+
+            node_name = json.load(f)['nodeName']
+
+    except Exception:
+
+        return None # reported by run_job
+
+    return os.path.normcase(os.path.abspath(os.path.join(options.get('output', '.'), node_name)))
+
+########################################################################################################################
+
+def run_batch(paths: typing.List[str], options: dict, jobs: int = 1) -> typing.List[dict]:
+
+    ####################################################################################################################
+    # DESCRIPTIONS SHARING AN OUTPUT FOLDER                                                                            #
+    ####################################################################################################################
+
+    folders = {}
+
+    for path in paths:
+
+        folder = _output_folder(path, options)
+
+        if folder is not None:
+
+            folders.setdefault(folder, []).append(path)
+
+    conflicts = {path: shared for shared in folders.values() if len(shared) > 1 for path in shared}
+
+    ####################################################################################################################
+
+    batch = [{'id': path, 'descrFile': path, 'options': options} for path in paths if path not in conflicts]
+
+    if jobs > 1 and len(batch) > 1:
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers = jobs) as executor:
+
+            results = dict(zip([job['id'] for job in batch], executor.map(run_job, batch)))
+
+    else:
+
+        results = {job['id']: run_job(job) for job in batch}
+
+    ####################################################################################################################
+
+    return [results[path] if path not in conflicts else {
+        'id': path,
+        'status': 'error',
+        'error': f'Shares its output folder (same nodeName) with {", ".join(other for other in conflicts[path] if other != path)}',
+    } for path in paths]
+
+########################################################################################################################
+
+def format_summary(results: typing.List[dict]) -> str:
+
+    ####################################################################################################################
+
+    rows = [('Description', 'Status', 'Files', 'Time (ms)')]
+
+    for result in results:
+
+        if result['status'] == 'ok':
+
+            rows.append((result['id'], 'ok', str(len(result['files'])), f'{result["timings"]["total"]:.1f}'))
+
+        else:
+
+            rows.append((result['id'], 'error', '-', '-'))
+
+    ####################################################################################################################
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+
+    lines = ['  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows]
+
+    lines.insert(1, '  '.join('-' * width for width in widths))
+
+    ####################################################################################################################
+
+    for result in results:
+
+        if result['status'] != 'ok':
+
+            lines.append(f'{result["id"]}: {result["error"]}')
+
+    ####################################################################################################################
+
+    succeeded = sum(1 for result in results if result['status'] == 'ok')
+
+    lines.append(f'{succeeded} succeeded, {len(results) - succeeded} failed')
+
+    ####################################################################################################################
+
+    return '\n'.join(lines)
+
+########################################################################################################################
@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import os
+import sys
+import json
+import time
+import typing
+import argparse
+import platform
+import tempfile
+import statistics
+
+########################################################################################################################
+
+from . import generators, __version__
+
+from .profiling import Profiler
+
+########################################################################################################################
+
+PHASES = ('json_load', 'init', 'render', 'write', 'other', 'total')
+
+########################################################################################################################
+
+_NUMBER_FORMATS = ('%d', '%u', '%ld', '%lu', '%.3f', '%010.6m')
+
+_VECTOR_TYPES = ('number', 'text', 'switch', 'light', 'blob', 'stream')
+
+########################################################################################################################
+
+def _synthesize_def(vector_type: str, i: int) -> dict:
+
+    ####################################################################################################################
+
+    result = {
+        'name': f'DEF_{i}',
+        'label': f'Def {i}',
+        'rank': i,
+        'callback': i % 2 == 0,
+    }
+
+    ####################################################################################################################
+
+    if vector_type == 'number':
+        result.update(format = _NUMBER_FORMATS[i % len(_NUMBER_FORMATS)], min = 0, max = 100, step = 1, value = 0)
+    elif vector_type == 'text':
+        result.update(value = f'text {i}')
+    elif vector_type == 'switch':
+        result.update(value = 'NYX_ONOFF_ON' if i == 0 else 'NYX_ONOFF_OFF')
+    elif vector_type == 'light':
+        result.update(value = 'NYX_STATE_IDLE')
+    elif vector_type == 'blob':
+        result.update(format = '.bin', value = 'NULL')
+
+    ####################################################################################################################
+
+    return result
+
+########################################################################################################################
+
+def synthesize_description(mode: str, n_devices: int, n_vectors: int, n_defs: int) -> dict:
+
+    ####################################################################################################################
+
+    devices = {}
+
+    for i in range(n_devices):
+
+        vectors = {}
+
+        for j in range(n_vectors):
+
+            vector_type = _VECTOR_TYPES[(i + j) % len(_VECTOR_TYPES)]
+
+            vectors[f'v{j}'] = {
+                'name': f'VECTOR_{j}',
+                'type': vector_type,
+                'rank': j,
+                'state': 'NYX_STATE_IDLE',
+                'perm': 'NYX_PERM_RW',
+                'rule': 'NYX_RULE_ONE_OF_MANY',
+                'group': f'Group {j % 4}',
+                'label': f'Vector {j}',
+                'callback': j % 3 == 0,
+                'defs': {f'd{k}': _synthesize_def(vector_type, k) for k in range(n_defs)},
+            }
+
+        devices[f'd{i}'] = {
+            'name': f'device_{i}',
+            'rank': i,
+            'vectors': vectors,
+        }
+
+    ####################################################################################################################
+
+    return {
+        'mode': mode,
+        'nodeName': 'BenchNode',
+        'nodeTimeout': 1000,
+        'static': False,
+        'enableINDI': True,
+        'indiURL': 'tcp://localhost:7625',
+        'enableMQTT': True,
+        'mqttURL': 'mqtt://localhost:1883',
+        'mqttUsername': '',
+        'mqttPassword': '',
+        'enableNSS': True,
+        'nssURL': 'tcp://localhost:12345',
+        'board': 'espressif32|esp32dev|327680',
+        'wifiSSID': '',
+        'wifiPassword': '',
+        'devices': devices,
+    }
+
+########################################################################################################################
+
+class _PhaseTimer:
+
+    ####################################################################################################################
+
+    def __init__(self):
+
+        self.totals = {'render': 0.0, 'stream': 0.0, 'write': 0.0}
+
+    ####################################################################################################################
+
+    def wrap(self, phase: str, func: typing.Callable) -> typing.Callable:
+
+        def wrapper(*args, **kwargs):
+
+            t0 = time.perf_counter()
+
+            try:
+
+                return func(*args, **kwargs)
+
+            finally:
+
+                self.totals[phase] += time.perf_counter() - t0
+
+        return wrapper
+
+    ####################################################################################################################
+
+    def wrap_stream(self, func: typing.Callable) -> typing.Callable:
+
+        # chunks are rendered lazily, while _write_file consumes them: only the time spent producing them is counted
+
+        def wrapper(*args, **kwargs):
+
+            iterator = iter(self.wrap('stream', func)(*args, **kwargs))
+
+            while True:
+
+                t0 = time.perf_counter()
+
+                chunk = next(iterator, None)
+
+                self.totals['stream'] += time.perf_counter() - t0
+
+                if chunk is None:
+
+                    return
+
+                yield chunk
+
+        return wrapper
+
+########################################################################################################################
+
+def _run_once(profile: str, text: str, output: str) -> typing.Tuple[typing.Dict[str, float], typing.Dict[str, float], typing.List[str]]:
+
+    ####################################################################################################################
+
+    generator_class = generators[profile]
+
+    t0 = time.perf_counter()
+
+    descr = json.loads(text)
+
+    t1 = time.perf_counter()
+
+    args = argparse.Namespace(
+        output = output,
+        override_project = True,
+        override_device = True,
+        override_main = True,
+        override_cmake = True,
+        build_profile = None,
+        march = None,
+        incremental = False,
+        jobs = 1,
+    )
+
+    generator = generator_class(args, descr)
+
+    t2 = time.perf_counter()
+
+    ####################################################################################################################
+
+    timer = _PhaseTimer()
+
+    generator.render = timer.wrap('render', generator.render)
+    generator.render_stream = timer.wrap_stream(generator.render_stream)
+    generator._write_file = timer.wrap('write', generator._write_file)
+
+    generator.profiler = Profiler(trace_memory = False)
+
+    files = generator.run()
+
+    t3 = time.perf_counter()
+
+    ####################################################################################################################
+
+    render = timer.totals['render'] + timer.totals['stream']
+
+    write = timer.totals['write'] - timer.totals['stream']
+
+    phases = {
+        'json_load': t1 - t0,
+        'init': t2 - t1,
+        'render': render,
+        'write': write,
+        'other': (t3 - t2) - render - write,
+        'total': t3 - t0,
+    }
+
+    templates = {section.name: section.duration for section in generator.profiler.sections if section.kind == 'file'}
+
+    ####################################################################################################################
+
+    return {key: round(1000.0 * value, 3) for key, value in phases.items()}, {key: round(1000.0 * value, 3) for key, value in templates.items()}, files
+
+########################################################################################################################
+
+def run_bench(profiles: typing.List[str], n_devices: int, n_vectors: int, n_defs: int, repeat: int = 3) -> dict:
+
+    ####################################################################################################################
+
+    results = []
+
+    for profile in profiles:
+
+        text = json.dumps(synthesize_description(profile, n_devices, n_vectors, n_defs))
+
+        result = {'profile': profile}
+
+        ################################################################################################################
+
+        try:
+
+            runs = []
+
+            template_runs = []
+
+            with tempfile.TemporaryDirectory(prefix = 'nyx-gen-bench-') as output:
+
+                for _ in range(max(1, repeat)):
+
+                    phases, templates, files = _run_once(profile, text, output)
+
+                    runs.append(phases)
+
+                    template_runs.append(templates)
+
+                size = sum(os.path.getsize(filename) for filename in files)
+
+            result['status'] = 'ok'
+            result['files'] = len(files)
+            result['bytes'] = size
+            result['cold_ms'] = runs[0]['total']
+            result['median_ms'] = {phase: statistics.median(run[phase] for run in runs) for phase in PHASES}
+            result['min_ms'] = {phase: min(run[phase] for run in runs) for phase in PHASES}
+            result['templates_ms'] = {name: round(statistics.median(run[name] for run in template_runs), 3) for name in template_runs[0]}
+
+        ################################################################################################################
+
+        except Exception as e:
+
+            result['status'] = 'error'
+            result['error'] = e.__str__()
+
+        ################################################################################################################
+
+        results.append(result)
+
+    ####################################################################################################################
+
+    return {
+        'nyx_gen': __version__,
+        'python': platform.python_version(),
+        'platform': sys.platform,
+        'size': {
+            'devices': n_devices,
+            'vectors': n_vectors,
+            'defs': n_defs,
+            'properties': n_devices * n_vectors * n_defs,
+        },
+        'repeat': max(1, repeat),
+        'results': results,
+    }
+
+########################################################################################################################
+
+def format_table(report: dict) -> str:
+
+    ####################################################################################################################
+
+    rows = [('Profile', 'Files', 'Bytes', 'Cold') + PHASES]
+
+    for result in report['results']:
+
+        if result['status'] == 'ok':
+
+            rows.append((result['profile'], str(result['files']), str(result['bytes']), f'{result["cold_ms"]:.1f}') + tuple(f'{result["median_ms"][phase]:.1f}' for phase in PHASES))
+
+        else:
+
+            rows.append((result['profile'], 'error: ' + result['error']) + ('', ) * (len(PHASES) + 2))
+
+    ####################################################################################################################
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+
+    lines = ['  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows]
+
+    lines.insert(1, '  '.join('-' * width for width in widths))
+
+    size = report['size']
+
+    lines.append(f'{size["devices"]} device(s) x {size["vectors"]} vector(s) x {size["defs"]} def(s), median of {report["repeat"]} run(s), times in ms')
+
+    ####################################################################################################################
+
+    return '\n'.join(lines)
+
+########################################################################################################################
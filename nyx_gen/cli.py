@@ -1,27 +1,192 @@
 # -*- coding: utf-8 -*-
 ########################################################################################################################
 
+import os
+import sys
 import json
+import cProfile
 import argparse
+import contextlib
 
 from datetime import datetime
 
 ########################################################################################################################
 
 from . import generators, __version__
+from .cmake import BUILD_PROFILES
+from .profiling import Profiler
 
 ########################################################################################################################
 
-def main():
-
-    ####################################################################################################################
+def _create_parser(description: str) -> argparse.ArgumentParser:
 
-    parser = argparse.ArgumentParser(
+    return argparse.ArgumentParser(
         formatter_class = argparse.RawTextHelpFormatter,
-        description = 'Generate an Nyx driver skeleton from a description file.',
+        description = description,
         epilog = f'Copyright 2024-{datetime.now().year} Nyx Gen — Jérôme ODIER, LPSC / CNRS — https://nyxlib.org/.\nNyx Gen is Free Software under GPL-3.0-or-later.'
     )
 
+########################################################################################################################
+
+def _main_serve(argv: list) -> int:
+
+    ####################################################################################################################
+
+    parser = _create_parser('Keep the generator warm and process generation jobs (JSON lines) from stdin or a Unix socket.')
+
+    parser.add_argument('--socket', type = str, default = None, help = 'Listen on this Unix socket instead of stdin/stdout.')
+
+    args = parser.parse_args(argv)
+
+    ####################################################################################################################
+
+    from .server import serve
+
+    return serve(args.socket)
+
+########################################################################################################################
+
+def _main_batch(argv: list) -> int:
+
+    ####################################################################################################################
+
+    parser = _create_parser('Generate the Nyx driver skeletons of many description files in one invocation.')
+
+    parser.add_argument('--override-project', action = 'store_true', help = 'Override the project output folders.')
+
+    parser.add_argument('--override-device', action = 'store_true', help = 'Override the device files.')
+
+    parser.add_argument('--override-main', action = 'store_true', help = 'Override main.')
+
+    parser.add_argument('--override-cmake', action = 'store_true', help = 'Override CMake.')
+
+    parser.add_argument('--build-profile', choices = BUILD_PROFILES, default = None, help = 'CMake build profile (default: `buildProfile` in the description, else Release).')
+
+    parser.add_argument('--march', type = str, default = None, help = 'Target architecture passed to -march (default: `march` in the description, else none).')
+
+    parser.add_argument('--incremental', action = 'store_true', help = 'Only write files whose content changed.')
+
+    parser.add_argument('--jobs', '-j', type = int, default = 1, help = 'Number of processes handling the description files concurrently.')
+
+    parser.add_argument('--output', type = str, default = '.', help = 'Skeleton output path (one folder per node).')
+
+    parser.add_argument('paths', type = str, nargs = '+', help = 'Driver description JSON files, directories or glob patterns')
+
+    args = parser.parse_args(argv)
+
+    ####################################################################################################################
+
+    from .batch import collect_descriptions, run_batch, format_summary
+
+    paths = collect_descriptions(args.paths)
+
+    if not paths:
+
+        print('No description file found')
+
+        return 1
+
+    ####################################################################################################################
+
+    options = {
+        'output': args.output,
+        'override_project': args.override_project,
+        'override_device': args.override_device,
+        'override_main': args.override_main,
+        'override_cmake': args.override_cmake,
+        'build_profile': args.build_profile,
+        'march': args.march,
+        'incremental': args.incremental,
+    }
+
+    results = run_batch(paths, options, args.jobs)
+
+    print(format_summary(results))
+
+    ####################################################################################################################
+
+    return 0 if all(result['status'] == 'ok' for result in results) else 1
+
+########################################################################################################################
+
+def _main_bench(argv: list) -> int:
+
+    ####################################################################################################################
+
+    parser = _create_parser('Benchmark every profile on synthetic node descriptions.')
+
+    parser.add_argument('--profiles', type = str, default = None, help = 'Comma-separated profiles to benchmark (default: all).')
+
+    parser.add_argument('--devices', type = int, default = 4, help = 'Number of devices.')
+
+    parser.add_argument('--vectors', type = int, default = 16, help = 'Number of vectors per device.')
+
+    parser.add_argument('--defs', type = int, default = 8, help = 'Number of properties per vector.')
+
+    parser.add_argument('--repeat', type = int, default = 3, help = 'Number of runs per profile.')
+
+    parser.add_argument('--format', choices = ['json', 'table'], default = 'json', help = 'Output format.')
+
+    parser.add_argument('--output', type = str, default = None, help = 'Write the results to this file instead of stdout.')
+
+    args = parser.parse_args(argv)
+
+    ####################################################################################################################
+
+    from .bench import run_bench, format_table
+
+    profiles = args.profiles.split(',') if args.profiles else list(generators.keys())
+
+    for profile in profiles:
+
+        if profile not in generators:
+
+            print(f'Invalid code generator: {profile}')
+
+            return 1
+
+    report = run_bench(profiles, args.devices, args.vectors, args.defs, args.repeat)
+
+    ####################################################################################################################
+
+    text = json.dumps(report, indent = 2) if args.format == 'json' else format_table(report)
+
+    if args.output:
+
+        with open(args.output, 'wt') as f:
+
+            f.write(f'{text}\n')
+
+    else:
+
+        print(text)
+
+    ####################################################################################################################
+
+    return 0 if all(result['status'] == 'ok' for result in report['results']) else 1
+
+########################################################################################################################
+
+def main():
+
+    ####################################################################################################################
+
+    argv = sys.argv[1:]
+
+    commands = {
+        'serve': _main_serve,
+        'batch': _main_batch,
+        'bench': _main_bench,
+    }
+
+    if argv and argv[0] in commands and not os.path.isfile(argv[0]): # a description file may be named after a command
+
+        return commands[argv[0]](argv[1:])
+
+    ####################################################################################################################
+
+    parser = _create_parser('Generate an Nyx driver skeleton from a description file.')
+
     parser.add_argument('--version', action = 'version', version = __version__, help = 'Print version information and exit.')
 
     parser.add_argument('--profiles', action = 'version', version = ', '.join(generators.keys()), help = 'Print profile names and exit.')
@@ -34,19 +199,43 @@ def main():
 
     parser.add_argument('--override-cmake', action = 'store_true', help = 'Override CMake.')
 
+    parser.add_argument('--build-profile', choices = BUILD_PROFILES, default = None, help = 'CMake build profile (default: `buildProfile` in the description, else Release).')
+
+    parser.add_argument('--march', type = str, default = None, help = 'Target architecture passed to -march (default: `march` in the description, else none).')
+
+    parser.add_argument('--incremental', action = 'store_true', help = 'Only write files whose content changed and report them.')
+
+    parser.add_argument('--jobs', '-j', type = int, default = 1, help = 'Number of processes rendering the outputs concurrently.')
+
+    parser.add_argument('--timings', action = 'store_true', help = 'Report wall time and peak memory per generator method and per file.')
+
+    parser.add_argument('--profile', type = str, default = None, metavar = 'FILE', help = 'Write a Chrome trace (FILE ending with .json) or cProfile statistics (any other name).')
+
     parser.add_argument('--output', type = str, default = '.', help = 'Skeleton output path.')
 
-    parser.add_argument('descr', type = str, help = 'Driver description JSON file')
+    parser.add_argument('descr', type = str, help = 'Driver description JSON file (or \'serve\' / \'batch\' / \'bench\', see their --help)')
+
+    args = parser.parse_args(argv)
 
-    args = parser.parse_args()
+    ####################################################################################################################
+
+    chrome_trace = args.profile is not None and args.profile.lower().endswith('.json')
+
+    profiler = Profiler(trace_memory = args.timings) if args.timings or chrome_trace else None
+
+    if profiler is not None:
+
+        profiler.start()
 
     ####################################################################################################################
 
     try:
 
-        with open(args.descr, 'rt') as f:
+        with profiler.section('load', 'phase') if profiler is not None else contextlib.nullcontext():
+
+            with open(args.descr, 'rt') as f:
 
-            descr = json.load(f)
+                descr = json.load(f)
 
     except IOError:
 
@@ -60,11 +249,47 @@ def main():
 
         try:
 
-            generator_instance = generators[descr['mode']](args, descr)
+            with profiler.section('import', 'phase') if profiler is not None else contextlib.nullcontext():
+
+                generator_class = generators[descr['mode']]
+
+            with profiler.section('init', 'phase') if profiler is not None else contextlib.nullcontext():
+
+                generator = generator_class(args, descr)
+
+            generator.profiler = profiler
+
+            if args.profile is not None and not chrome_trace:
+
+                cprofile = cProfile.Profile()
+
+                cprofile.runcall(generator.run)
+
+                cprofile.dump_stats(args.profile)
+
+            else:
+
+                generator.run()
+
+            if profiler is not None:
+
+                profiler.stop()
+
+                if args.timings:
+
+                    print(profiler.format_table())
+
+                if chrome_trace:
+
+                    profiler.write_chrome_trace(args.profile)
+
+            if args.incremental:
+
+                for filename in generator.written_files:
 
-            generator_instance.create_directories()
+                    print(f'Updated: {filename}')
 
-            generator_instance.generate()
+                print(f'{len(generator.written_files)} file(s) updated, {len(generator.unchanged_files)} unchanged')
 
             return 0
 
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+BUILD_PROFILES = ('Debug', 'Release', 'RelWithDebInfo', 'LTO', 'PGO-instrument', 'PGO-use')
+
+DEFAULT_BUILD_PROFILE = 'Release'
+
+########################################################################################################################
+
+CMAKE_BUILD_TEMPLATE = '''
+########################################################################################################################
+# BUILD PROFILE                                                                                                        #
+########################################################################################################################
+
+set(NYX_BUILD_PROFILES {{ build_profiles|join(' ') }})
+
+set(NYX_BUILD_PROFILE "{{ build_profile }}" CACHE STRING "Build profile: {{ build_profiles|join(', ') }}")
+
+set_property(CACHE NYX_BUILD_PROFILE PROPERTY STRINGS ${NYX_BUILD_PROFILES})
+
+set(NYX_MARCH "{{ march }}" CACHE STRING "Target architecture passed to -march (empty for the compiler default)")
+
+set(NYX_PGO_DIR "${CMAKE_BINARY_DIR}/pgo" CACHE PATH "Directory of the PGO profile data")
+
+if(NOT NYX_BUILD_PROFILE IN_LIST NYX_BUILD_PROFILES)
+    message(FATAL_ERROR "Invalid build profile `${NYX_BUILD_PROFILE}` (expected one of {{ build_profiles|join(', ') }})")
+endif()
+
+########################################################################################################################
+
+if(NOT CMAKE_BUILD_TYPE AND NOT CMAKE_CONFIGURATION_TYPES)
+
+    if(NYX_BUILD_PROFILE MATCHES "^(Debug|RelWithDebInfo)$")
+        set(CMAKE_BUILD_TYPE ${NYX_BUILD_PROFILE})
+    else()
+        set(CMAKE_BUILD_TYPE Release)
+    endif()
+
+endif()
+
+message(STATUS "Build profile: ${NYX_BUILD_PROFILE} (${CMAKE_BUILD_TYPE})")
+
+########################################################################################################################
+
+if(NYX_MARCH)
+    add_compile_options(-march=${NYX_MARCH})
+endif()
+
+########################################################################################################################
+
+if(NYX_BUILD_PROFILE MATCHES "^(LTO|PGO-use)$")
+
+    include(CheckIPOSupported)
+
+    check_ipo_supported(RESULT NYX_IPO_SUPPORTED OUTPUT NYX_IPO_ERROR LANGUAGES {{ lang }})
+
+    if(NYX_IPO_SUPPORTED)
+        set(CMAKE_INTERPROCEDURAL_OPTIMIZATION ON)
+    else()
+        message(WARNING "Interprocedural optimization not supported: ${NYX_IPO_ERROR}")
+    endif()
+
+endif()
+
+########################################################################################################################
+
+if(NYX_BUILD_PROFILE STREQUAL "PGO-instrument")
+    set(NYX_PGO_FLAGS "-fprofile-generate=${NYX_PGO_DIR} -fprofile-update=atomic")
+elseif(NYX_BUILD_PROFILE STREQUAL "PGO-use")
+    set(NYX_PGO_FLAGS "-fprofile-use=${NYX_PGO_DIR}")
+endif()
+
+if(NYX_PGO_FLAGS)
+    string(APPEND CMAKE_{{ lang }}_FLAGS " ${NYX_PGO_FLAGS}")
+endif()
+'''[1:]
+
+########################################################################################################################
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import re
+import typing
+import warnings
+import functools
+
+########################################################################################################################
+
+NYX_NUMBER_INT    = 0
+NYX_NUMBER_UINT   = 1
+NYX_NUMBER_LONG   = 2
+NYX_NUMBER_ULONG  = 3
+NYX_NUMBER_DOUBLE = 4
+
+########################################################################################################################
+
+FORMAT_RE = re.compile(r'%(?P<flags>[-+ #0]*)(?P<width>[0-9]+|\*)?(?:\.(?P<precision>[0-9]*|\*))?(?P<length>hh|h|ll|l|L|z|j|t)?(?P<type>[a-zA-Z%])')
+
+########################################################################################################################
+
+SEXAGESIMAL_PRECISIONS = ('3', '5', '6', '8', '9')
+
+LONG_LONG_LENGTHS = ('ll', 'j')
+
+########################################################################################################################
+
+class NumberFormat(typing.NamedTuple):
+
+    subtype: int
+    ctype: str
+    suffix: str
+    py_code: str
+    sexagesimal: bool
+    length: typing.Optional[str]
+
+########################################################################################################################
+
+_NUMBER_FORMATS = {
+    NYX_NUMBER_INT: ('int', 'int', 'i'),
+    NYX_NUMBER_UINT: ('unsigned int', 'uint', 'i'),
+    NYX_NUMBER_LONG: ('long', 'long', 'l'),
+    NYX_NUMBER_ULONG: ('unsigned long', 'ulong', 'l'),
+    NYX_NUMBER_DOUBLE: ('double', 'double', 'd'),
+}
+
+########################################################################################################################
+
+@functools.lru_cache(maxsize = 1024)
+def classify_format(fmt: str) -> NumberFormat:
+
+    ####################################################################################################################
+
+    specs = [m for m in FORMAT_RE.finditer(fmt) if m.group('type') != '%']
+
+    if not specs:
+
+        # the former parser read `%%d` as `%d`: keep accepting it, `%%` being a literal percent sign for printf
+
+        specs = [FORMAT_RE.match(fmt, m.start() + 1) for m in FORMAT_RE.finditer(fmt) if m.group('type') == '%']
+
+        specs = [m for m in specs if m is not None and m.group('type') != '%']
+
+        if not specs:
+
+            raise ValueError(f'Invalid format: {fmt}')
+
+        warnings.warn(f'No conversion in format (`%%` is a literal percent sign), `{specs[0].group(0)}` assumed: {fmt}', stacklevel = 2)
+
+    if len(specs) > 1:
+
+        warnings.warn(f'Multiple conversions in format, only the first one is used: {fmt}', stacklevel = 2)
+
+    ####################################################################################################################
+
+    m = specs[0]
+
+    l = m.group('length')
+    t = m.group('type')
+    p = m.group('precision')
+
+    if m.group('width') == '*' or p == '*':
+
+        warnings.warn(f'Variable width or precision ignored: {fmt}', stacklevel = 2)
+
+        p = None
+
+    ####################################################################################################################
+
+    if t in ('d', 'i'):
+
+        if l in (None, 'hh', 'h'):
+            subtype = NYX_NUMBER_INT
+        elif l in ('l', 'll', 'z', 'j', 't'):
+            subtype = NYX_NUMBER_LONG
+        else:
+            raise ValueError(f'Invalid length modifier `{l}` for %{t}: {fmt}')
+
+    elif t in ('u', 'o', 'x', 'X'):
+
+        if l in (None, 'hh', 'h'):
+            subtype = NYX_NUMBER_UINT
+        elif l in ('l', 'll', 'z', 'j', 't'):
+            subtype = NYX_NUMBER_ULONG
+        else:
+            raise ValueError(f'Invalid length modifier `{l}` for %{t}: {fmt}')
+
+    elif t in ('f', 'F', 'e', 'E', 'g', 'G', 'a', 'A'):
+
+        if l in (None, 'l'):
+            subtype = NYX_NUMBER_DOUBLE
+        else:
+            raise ValueError(f'Invalid length modifier `{l}` for %{t}: {fmt}')
+
+    elif t == 'm':
+
+        if l is not None:
+            raise ValueError(f'Invalid length modifier `{l}` for %m: {fmt}')
+        if p is not None and p not in SEXAGESIMAL_PRECISIONS:
+            warnings.warn(f'Unsupported sexagesimal precision `.{p}` (expected one of {", ".join(SEXAGESIMAL_PRECISIONS)}): {fmt}', stacklevel = 2)
+
+        subtype = NYX_NUMBER_DOUBLE
+
+    else:
+
+        raise ValueError(f'Unsupported type specifier: %{t}')
+
+    ####################################################################################################################
+
+    return NumberFormat(subtype, *_NUMBER_FORMATS[subtype], t == 'm', l)
+
+########################################################################################################################
+
+def get_number_type(fmt: str) -> int:
+
+    return classify_format(fmt).subtype
+
+########################################################################################################################
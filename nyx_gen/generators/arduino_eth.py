@@ -16,6 +16,10 @@ class ArduinoEthGenerator(PosixCGenerator):
 
     ####################################################################################################################
 
+    _long_bits = 32
+
+    ####################################################################################################################
+
     def _generate_cmake(self) -> None:
 
         platform, board, ram = self._descr['board'].split('|')
@@ -50,14 +54,13 @@ framework = arduino
 
         if self._override_cmake or not os.path.isfile(filename):
 
-            with open(filename, 'wt', encoding = 'utf-8') as f:
-
-                f.write(self.render(
-                    template,
-                    platform = platform,
-                    board = board,
-                    ram = ram
-                ))
+            self.render_file(
+                filename,
+                template,
+                platform = platform,
+                board = board,
+                ram = ram
+            )
 
     ####################################################################################################################
 
@@ -74,11 +77,10 @@ framework = arduino
 
         filename = os.path.join(self._driver_path, 'src', f'credentials.{self._head_ext}')
 
-        with open(filename, 'wt', encoding = 'utf-8') as f:
-
-            f.write(self.render(
-                template
-            ))
+        self.render_file(
+            filename,
+            template
+        )
 
         ################################################################################################################
         # main.c                                                                                                       #
@@ -94,11 +96,10 @@ framework = arduino
 
         if self._override_main or not os.path.isfile(filename):
 
-            with open(filename, 'wt', encoding = 'utf-8') as f:
-
-                f.write(self.render(
-                    template,
-                    devices = self._devices
-                ))
+            self.render_file(
+                filename,
+                template,
+                devices = self._devices
+            )
 
 ########################################################################################################################
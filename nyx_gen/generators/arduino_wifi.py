@@ -16,6 +16,10 @@ class ArduinoWifiGenerator(PosixCGenerator):
 
     ####################################################################################################################
 
+    _long_bits = 32
+
+    ####################################################################################################################
+
     def _generate_cmake(self) -> None:
 
         platform, board, ram = self._descr['board'].split('|')
@@ -50,14 +54,13 @@ framework = arduino
 
         if self._override_cmake or not os.path.isfile(filename):
 
-            with open(filename, 'wt', encoding = 'utf-8') as f:
-
-                f.write(self.render(
-                    template,
-                    platform = platform,
-                    board = board,
-                    ram = ram
-                ))
+            self.render_file(
+                filename,
+                template,
+                platform = platform,
+                board = board,
+                ram = ram
+            )
 
     ####################################################################################################################
 
@@ -76,11 +79,10 @@ framework = arduino
 
         filename = os.path.join(self._driver_path, 'src', f'credentials.{self._head_ext}')
 
-        with open(filename, 'wt', encoding = 'utf-8') as f:
-
-            f.write(self.render(
-                template
-            ))
+        self.render_file(
+            filename,
+            template
+        )
 
         ################################################################################################################
         # main.c                                                                                                       #
@@ -155,7 +157,7 @@ void setup()
     static nyx_dict_t *vector_list[] = {
 {%- for d in devices -%}
 {%-   for v in d.vectors %}
-        vector_{{ d.name|lower }}_{{ v.name|lower }},
+        vector_{{ v.symbol }},
 {%-   endfor -%}
 {%- endfor %}
         {{ null }},
@@ -200,11 +202,10 @@ void loop()
 
         if self._override_main or not os.path.isfile(filename):
 
-            with open(filename, 'wt', encoding = 'utf-8') as f:
-
-                f.write(self.render(
-                    template,
-                    devices = self._devices
-                ))
+            self.render_file(
+                filename,
+                template,
+                devices = self._devices
+            )
 
 ########################################################################################################################
@@ -7,10 +7,29 @@ import os
 
 from .posix_c import PosixCGenerator
 
+from ..lookup import NSS_HASH_SEED, nyx_hash
 from ..abstract_generator import generator_config
 
 ########################################################################################################################
 
+SINK_FIELDS = ('samp_rate', 'frequency', 'samples')
+
+UPDATE_QUEUE_SIZE = 256
+
+UPDATE_LATENCY = 10
+
+########################################################################################################################
+
+BUFFER_LIMITS = {
+    'int': ('int', 'int', 'INT_MIN', 'INT_MAX'),
+    'uint': ('uint', 'unsigned int', None, 'UINT_MAX'),
+    'long': ('long', 'long', 'LONG_MIN', 'LONG_MAX'),
+    'ulong': ('ulong', 'unsigned long', None, 'ULONG_MAX'),
+    'double': ('double', 'double', None, None),
+}
+
+########################################################################################################################
+
 @generator_config(name = 'gnuradio', null = 'NULL', src_ext = 'c', head_ext = 'h')
 class GNURadioGenerator(PosixCGenerator):
 
@@ -37,6 +56,26 @@ class GNURadioGenerator(PosixCGenerator):
 
     def _generate_header(self) -> None:
 
+        template_declarations = '''
+{%- for v in d.vectors -%}
+{%-   for df in v.defs %}
+extern nyx_dict_t *vector_{{ df.symbol }};
+{%-   endfor %}
+extern nyx_dict_t *vector_{{ v.symbol }};
+{%  endfor -%}
+'''[1:]
+
+        template_callbacks = '''
+{%- for v in d.vectors -%}
+{%-   for df in v.defs if df.callback %}
+extern PyObject *vector_{{ df.symbol }}_python_callback;
+{%-     if df.ctype %}
+void dispatch_{{ df.symbol }}({{ df.ctype }} new_value);
+{%-     endif %}
+{%-   endfor -%}
+{%- endfor -%}
+'''[1:]
+
         template = '''
 /* !!! AUTOGENERATED FILE !!! */
 /*--------------------------------------------------------------------------------------------------------------------*/
@@ -48,34 +87,36 @@ class GNURadioGenerator(PosixCGenerator):
 
 #include <Python.h>
 #include <pthread.h>
+{%- if descr.lookupTables|default(false) %}
+#include <string.h>
+{%- endif %}
 #include <nyx_node.h>
 
 /*--------------------------------------------------------------------------------------------------------------------*/
-{%  for d in devices -%}
-{%-   for v in d.vectors -%}
-{%-     for df in v.defs %}
-extern nyx_dict_t *vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }};
-{%-     endfor %}
-extern nyx_dict_t *vector_{{ d.name|lower }}_{{ v.name|lower }};
-{%    endfor -%}
+{%  for fragment in declarations -%}
+{{ fragment }}
 {%- endfor %}
 
 /*--------------------------------------------------------------------------------------------------------------------*/
-{%  for d in devices -%}
-{%-   for v in d.vectors -%}
-{%-     for df in v.defs if df.callback %}
-extern PyObject *vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}_python_callback;
-{%-     endfor -%}
-{%-   endfor -%}
+{%  for fragment in callbacks -%}
+{{ fragment }}
 {%- endfor %}
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 {%  for d in devices %}
-void device_{{ d.name|lower }}_initialize();
+void device_{{ d.ident }}_initialize();
 {%- endfor %}
 {%  for d in devices %}
-void device_{{ d.name|lower }}_finalize();
+void device_{{ d.ident }}_finalize();
 {%- endfor %}
+{%- if descr.lookupTables|default(false) %}
+{%  for d in devices %}
+nyx_dict_t *device_{{ d.ident }}_find_vector(STR_t name);
+{%- endfor %}
+{%  for d in devices %}
+nyx_dict_t *device_{{ d.ident }}_find_prop(STR_t vector, STR_t name);
+{%- endfor %}
+{%- endif %}
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 
@@ -96,12 +137,13 @@ void nyx_device_finalize(nyx_node_t *node);
 
         filename = os.path.join(self._driver_path, 'src', 'autogen', f'glue.{self._head_ext}')
 
-        with open(filename, 'wt', encoding = 'utf-8') as f:
-
-            f.write(self.render(
-                template,
-                devices = self._devices
-            ))
+        self.render_file(
+            filename,
+            template,
+            devices = self._devices,
+            declarations = [self.render_fragment(template_declarations, d = device) for device in self._devices],
+            callbacks = [self.render_fragment(template_callbacks, d = device) for device in self._devices]
+        )
 
     ####################################################################################################################
 
@@ -110,7 +152,7 @@ void nyx_device_finalize(nyx_node_t *node);
         template = '''
 ########################################################################################################################
 
-cmake_minimum_required(VERSION 3.5)
+cmake_minimum_required(VERSION 3.9)
 
 ########################################################################################################################
 
@@ -120,8 +162,9 @@ set(CMAKE_C_STANDARD 99)
 
 set(Python3_EXECUTABLE /usr/bin/python3)
 
-add_compile_options(-DPY_SSIZE_T_CLEAN -Wall -Wno-unknown-pragmas -Wno-unused-function -O3)
+add_compile_options(-DPY_SSIZE_T_CLEAN -Wall -Wno-unknown-pragmas -Wno-unused-function)
 
+{{ build }}
 ########################################################################################################################
 
 find_package(Threads REQUIRED)
@@ -131,7 +174,9 @@ find_package(NyxNode REQUIRED)
 ########################################################################################################################
 
 set(SOURCE_FILES
-    {{ cmake_files|join('\\n    ') }}
+{%- for cmake_file in cmake_files %}
+    {{ cmake_file }}
+{%- endfor %}
     ./src/autogen/glue.{{ src_ext }}
     ./src/main.{{ src_ext }}
 )
@@ -163,12 +208,12 @@ install(FILES ./grc/nyx_{{ descr.nodeName|lower }}_sink.block.yml DESTINATION ${
 
         if self._override_cmake or not os.path.isfile(filename):
 
-            with open(filename, 'wt', encoding = 'utf-8') as f:
-
-                f.write(self.render(
-                    template,
-                    cmake_files = [os.path.join('.', 'src', f'device_{device["name"].lower()}.{self._src_ext}') for device in self._devices]
-                ))
+            self.render_file(
+                filename,
+                template,
+                cmake_files = [os.path.join('.', 'src', f'device_{device.ident}.{self._src_ext}') for device in self._devices],
+                build = self._render_cmake_build('C')
+            )
 
     ####################################################################################################################
 
@@ -181,13 +226,13 @@ install(FILES ./grc/nyx_{{ descr.nodeName|lower }}_sink.block.yml DESTINATION ${
 
         filename = os.path.join(self._driver_path, 'src', f'credentials.{self._head_ext}')
 
-        with open(filename, 'wt', encoding='utf-8') as f:
-
-            f.write(self.render(template))
+        self.render_file(filename, template)
 
         template = r'''
 /*--------------------------------------------------------------------------------------------------------------------*/
 
+#include <time.h>
+#include <stdlib.h>
 #include <string.h>
 
 #include "autogen/glue.{{ head_ext }}"
@@ -215,337 +260,1425 @@ static pthread_t worker_thread = 0;
 
 /*--*/ volatile bool worker_alive = false;
 
+/*--------------------------------------------------------------------------------------------------------------------*/
+/* THREAD SAFETY                                                                                                      */
+/*--------------------------------------------------------------------------------------------------------------------*/
+/*                                                                                                                    */
+/* The Python entry points release the GIL around their nyx-node calls, so that GNU Radio threads keep running while  */
+/* the node performs network I/O. The strings and buffers they pass are borrowed from the argument tuple, which the   */
+/* interpreter keeps alive until the entry point returns.                                                             */
+/*                                                                                                                    */
+/* The set_*_value setters do not call nyx-node: they push the new value into the pending update ring, which          */
+/* worker_routine drains between two nyx_node_poll() calls. The producers are the Python threads, serialized by the   */
+/* GIL, and the consumer is worker_routine, so the ring only needs acquire/release ordering on its two indices.       */
+/*                                                                                                                    */
+/* nyx_node_poll() cannot be woken up. After a drain that applied some updates, worker_routine polls for at most      */
+/* PENDING_LATENCY milliseconds (POLL_MIN_TIMEOUT with the adaptive strategy), so a burst of updates is published     */
+/* with that latency. Otherwise it keeps polling with the node timeout, so an idle node does not wake up more often:  */
+/* the first value queued after an idle period, and a setter that finds the ring full, may wait up to the node        */
+/* timeout.                                                                                                           */
+/*                                                                                                                    */
+/* node_lock only serializes the nyx-node calls issued by Python threads among themselves. It is always taken after   */
+/* the GIL is released and released before the GIL is reacquired. It does not exclude worker_routine: as in earlier   */
+/* versions of this module, these calls run concurrently with nyx_node_poll(), and holding a lock across the poll     */
+/* would delay every publication by up to the poll timeout. worker_routine never takes it, and the device callbacks   */
+/* it runs from nyx_node_poll() only acquire the GIL (PyGILState_Ensure), so no thread can wait for a lock held by    */
+/* another one.                                                                                                       */
+/*                                                                                                                    */
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-static void *worker_routine(void *arg)
+static pthread_mutex_t node_lock = PTHREAD_MUTEX_INITIALIZER;
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+{%- if pending or dispatch %}
+/* PROPERTY VALUES                                                                                                    */
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+typedef union
 {
-    /*----------------------------------------------------------------------------------------------------------------*/
+    int _int;
+    unsigned int _uint;
+    long _long;
+    unsigned long _ulong;
+    double _double;
 
-    nyx_set_log_level(NYX_LOG_LEVEL_INFO);
+} prop_value_t;
 
-    /*----------------------------------------------------------------------------------------------------------------*/
+/*--------------------------------------------------------------------------------------------------------------------*/
 
-    nyx_memory_initialize();
+static str_t value_string_dup(STR_t s)
+{
+    size_t size = strlen(s) + 1;
 
-    /*----------------------------------------------------------------------------------------------------------------*/
+    str_t result = malloc(size);
 
-    nyx_glue_initialize();
+    if(result != NULL)
+    {
+        memcpy(result, s, size);
+    }
 
-    /*----------------------------------------------------------------------------------------------------------------*/
+    return result;
+}
 
-    nyx_dict_t *vector_list[] = {
-{%- for d in devices -%}
-{%-   for v in d.vectors %}
-        vector_{{ d.name|lower }}_{{ v.name|lower }},
-{%-   endfor -%}
+/*--------------------------------------------------------------------------------------------------------------------*/
+{%- endif %}
+{%- if adaptive %}
+/* ADAPTIVE POLL                                                                                                      */
+/*--------------------------------------------------------------------------------------------------------------------*/
+/*                                                                                                                    */
+/* nyx_node_poll() returns before its timeout when the node handled some I/O. In that case the next poll uses the     */
+/* minimum timeout, otherwise the timeout doubles up to the maximum timeout. The adaptive strategy mostly lowers the  */
+/* latency of a busy node: it only saves wake-ups on an idle node when the maximum exceeds the node timeout.          */
+/*                                                                                                                    */
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+#define POLL_MIN_TIMEOUT {{ poll_timeouts[0] }}
+{%- if poll_timeouts[1] %}
+
+#define POLL_MAX_TIMEOUT {{ poll_timeouts[1] }}
+{%- endif %}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static uint64_t poll_clock_us(void)
+{
+    struct timespec ts;
+
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+
+    return (uint64_t) ts.tv_sec * 1000000U + (uint64_t) ts.tv_nsec / 1000U;
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static int poll_adaptive(nyx_node_t *node, int poll_timeout, int max_timeout, bool active)
+{
+    uint64_t poll_start = poll_clock_us();
+
+    nyx_node_poll(node, poll_timeout);
+
+    if(active || poll_clock_us() - poll_start < (uint64_t) poll_timeout * 1000U)
+    {
+        return POLL_MIN_TIMEOUT < max_timeout ? POLL_MIN_TIMEOUT : max_timeout;
+    }
+    else
+    {
+        return 2 * poll_timeout < max_timeout ? 2 * poll_timeout : max_timeout;
+    }
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+{%- endif %}
+{%- if pending %}
+/* PENDING UPDATES                                                                                                    */
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+#define PENDING_CAPACITY {{ pending_capacity }}
+
+#define PENDING_LATENCY {{ pending_latency }} /* ms */
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+typedef enum
+{
+{%- for v, df in pending %}
+    PENDING_{{ df.symbol|upper }},
 {%- endfor %}
-        {{ null }},
-    };
+    PENDING_COUNT,
 
+} pending_prop_t;
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+typedef struct
+{
+    pending_prop_t prop;
+
+    prop_value_t value;
+
+    str_t text; /* owned copy, text properties only */
+
+} pending_update_t;
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static pending_update_t pending_ring[PENDING_CAPACITY];
+
+static size_t pending_head = 0; /* written by the producers, under the GIL */
+static size_t pending_tail = 0; /* written by worker_routine */
+
+static pthread_mutex_t pending_lock = PTHREAD_MUTEX_INITIALIZER;
+
+static pthread_cond_t pending_cond = PTHREAD_COND_INITIALIZER; /* signaled after each drain */
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static bool pending_apply(void)
+{
+    size_t tail = __atomic_load_n(&pending_tail, __ATOMIC_RELAXED);
+    size_t head = __atomic_load_n(&pending_head, __ATOMIC_ACQUIRE);
+
+    if(tail == head)
+    {
+        return false;
+    }
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+    /* COALESCE, LATEST VALUE WINS                                                                                    */
     /*----------------------------------------------------------------------------------------------------------------*/
 
-    node = nyx_node_initialize(
-        "{{ descr.nodeName }}",
-        vector_list,
-        indi_url,
-        mqtt_url,
-        nss_url,
-        mqtt_username,
-        mqtt_password,
-        {{ null }},
-        3000,
-        true
-    );
+    pending_update_t *latest[PENDING_COUNT] = {NULL};
 
-    nyx_device_initialize(node);
-    for(worker_alive = true; worker_alive;) nyx_node_poll(node, {{ descr.nodeTimeout }});
-    nyx_device_finalize(node);
+    for(size_t i = tail; i != head; i++)
+    {
+        pending_update_t *update = &pending_ring[i & (PENDING_CAPACITY - 1)];
 
-    nyx_node_finalize(node, true);
+        if(latest[update->prop] != NULL)
+        {
+            free(latest[update->prop]->text);
+        }
+
+        latest[update->prop] = update;
+    }
 
+    /*----------------------------------------------------------------------------------------------------------------*/
+    /* APPLY                                                                                                          */
     /*----------------------------------------------------------------------------------------------------------------*/
 
-    nyx_memory_finalize();
+    for(int prop = 0; prop < PENDING_COUNT; prop++)
+    {
+        pending_update_t *update = latest[prop];
+
+        if(update != NULL)
+        {
+            switch(prop)
+            {
+{%- for v, df in pending %}
+                case PENDING_{{ df.symbol|upper }}:
+{%-   if v.type == 'number' %}
+                    nyx_number_prop_set_{{ df.number.suffix }}((nyx_dict_t *) vector_{{ df.symbol }}, update->value._{{ df.number.suffix }});
+{%-   elif v.type == 'text' %}
+                    nyx_text_prop_set((nyx_dict_t *) vector_{{ df.symbol }}, update->text);
+{%-   elif v.type == 'switch' %}
+                    nyx_switch_prop_set((nyx_dict_t *) vector_{{ df.symbol }}, update->value._int);
+{%-   elif v.type == 'light' %}
+                    nyx_light_prop_set((nyx_dict_t *) vector_{{ df.symbol }}, update->value._int);
+{%-   endif %}
+                    break;
+{%- endfor %}
+            }
+
+            free(update->text);
+        }
+    }
 
     /*----------------------------------------------------------------------------------------------------------------*/
 
-    return NULL;
+    __atomic_store_n(&pending_tail, head, __ATOMIC_RELEASE);
+
+    pthread_mutex_lock(&pending_lock);
+
+    pthread_cond_broadcast(&pending_cond);
+
+    pthread_mutex_unlock(&pending_lock);
+
+    return true;
 }
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-static PyObject *worker_start(PyObject *self, PyObject *args)
+static bool pending_push(const pending_update_t *update)
 {
-    if(worker_thread == 0)
+    /* must be called with the GIL held */
+
+    for(;;)
     {
-        /*------------------------------------------------------------------------------------------------------------*/
+        size_t head = __atomic_load_n(&pending_head, __ATOMIC_RELAXED);
 
-        STR_t py_indi_url      = NULL;
-        STR_t py_mqtt_url      = NULL;
-        STR_t py_nss_url       = NULL;
-        STR_t py_mqtt_username = NULL;
-        STR_t py_mqtt_password = NULL;
+        if(head - __atomic_load_n(&pending_tail, __ATOMIC_ACQUIRE) < PENDING_CAPACITY)
+        {
+            pending_ring[head & (PENDING_CAPACITY - 1)] = *update;
 
-        if(!PyArg_ParseTuple(args, "|zzzzz",
-            &py_indi_url,
-            &py_mqtt_url,
-            &py_nss_url,
-            &py_mqtt_username,
-            &py_mqtt_password
-        )) {
-            return NULL;
+            __atomic_store_n(&pending_head, head + 1, __ATOMIC_RELEASE);
+
+            return true;
         }
 
-        strcpy(indi_url,      py_indi_url      ? py_indi_url      : "");
-        strcpy(mqtt_url,      py_mqtt_url      ? py_mqtt_url      : "");
-        strcpy(nss_url,       py_nss_url       ? py_nss_url       : "");
-        strcpy(mqtt_username, py_mqtt_username ? py_mqtt_username : "");
-        strcpy(mqtt_password, py_mqtt_password ? py_mqtt_password : "");
+        if(!worker_alive)
+        {
+            return false;
+        }
+
+        /* the ring is full */
+
+        if(pthread_equal(pthread_self(), worker_thread))
+        {
+            pending_apply(); /* called from a BLOB callback, worker_routine is the consumer */
+
+            continue;
+        }
+
+        /* any other thread, dispatch_routine included, waits for the next drain: worker_routine never waits for */
+        /* them while it polls, and they do not hold the GIL meanwhile                                            */
+
+        Py_BEGIN_ALLOW_THREADS
+
+        pthread_mutex_lock(&pending_lock);
+
+        while(worker_alive && head - __atomic_load_n(&pending_tail, __ATOMIC_ACQUIRE) >= PENDING_CAPACITY)
+        {
+            pthread_cond_wait(&pending_cond, &pending_lock);
+        }
+
+        pthread_mutex_unlock(&pending_lock);
+
+        Py_END_ALLOW_THREADS
+    }
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+{%- endif %}
+{%- if dispatch %}
+/* CALLBACK DISPATCH                                                                                                  */
+/*--------------------------------------------------------------------------------------------------------------------*/
+/*                                                                                                                    */
+/* The device callbacks run on worker_routine and only store the new value with dispatch_*(). dispatch_routine then   */
+/* delivers the pending values to the Python callbacks in batches, under a single GIL acquisition, keeping only the   */
+/* latest value of each property. A slow Python callback therefore never stalls nyx_node_poll().                      */
+/*                                                                                                                    */
+/*--------------------------------------------------------------------------------------------------------------------*/
+{%- if dispatch_interval %}
+
+#define DISPATCH_INTERVAL_NS {{ dispatch_interval }}L /* {{ descr.callbackRate }} batch(es) per second at most */
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+{%- endif %}
+
+typedef enum
+{
+{%- for v, df in dispatch %}
+    DISPATCH_{{ df.symbol|upper }},
+{%- endfor %}
+    DISPATCH_COUNT,
+
+} dispatch_prop_t;
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+typedef struct
+{
+    bool dirty;
+
+    prop_value_t value;
+
+    str_t text; /* owned copy, text properties only */
+
+} dispatch_slot_t;
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static pthread_t dispatch_thread;
+
+static pthread_mutex_t dispatch_lock = PTHREAD_MUTEX_INITIALIZER;
+
+static pthread_cond_t dispatch_cond = PTHREAD_COND_INITIALIZER;
+
+static dispatch_slot_t dispatch_slots[DISPATCH_COUNT];
+
+static bool dispatch_dirty = false;
+
+static bool dispatch_alive = false;
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static void dispatch_post(dispatch_prop_t prop, prop_value_t value, STR_t text)
+{
+    pthread_mutex_lock(&dispatch_lock);
+
+    dispatch_slot_t *slot = &dispatch_slots[prop];
+
+    free(slot->text);
+
+    slot->dirty = true;
+    slot->value = value;
+    slot->text = text != NULL ? value_string_dup(text) : NULL;
+
+    dispatch_dirty = true;
+
+    pthread_cond_signal(&dispatch_cond);
+
+    pthread_mutex_unlock(&dispatch_lock);
+}
+{%- for v, df in dispatch %}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+void dispatch_{{ df.symbol }}({{ df.ctype }} new_value)
+{
+{%-   if v.type == 'text' %}
+    dispatch_post(DISPATCH_{{ df.symbol|upper }}, (prop_value_t) {._int = 0}, new_value);
+{%-   else %}
+    dispatch_post(DISPATCH_{{ df.symbol|upper }}, (prop_value_t) {._{{ df.callback_field }} = new_value}, NULL);
+{%-   endif %}
+}
+{%- endfor %}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static void dispatch_deliver(dispatch_slot_t batch[])
+{
+    PyGILState_STATE gstate = PyGILState_Ensure();
+
+    for(int prop = 0; prop < DISPATCH_COUNT; prop++)
+    {
+        if(batch[prop].dirty)
+        {
+            PyObject *callback = NULL;
+            PyObject *args = NULL;
+
+            switch(prop)
+            {
+{%- for v, df in dispatch %}
+                case DISPATCH_{{ df.symbol|upper }}:
+                    callback = vector_{{ df.symbol }}_python_callback;
+{%-   if v.type == 'text' %}
+                    args = Py_BuildValue("({{ df.py_code }})", batch[prop].text);
+{%-   else %}
+                    args = Py_BuildValue("({{ df.py_code }})", batch[prop].value._{{ df.callback_field }});
+{%-   endif %}
+                    break;
+{%- endfor %}
+            }
+
+            if(args == NULL)
+            {
+                PyErr_Print();
+            }
+            else
+            {
+                if(callback != NULL)
+                {
+                    PyObject *result = PyObject_CallObject(callback, args);
+
+                    if(result == NULL) {
+                        PyErr_Print();
+                    } else {
+                        Py_DECREF(result);
+                    }
+                }
+
+                Py_DECREF(args);
+            }
+
+            free(batch[prop].text);
+        }
+    }
+
+    PyGILState_Release(gstate);
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static void *dispatch_routine(void *arg)
+{
+    dispatch_slot_t batch[DISPATCH_COUNT];
+
+    pthread_mutex_lock(&dispatch_lock);
+
+    while(dispatch_alive)
+    {
+        if(!dispatch_dirty)
+        {
+            pthread_cond_wait(&dispatch_cond, &dispatch_lock);
+
+            continue;
+        }
+
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        memcpy(batch, dispatch_slots, sizeof(batch));
+
+        memset(dispatch_slots, 0, sizeof(dispatch_slots));
+
+        dispatch_dirty = false;
+
+        pthread_mutex_unlock(&dispatch_lock);
+
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        dispatch_deliver(batch);
+{%- if dispatch_interval %}
+
+        struct timespec interval = {DISPATCH_INTERVAL_NS / 1000000000L, DISPATCH_INTERVAL_NS % 1000000000L};
+
+        nanosleep(&interval, NULL);
+{%- endif %}
+
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        pthread_mutex_lock(&dispatch_lock);
+    }
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    for(int prop = 0; prop < DISPATCH_COUNT; prop++)
+    {
+        free(dispatch_slots[prop].text);
+    }
+
+    memset(dispatch_slots, 0, sizeof(dispatch_slots));
+
+    dispatch_dirty = false;
+
+    pthread_mutex_unlock(&dispatch_lock);
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    return NULL;
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static void dispatch_start(void)
+{
+    dispatch_alive = true;
+
+    if(pthread_create(&dispatch_thread, NULL, dispatch_routine, NULL) != 0x00)
+    {
+        dispatch_alive = false;
+    }
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static void dispatch_stop(void)
+{
+    if(dispatch_alive)
+    {
+        pthread_mutex_lock(&dispatch_lock);
+
+        dispatch_alive = false;
+
+        pthread_cond_signal(&dispatch_cond);
+
+        pthread_mutex_unlock(&dispatch_lock);
+
+        pthread_join(dispatch_thread, NULL);
+    }
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+{%- endif %}
+
+static void *worker_routine(void *arg)
+{
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    nyx_set_log_level(NYX_LOG_LEVEL_INFO);
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    nyx_memory_initialize();
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    nyx_glue_initialize();
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    nyx_dict_t *vector_list[] = {
+{%- for d in devices -%}
+{%-   for v in d.vectors %}
+        vector_{{ v.symbol }},
+{%-   endfor -%}
+{%- endfor %}
+        {{ null }},
+    };
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    node = nyx_node_initialize(
+        "{{ descr.nodeName }}",
+        vector_list,
+        indi_url,
+        mqtt_url,
+        nss_url,
+        mqtt_username,
+        mqtt_password,
+        {{ null }},
+        3000,
+        true
+    );
+
+    nyx_device_initialize(node);
+{%- if dispatch %}
+    dispatch_start();
+{%- endif %}
+{%- if adaptive %}
+
+    int poll_max_timeout = {% if poll_timeouts[1] %}POLL_MAX_TIMEOUT{% else %}{{ descr.nodeTimeout }}{% endif %};
+
+    int poll_timeout = POLL_MIN_TIMEOUT < poll_max_timeout ? POLL_MIN_TIMEOUT : poll_max_timeout;
+
+    for(worker_alive = true; worker_alive;)
+    {
+        poll_timeout = poll_adaptive(node, poll_timeout, poll_max_timeout, {{ 'pending_apply()' if pending else 'false' }});
+    }
+{%-   if pending %}
+    pending_apply();
+{%-   endif %}
+{%- elif pending %}
+    for(worker_alive = true; worker_alive;)
+    {
+        nyx_node_poll(node, pending_apply() ? PENDING_LATENCY : {{ descr.nodeTimeout }});
+    }
+    pending_apply();
+{%- else %}
+    for(worker_alive = true; worker_alive;) nyx_node_poll(node, {{ descr.nodeTimeout }});
+{%- endif %}
+{%- if dispatch %}
+    dispatch_stop();
+{%- endif %}
+    nyx_device_finalize(node);
+
+    nyx_node_finalize(node, true);
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    nyx_memory_finalize();
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    return NULL;
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static PyObject *worker_start(PyObject *self, PyObject *args)
+{
+    if(worker_thread == 0)
+    {
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        STR_t py_indi_url      = NULL;
+        STR_t py_mqtt_url      = NULL;
+        STR_t py_nss_url       = NULL;
+        STR_t py_mqtt_username = NULL;
+        STR_t py_mqtt_password = NULL;
+
+        if(!PyArg_ParseTuple(args, "|zzzzz",
+            &py_indi_url,
+            &py_mqtt_url,
+            &py_nss_url,
+            &py_mqtt_username,
+            &py_mqtt_password
+        )) {
+            return NULL;
+        }
+
+        strcpy(indi_url,      py_indi_url      ? py_indi_url      : "");
+        strcpy(mqtt_url,      py_mqtt_url      ? py_mqtt_url      : "");
+        strcpy(nss_url,       py_nss_url       ? py_nss_url       : "");
+        strcpy(mqtt_username, py_mqtt_username ? py_mqtt_username : "");
+        strcpy(mqtt_password, py_mqtt_password ? py_mqtt_password : "");
+
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        if(pthread_create(&worker_thread, NULL, worker_routine, NULL) != 0x00)
+        {
+            PyErr_SetString(PyExc_RuntimeError, "Failed to start Nyx worker thread");
+
+            worker_alive = false;
+
+            return NULL;
+        }
+        else
+        {
+            worker_alive = true;
+
+            Py_RETURN_NONE;
+        }
+
+        /*------------------------------------------------------------------------------------------------------------*/
+    }
+
+    Py_RETURN_NONE;
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static PyObject *worker_stop(PyObject *self, PyObject *noargs)
+{
+    if(worker_thread != 0)
+    {
+        worker_alive = false;
+
+        int ret;
+
+        Py_BEGIN_ALLOW_THREADS
+        ret = pthread_join(worker_thread, NULL);
+        Py_END_ALLOW_THREADS
+
+        if(ret != 0x00)
+        {
+            PyErr_SetString(PyExc_RuntimeError, "Failed to stop Nyx worker thread");
+
+            worker_thread = 0;
+
+            return NULL;
+        }
+        else
+        {
+            worker_thread = 0;
+
+            Py_RETURN_NONE;
+        }
+    }
+
+    Py_RETURN_NONE;
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static PyObject *send_message(PyObject *self, PyObject *args)
+{
+    if(node != NULL)
+    {
+        STR_t device;
+        STR_t message;
+
+        if(!PyArg_ParseTuple(args, "ss", &device, &message))
+        {
+            return NULL;
+        }
+
+        Py_BEGIN_ALLOW_THREADS
+        pthread_mutex_lock(&node_lock);
+        nyx_node_send_message(node, device, message);
+        pthread_mutex_unlock(&node_lock);
+        Py_END_ALLOW_THREADS
+    }
+
+    Py_RETURN_NONE;
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static PyObject *send_del_property(PyObject *self, PyObject *args)
+{
+    if(node != NULL)
+    {
+        STR_t device;
+        STR_t name;
+        STR_t message;
+
+        if(!PyArg_ParseTuple(args, "szs", &device, &name, &message))
+        {
+            return NULL;
+        }
+        
+        Py_BEGIN_ALLOW_THREADS
+        pthread_mutex_lock(&node_lock);
+        nyx_node_send_del_property(node, device, name, message);
+        pthread_mutex_unlock(&node_lock);
+        Py_END_ALLOW_THREADS
+    }
+
+    Py_RETURN_NONE;
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static void stream_buffers_release(Py_buffer views[], Py_ssize_t n_views)
+{
+    for(Py_ssize_t i = 0; i < n_views; i++)
+    {
+        PyBuffer_Release(&views[i]);
+    }
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static PyObject *stream_pub(PyObject *self, PyObject *args)
+{
+    if(node != NULL)
+    {
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        STR_t device_name;
+        STR_t stream_name;
+        Py_ssize_t max_len;
+        PyObject *field_dict;
+
+        if(!PyArg_ParseTuple(args, "ssnO!", &device_name, &stream_name, &max_len, &PyDict_Type, &field_dict))
+        {
+            return NULL;
+        }
+
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        Py_ssize_t n_fields = PyDict_Size(field_dict);
+
+        uint32_t hashes[n_fields];
+        size_t sizes[n_fields];
+        BUFF_t buffs[n_fields];
+        Py_buffer views[n_fields];
+
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        Py_ssize_t name_len;
+        STR_t      name_buf;
+
+        PyObject *key;
+        PyObject *val;
+
+        Py_ssize_t pos = 0;
+        Py_ssize_t i = 0;
+
+        while(PyDict_Next(field_dict, &pos, &key, &val))
+        {
+            if(!PyUnicode_Check(key) || PyObject_GetBuffer(val, &views[i], PyBUF_SIMPLE) < 0)
+            {
+                stream_buffers_release(views, i);
+
+                PyErr_SetString(PyExc_TypeError, "Each field must be {name: bytes-like object}");
+                return NULL;
+            }
+
+            name_buf = PyUnicode_AsUTF8AndSize(key, &name_len);
+
+            hashes[i] = nyx_hash(name_len, name_buf, 0x5358594EU);
+            sizes[i] = (size_t) views[i].len;
+            buffs[i] = (buff_t) views[i].buf;
+
+            i++;
+        }
+
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        Py_BEGIN_ALLOW_THREADS
+        pthread_mutex_lock(&node_lock);
+        nyx_nss_pub(node, device_name, stream_name, (size_t) n_fields, hashes, sizes, buffs);
+        pthread_mutex_unlock(&node_lock);
+        Py_END_ALLOW_THREADS
+
+        stream_buffers_release(views, n_fields);
+
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        Py_RETURN_NONE;
+
+        /*------------------------------------------------------------------------------------------------------------*/
+    }
+
+    Py_RETURN_NONE;
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+/* STREAM FIELDS                                                                                                      */
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static STR_t stream_field_names[] = {
+{%- for name, hash in stream_fields %}
+    "{{ name }}",
+{%- endfor %}
+};
+
+static uint32_t stream_field_hashes[] = {
+{%- for name, hash in stream_fields %}
+    {{ '0x%08XU'|format(hash) }}, /* {{ name }} */
+{%- endfor %}
+};
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static int stream_fields_initialize()
+{
+    int result = 0;
+
+    for(size_t i = 0; i < sizeof(stream_field_hashes) / sizeof(stream_field_hashes[0]); i++)
+    {
+        uint32_t hash = nyx_hash(strlen(stream_field_names[i]), stream_field_names[i], {{ '0x%08XU'|format(seed) }});
+
+        if(stream_field_hashes[i] != hash)
+        {
+            stream_field_hashes[i] = hash;
+
+            result++;
+        }
+    }
+
+    return result;
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static PyObject *stream_pub_spectrum(PyObject *self, PyObject *args)
+{
+    if(node != NULL)
+    {
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        STR_t device_name;
+        STR_t stream_name;
+        Py_ssize_t max_len;
+        Py_buffer views[{{ sink_fields|length }}];
+
+        if(!PyArg_ParseTuple(args, "ssn{{ 'y*' * sink_fields|length }}", &device_name, &stream_name, &max_len, {% for name in sink_fields %}&views[{{ loop.index0 }}]{{ ', ' if not loop.last }}{% endfor %}))
+        {
+            return NULL;
+        }
+
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        uint32_t hashes[] = {
+{%- for name in sink_fields %}
+            stream_field_hashes[{{ stream_field_index[name] }}], /* {{ name }} */
+{%- endfor %}
+        };
+
+        size_t sizes[{{ sink_fields|length }}];
+        BUFF_t buffs[{{ sink_fields|length }}];
+
+        for(int i = 0; i < {{ sink_fields|length }}; i++)
+        {
+            sizes[i] = (size_t) views[i].len;
+            buffs[i] = (buff_t) views[i].buf;
+        }
+
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        Py_BEGIN_ALLOW_THREADS
+        pthread_mutex_lock(&node_lock);
+        nyx_nss_pub(node, device_name, stream_name, {{ sink_fields|length }}, hashes, sizes, buffs);
+        pthread_mutex_unlock(&node_lock);
+        Py_END_ALLOW_THREADS
+
+        stream_buffers_release(views, {{ sink_fields|length }});
+
+        /*------------------------------------------------------------------------------------------------------------*/
+    }
+
+    Py_RETURN_NONE;
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+{%- set n_scalars = sink_fields|length - 1 %}
+
+static PyObject *stream_pub_spectrum_block(PyObject *self, PyObject *args)
+{
+    if(node != NULL)
+    {
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        STR_t device_name;
+        STR_t stream_name;
+        Py_ssize_t max_len;
+        Py_buffer views[{{ sink_fields|length }}];
+        PyObject *block;
+
+        if(!PyArg_ParseTuple(args, "ssn{{ 'y*' * n_scalars }}O", &device_name, &stream_name, &max_len, {% for name in sink_fields[:-1] %}&views[{{ loop.index0 }}], {% endfor %}&block))
+        {
+            return NULL;
+        }
+
+        if(PyObject_GetBuffer(block, &views[{{ n_scalars }}], PyBUF_C_CONTIGUOUS) < 0)
+        {
+            stream_buffers_release(views, {{ n_scalars }});
+
+            return NULL;
+        }
+
+        if(views[{{ n_scalars }}].ndim != 2)
+        {
+            stream_buffers_release(views, {{ sink_fields|length }});
+
+            PyErr_SetString(PyExc_ValueError, "The {{ sink_fields[-1] }} block must be a C-contiguous 2-D buffer");
+            return NULL;
+        }
+
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        uint32_t hashes[] = {
+{%- for name in sink_fields %}
+            stream_field_hashes[{{ stream_field_index[name] }}], /* {{ name }} */
+{%- endfor %}
+        };
+
+        size_t sizes[{{ sink_fields|length }}];
+        BUFF_t buffs[{{ sink_fields|length }}];
+
+        for(int i = 0; i < {{ n_scalars }}; i++)
+        {
+            sizes[i] = (size_t) views[i].len;
+            buffs[i] = (buff_t) views[i].buf;
+        }
+
+        Py_ssize_t n_rows = views[{{ n_scalars }}].shape[0];
+
+        sizes[{{ n_scalars }}] = (size_t) (views[{{ n_scalars }}].shape[1] * views[{{ n_scalars }}].itemsize);
+
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        Py_BEGIN_ALLOW_THREADS
+        pthread_mutex_lock(&node_lock);
+
+        for(Py_ssize_t row = 0; row < n_rows; row++)
+        {
+            buffs[{{ n_scalars }}] = (buff_t) ((const char *) views[{{ n_scalars }}].buf + row * sizes[{{ n_scalars }}]);
+
+            nyx_nss_pub(node, device_name, stream_name, {{ sink_fields|length }}, hashes, sizes, buffs);
+        }
+
+        pthread_mutex_unlock(&node_lock);
+        Py_END_ALLOW_THREADS
+
+        stream_buffers_release(views, {{ sink_fields|length }});
+
+        /*------------------------------------------------------------------------------------------------------------*/
+    }
+
+    Py_RETURN_NONE;
+}
+{%- for d in devices %}
+{%-   for v in d.vectors if v.type == 'stream' and v.defs %}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static PyObject *stream_pub_{{ v.symbol }}(PyObject *self, PyObject *args)
+{
+    if(node != NULL)
+    {
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        Py_ssize_t max_len;
+        Py_buffer views[{{ v.defs|length }}];
+
+        if(!PyArg_ParseTuple(args, "n{{ 'y*' * v.defs|length }}", &max_len, {% for df in v.defs %}&views[{{ loop.index0 }}]{{ ', ' if not loop.last }}{% endfor %}))
+        {
+            return NULL;
+        }
+
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        uint32_t hashes[] = {
+{%-     for df in v.defs %}
+            stream_field_hashes[{{ stream_field_index[df.name] }}], /* {{ df.name }} */
+{%-     endfor %}
+        };
+
+        size_t sizes[{{ v.defs|length }}];
+        BUFF_t buffs[{{ v.defs|length }}];
+
+        for(int i = 0; i < {{ v.defs|length }}; i++)
+        {
+            sizes[i] = (size_t) views[i].len;
+            buffs[i] = (buff_t) views[i].buf;
+        }
+
+        /*------------------------------------------------------------------------------------------------------------*/
+
+        Py_BEGIN_ALLOW_THREADS
+        pthread_mutex_lock(&node_lock);
+        nyx_nss_pub(node, "{{ d.name }}", "{{ v.name }}", {{ v.defs|length }}, hashes, sizes, buffs);
+        pthread_mutex_unlock(&node_lock);
+        Py_END_ALLOW_THREADS
+
+        stream_buffers_release(views, {{ v.defs|length }});
+
+        /*------------------------------------------------------------------------------------------------------------*/
+    }
+
+    Py_RETURN_NONE;
+}
+{%-   endfor %}
+{%- endfor %}
+{%- if buffer_suffixes %}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+/* BUFFER VALUES                                                                                                      */
+/*--------------------------------------------------------------------------------------------------------------------*/
+/*                                                                                                                    */
+/* The bulk setters read objects supporting the buffer protocol (numpy arrays, array.array, bytes, ...) directly.     */
+/* Signed and unsigned integers of 1, 2, 4 or 8 bytes, booleans and 4 or 8 byte floats are accepted, in native byte   */
+/* order. Integer properties take floating-point elements holding an integral value. Out of range elements raise an   */
+/* OverflowError.                                                                                                     */
+/*                                                                                                                    */
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+typedef enum
+{
+    BUFFER_VALUE_SIGNED,
+    BUFFER_VALUE_UNSIGNED,
+    BUFFER_VALUE_FLOAT,
+
+} buffer_value_kind_t;
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+typedef struct
+{
+    buffer_value_kind_t kind;
+
+    long long _signed;
+    unsigned long long _unsigned;
+    double _double;
+
+} buffer_value_t;
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+#define BUFFER_VALUE_LOAD(type, field) do { type v; memcpy(&v, p, sizeof(v)); result->field = v; return true; } while(0)
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static bool buffer_value_get(const Py_buffer *view, Py_ssize_t i, buffer_value_t *result)
+{
+    STR_t format = view->format != NULL ? view->format : "B";
+
+    const uint16_t one = 1;
+
+    bool little_endian = *(const uint8_t *) &one == 1;
+
+    if(*format == '@' || *format == '=' || (*format == '<' && little_endian) || ((*format == '>' || *format == '!') && !little_endian))
+    {
+        format++;
+    }
+
+    const char *p = (const char *) view->buf + i * view->strides[0];
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    if(format[0] != '\0' && format[1] == '\0')
+    {
+        if(strchr("bhilqn", format[0]) != NULL)
+        {
+            result->kind = BUFFER_VALUE_SIGNED;
+
+            switch(view->itemsize)
+            {
+                case 1: BUFFER_VALUE_LOAD(int8_t, _signed);
+                case 2: BUFFER_VALUE_LOAD(int16_t, _signed);
+                case 4: BUFFER_VALUE_LOAD(int32_t, _signed);
+                case 8: BUFFER_VALUE_LOAD(int64_t, _signed);
+            }
+        }
+        else if(strchr("BHILQN?", format[0]) != NULL)
+        {
+            result->kind = BUFFER_VALUE_UNSIGNED;
+
+            switch(view->itemsize)
+            {
+                case 1: BUFFER_VALUE_LOAD(uint8_t, _unsigned);
+                case 2: BUFFER_VALUE_LOAD(uint16_t, _unsigned);
+                case 4: BUFFER_VALUE_LOAD(uint32_t, _unsigned);
+                case 8: BUFFER_VALUE_LOAD(uint64_t, _unsigned);
+            }
+        }
+        else if(strchr("fd", format[0]) != NULL)
+        {
+            result->kind = BUFFER_VALUE_FLOAT;
+
+            switch(view->itemsize)
+            {
+                case 4: BUFFER_VALUE_LOAD(float, _double);
+                case 8: BUFFER_VALUE_LOAD(double, _double);
+            }
+        }
+    }
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    PyErr_Format(PyExc_TypeError, "Unsupported buffer format `%s` (itemsize %zd)", view->format != NULL ? view->format : "B", view->itemsize);
+
+    return false;
+}
+{%-   for suffix, ctype, min, max in buffer_suffixes %}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static bool buffer_get_{{ suffix }}(const Py_buffer *view, Py_ssize_t i, {{ ctype }} *result)
+{
+    buffer_value_t value;
+
+    if(!buffer_value_get(view, i, &value))
+    {
+        return false;
+    }
+{%-     if suffix == 'double' %}
+
+    *result = value.kind == BUFFER_VALUE_SIGNED ? (double) value._signed
+            : value.kind == BUFFER_VALUE_UNSIGNED ? (double) value._unsigned
+            : value._double;
+
+    return true;
+{%-     else %}
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+{%-       if min %}
+
+    bool in_range = value.kind == BUFFER_VALUE_SIGNED ? value._signed >= {{ min }} && value._signed <= {{ max }}
+                  : value.kind == BUFFER_VALUE_UNSIGNED ? value._unsigned <= (unsigned long long) {{ max }}
+                  : value._double >= (double) {{ min }} && value._double < -(double) {{ min }};
+{%-       else %}
+
+    bool in_range = value.kind == BUFFER_VALUE_SIGNED ? value._signed >= 0 && (unsigned long long) value._signed <= {{ max }}
+                  : value.kind == BUFFER_VALUE_UNSIGNED ? value._unsigned <= {{ max }}
+                  : value._double >= 0.0 && value._double < (double) {{ max }} + 1.0;
+{%-       endif %}
 
-        /*------------------------------------------------------------------------------------------------------------*/
+    if(!in_range)
+    {
+        PyErr_Format(PyExc_OverflowError, "Buffer element %zd out of range for {{ ctype }}", i);
 
-        if(pthread_create(&worker_thread, NULL, worker_routine, NULL) != 0x00)
-        {
-            PyErr_SetString(PyExc_RuntimeError, "Failed to start Nyx worker thread");
+        return false;
+    }
 
-            worker_alive = false;
+    /*----------------------------------------------------------------------------------------------------------------*/
 
-            return NULL;
-        }
-        else
-        {
-            worker_alive = true;
+    *result = value.kind == BUFFER_VALUE_SIGNED ? ({{ ctype }}) value._signed
+            : value.kind == BUFFER_VALUE_UNSIGNED ? ({{ ctype }}) value._unsigned
+            : ({{ ctype }}) value._double;
 
-            Py_RETURN_NONE;
-        }
+    if(value.kind == BUFFER_VALUE_FLOAT && (double) *result != value._double)
+    {
+        PyErr_Format(PyExc_ValueError, "Buffer element %zd is not an integral value", i);
 
-        /*------------------------------------------------------------------------------------------------------------*/
+        return false;
     }
 
-    Py_RETURN_NONE;
+    return true;
+{%-     endif %}
 }
+{%-   endfor %}
+{%- endif %}
 
+{#--------------------------------------------------------------------------------------------------------------------#}
+{%- set py_methods = [] -%}
+{#--------------------------------------------------------------------------------------------------------------------#}
+{%- for d in devices -%}
+{%-   for v in d.vectors -%}
+{%-     for df in v.defs -%}
+{#--------------------------------------------------------------------------------------------------------------------#}
+{%-       if df.callback -%}
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-static PyObject *worker_stop(PyObject *self, PyObject *noargs)
-{
-    if(worker_thread != 0)
-    {
-        worker_alive = false;
+PyObject *vector_{{ df.symbol }}_python_callback = NULL;
 
-        if(pthread_join(worker_thread, NULL) != 0x00)
-        {
-            PyErr_SetString(PyExc_RuntimeError, "Failed to stop Nyx worker thread");
+static PyObject *_register_{{ df.symbol }}_callback(PyObject *self, PyObject *args)
+{
+    Py_XDECREF(vector_{{ df.symbol }}_python_callback);
 
-            worker_thread = 0;
+    if(!PyArg_ParseTuple(args, "O", &vector_{{ df.symbol }}_python_callback))
+    {
+        return NULL;
+    }
 
-            return NULL;
-        }
-        else
-        {
-            worker_thread = 0;
+    if(!PyCallable_Check(vector_{{ df.symbol }}_python_callback))
+    {        
+        vector_{{ df.symbol }}_python_callback = NULL;
+     
+        PyErr_SetString(PyExc_TypeError, "Parameter must be callable");
 
-            Py_RETURN_NONE;
-        }
+        return NULL;
     }
 
+    Py_XINCREF(vector_{{ df.symbol }}_python_callback);
+
     Py_RETURN_NONE;
 }
 
-/*--------------------------------------------------------------------------------------------------------------------*/
-
-static PyObject *send_message(PyObject *self, PyObject *args)
+{# -------------------------------------------------------------------------------------------------------------------#}
+{%-         set _ = py_methods.append('{"register_' ~ df.symbol ~ '_callback", _register_' ~ df.symbol ~ '_callback, METH_VARARGS, "Registers the callback for ' ~ d.name ~ '::' ~ v.name ~ '::' ~ df.name ~ '"},') -%}
+{#--------------------------------------------------------------------------------------------------------------------#}
+{%-       endif -%}
+{#--------------------------------------------------------------------------------------------------------------------#}
+{%-       if df.ctype -%}
+{#--------------------------------------------------------------------------------------------------------------------#}
+static PyObject *_set_{{ df.symbol }}_value(PyObject *self, PyObject *args)
 {
-    if(node != NULL)
+    if(worker_alive)
     {
-        STR_t device;
-        STR_t message;
+        {{ df.ctype }} value;
 
-        if(!PyArg_ParseTuple(args, "ss", &device, &message))
+        if(!PyArg_ParseTuple(args, "{{ df.py_code }}", &value))
         {
             return NULL;
         }
 
-        nyx_node_send_message(node, device, message);
+        pending_update_t update = {.prop = PENDING_{{ df.symbol|upper }}, .text = NULL};
+{%-         if v.type == 'text' %}
+
+        if((update.text = value_string_dup(value)) == NULL)
+        {
+            return PyErr_NoMemory();
+        }
+{%-         else %}
+        update.value._{{ df.callback_field }} = value;
+{%-         endif %}
+
+        if(!pending_push(&update))
+        {
+            free(update.text);
+        }
     }
 
     Py_RETURN_NONE;
 }
 
+{# -------------------------------------------------------------------------------------------------------------------#}
+{%          set _ = py_methods.append('{"set_' ~ df.symbol ~ '_value", _set_' ~ df.symbol ~ '_value, METH_VARARGS, "Sets the value for ' ~ d.name ~ '::' ~ v.name ~ '::' ~ df.name ~ '"},') -%}
+{#--------------------------------------------------------------------------------------------------------------------#}
+{%-       endif -%}
+{#--------------------------------------------------------------------------------------------------------------------#}
+{%-     endfor -%}
+{#--------------------------------------------------------------------------------------------------------------------#}
+{%-     if v.defs and v.type in ['number', 'text', 'switch', 'light'] -%}
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-static PyObject *send_del_property(PyObject *self, PyObject *args)
+static PyObject *_set_{{ v.symbol }}(PyObject *self, PyObject *args)
 {
-    if(node != NULL)
+    if(worker_alive)
     {
-        STR_t device;
-        STR_t name;
-        STR_t message;
+        PyObject *values;
 
-        if(!PyArg_ParseTuple(args, "szs", &device, &name, &message))
+        if(!PyArg_ParseTuple(args, "O", &values))
         {
             return NULL;
         }
-        
-        nyx_node_send_del_property(node, device, name, message);
-    }
-
-    Py_RETURN_NONE;
-}
 
-/*--------------------------------------------------------------------------------------------------------------------*/
-
-static PyObject *stream_pub(PyObject *self, PyObject *args)
-{
-    if(node != NULL)
-    {
         /*------------------------------------------------------------------------------------------------------------*/
+{%        for df in v.defs %}
+        {{ df.ctype }} value_{{ loop.index0 }};
+{%-       endfor %}
+{%-       if v.type == 'text' %}
 
-        STR_t device_name;
-        STR_t stream_name;
-        Py_ssize_t max_len;
-        PyObject *field_dict;
+        PyObject *tuple = PySequence_Tuple(values);
 
-        if(!PyArg_ParseTuple(args, "ssnO!", &device_name, &stream_name, &max_len, &PyDict_Type, &field_dict))
+        if(tuple == NULL)
         {
             return NULL;
         }
 
-        /*------------------------------------------------------------------------------------------------------------*/
-
-        Py_ssize_t n_fields = PyDict_Size(field_dict);
+        if(PyTuple_GET_SIZE(tuple) != {{ v.defs|length }})
+        {
+            Py_DECREF(tuple);
 
-        uint32_t hashes[n_fields];
-        size_t sizes[n_fields];
-        BUFF_t buffs[n_fields];
+            PyErr_SetString(PyExc_ValueError, "Expected {{ v.defs|length }} value(s) for {{ d.name }}::{{ v.name }} ({{ v.defs|map(attribute = 'name')|join(', ') }})");
+            return NULL;
+        }
 
-        /*------------------------------------------------------------------------------------------------------------*/
+        if(!PyArg_ParseTuple(tuple, "{{ v.defs|map(attribute = 'py_code')|join }}", {% for df in v.defs %}&value_{{ loop.index0 }}{{ ', ' if not loop.last }}{% endfor %}))
+        {
+            Py_DECREF(tuple);
 
-        Py_ssize_t name_len;
-        STR_t      name_buf;
-            
-        PyObject *keys = PyDict_Keys(field_dict);
+            return NULL;
+        }
+{%-       else %}
 
-        for(Py_ssize_t i = 0; i < n_fields; i++)
+        if(PyObject_CheckBuffer(values))
         {
-            PyObject *key = PyList_GetItem(keys, i);
-            PyObject *val = PyDict_GetItem(field_dict, key);
+            Py_buffer view;
 
-            if(!PyUnicode_Check(key) || !PyBytes_Check(val))
+            if(PyObject_GetBuffer(values, &view, PyBUF_RECORDS_RO) < 0)
             {
-                PyErr_SetString(PyExc_TypeError, "Each field must be {name: bytes}");
                 return NULL;
             }
 
-            name_buf = PyUnicode_AsUTF8AndSize(key, &name_len);
+            if(view.ndim != 1 || view.shape[0] != {{ v.defs|length }})
+            {
+                PyBuffer_Release(&view);
 
-            hashes[i] = nyx_hash(name_len, name_buf, 0x5358594EU);
-            sizes[i] = (size_t) PyBytes_Size(val);
-            buffs[i] = (buff_t) PyBytes_AsString(val);
-        }
+                PyErr_SetString(PyExc_ValueError, "Expected a 1-D buffer of {{ v.defs|length }} value(s) for {{ d.name }}::{{ v.name }} ({{ v.defs|map(attribute = 'name')|join(', ') }})");
+                return NULL;
+            }
 
-        /*------------------------------------------------------------------------------------------------------------*/
+            bool ok = {% for df in v.defs %}buffer_get_{{ df.callback_field }}(&view, {{ loop.index0 }}, &value_{{ loop.index0 }}){{ ' && ' if not loop.last }}{% endfor %};
 
-        nyx_nss_pub(node, device_name, stream_name, (size_t) n_fields, hashes, sizes, buffs);
-	
-        /*------------------------------------------------------------------------------------------------------------*/
+            PyBuffer_Release(&view);
 
-        Py_RETURN_NONE;
+            if(!ok)
+            {
+                return NULL;
+            }
+        }
+        else
+        {
+            PyObject *tuple = PySequence_Tuple(values);
 
-        /*------------------------------------------------------------------------------------------------------------*/
-    }
+            if(tuple == NULL)
+            {
+                return NULL;
+            }
 
-    Py_RETURN_NONE;
-}
+            if(PyTuple_GET_SIZE(tuple) != {{ v.defs|length }})
+            {
+                Py_DECREF(tuple);
 
-{#--------------------------------------------------------------------------------------------------------------------#}
-{%- set py_methods = [] -%}
-{#--------------------------------------------------------------------------------------------------------------------#}
-{%- for d in devices -%}
-{%-   for v in d.vectors -%}
-{%-     for df in v.defs -%}
-{#--------------------------------------------------------------------------------------------------------------------#}
-{%-       set ctype = '' -%}
-{%-       set suffix = '' -%}
-{%-       set pfmt  = '' -%}
-{%-       if v.type == 'number' -%}
-{%-         set subtype = get_number_type(df.format) -%}
-{%-         if   subtype == NYX_NUMBER_INT    -%}{%- set ctype = 'int'           -%}{%- set suffix = 'int' %}{%- set pfmt = 'i' -%}
-{%-         elif subtype == NYX_NUMBER_UINT   -%}{%- set ctype = 'unsigned int'  -%}{%- set suffix = 'uint' %}{%- set pfmt = 'i' -%}
-{%-         elif subtype == NYX_NUMBER_LONG   -%}{%- set ctype = 'long'          -%}{%- set suffix = 'long' %}{%- set pfmt = 'l' -%}
-{%-         elif subtype == NYX_NUMBER_ULONG  -%}{%- set ctype = 'unsigned long' -%}{%- set suffix = 'ulong' %}{%- set pfmt = 'l' -%}
-{%-         elif subtype == NYX_NUMBER_DOUBLE -%}{%- set ctype = 'double'        -%}{%- set suffix = 'double' %}{%- set pfmt = 'd' -%}
-{%-         endif -%}
-{%-       elif v.type == 'text'   -%}{%- set ctype = 'STR_t' -%}{%- set suffix = '' -%}{%- set pfmt = 's' -%}
-{%-       elif v.type == 'switch' -%}{%- set ctype = 'int'   -%}{%- set suffix = '' -%}{%- set pfmt = 'i' -%}
-{%-       elif v.type == 'light'  -%}{%- set ctype = 'int'   -%}{%- set suffix = '' -%}{%- set pfmt = 'i' -%}
-{%-       endif -%}
-{#--------------------------------------------------------------------------------------------------------------------#}
-{%-       if ctype -%}
-{#--------------------------------------------------------------------------------------------------------------------#}
-{%-         if df.callback -%}
-/*--------------------------------------------------------------------------------------------------------------------*/
+                PyErr_SetString(PyExc_ValueError, "Expected {{ v.defs|length }} value(s) for {{ d.name }}::{{ v.name }} ({{ v.defs|map(attribute = 'name')|join(', ') }})");
+                return NULL;
+            }
 
-PyObject *vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}_python_callback = NULL;
+            bool ok = PyArg_ParseTuple(tuple, "{{ v.defs|map(attribute = 'py_code')|join }}", {% for df in v.defs %}&value_{{ loop.index0 }}{{ ', ' if not loop.last }}{% endfor %});
 
-static PyObject *_register_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}_callback(PyObject *self, PyObject *args)
-{
-    Py_XDECREF(vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}_python_callback);
+            Py_DECREF(tuple);
 
-    if(!PyArg_ParseTuple(args, "O", &vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}_python_callback))
-    {
-        return NULL;
-    }
+            if(!ok)
+            {
+                return NULL;
+            }
+        }
+{%-       endif %}
 
-    if(!PyCallable_Check(vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}_python_callback))
-    {        
-        vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}_python_callback = NULL;
-     
-        PyErr_SetString(PyExc_TypeError, "Parameter must be callable");
+        /*------------------------------------------------------------------------------------------------------------*/
 
-        return NULL;
-    }
+        pending_update_t updates[] = {
+{%-       for df in v.defs %}
+{%-         if v.type == 'text' %}
+            {.prop = PENDING_{{ df.symbol|upper }}, .text = value_string_dup(value_{{ loop.index0 }})},
+{%-         else %}
+            {.prop = PENDING_{{ df.symbol|upper }}, .value._{{ df.callback_field }} = value_{{ loop.index0 }}, .text = NULL},
+{%-         endif %}
+{%-       endfor %}
+        };
+{%-       if v.type == 'text' %}
 
-    Py_XINCREF(vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}_python_callback);
+        Py_DECREF(tuple);
 
-    Py_RETURN_NONE;
-}
+        for(int i = 0; i < {{ v.defs|length }}; i++)
+        {
+            if(updates[i].text == NULL)
+            {
+                for(int j = 0; j < {{ v.defs|length }}; j++)
+                {
+                    free(updates[j].text);
+                }
 
-{# -------------------------------------------------------------------------------------------------------------------#}
-{%-           set _ = py_methods.append('{"register_' ~ d.name|lower ~ '_' ~ v.name|lower ~ '_' ~ df.name|lower ~ '_callback", _register_' ~ d.name|lower ~ '_' ~ v.name|lower ~ '_' ~ df.name|lower ~ '_callback, METH_VARARGS, "Registers the callback for ' ~ d.name ~ '::' ~ v.name ~ '::' ~ df.name ~ '"},') -%}
-{#--------------------------------------------------------------------------------------------------------------------#}
-{%-         endif -%}
-{#--------------------------------------------------------------------------------------------------------------------#}
-static PyObject *_set_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}_value(PyObject *self, PyObject *args)
-{
-    if(worker_alive)
-    {
-        {{ ctype }} value;
+                return PyErr_NoMemory();
+            }
+        }
+{%-       endif %}
+
+        /*------------------------------------------------------------------------------------------------------------*/
 
-        if(!PyArg_ParseTuple(args, "{{ pfmt }}", &value))
+        for(int i = 0; i < {{ v.defs|length }}; i++)
         {
-            return NULL;
+            if(!pending_push(&updates[i]))
+            {
+                free(updates[i].text);
+            }
         }
-{%          if v.type == 'number' %}
-        nyx_number_prop_set_{{ suffix }}((nyx_dict_t *) vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}, value);
-{%-         elif v.type == 'text' %}
-        nyx_text_prop_set((nyx_dict_t *) vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}, value);
-{%-         elif v.type == 'switch' %}
-        nyx_switch_prop_set((nyx_dict_t *) vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}, value);
-{%-         elif v.type == 'light' %}
-        nyx_light_prop_set((nyx_dict_t *) vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}, value);
-{%-         endif %}
+
+        /*------------------------------------------------------------------------------------------------------------*/
     }
 
     Py_RETURN_NONE;
 }
 
 {# -------------------------------------------------------------------------------------------------------------------#}
-{%          set _ = py_methods.append('{"set_' ~ d.name|lower ~ '_' ~ v.name|lower ~ '_' ~ df.name|lower ~ '_value", _set_' ~ d.name|lower ~ '_' ~ v.name|lower ~ '_' ~ df.name|lower ~ '_value, METH_VARARGS, "Sets the value for ' ~ d.name ~ '::' ~ v.name ~ '::' ~ df.name ~ '"},') -%}
-{#--------------------------------------------------------------------------------------------------------------------#}
-{%-       endif -%}
+{%        set _ = py_methods.append('{"set_' ~ v.symbol ~ '", _set_' ~ v.symbol ~ ', METH_VARARGS, "Sets every value of ' ~ d.name ~ '::' ~ v.name ~ ' from a sequence or a numpy array"},') -%}
 {#--------------------------------------------------------------------------------------------------------------------#}
-{%-     endfor -%}
+{%-     endif -%}
 {%-   endfor -%}
 {%- endfor %}
 /*--------------------------------------------------------------------------------------------------------------------*/
@@ -557,6 +1690,13 @@ static PyMethodDef MethodDefs[] = {
     {"send_message", send_message, METH_VARARGS, "Sends a human-oriented message to the clients."},
     {"send_del_property", send_del_property, METH_VARARGS, "Sends a del-property message to the clients."},
     {"stream_pub", stream_pub, METH_VARARGS, "Publishes an entry to a stream."},
+    {"stream_pub_spectrum", stream_pub_spectrum, METH_VARARGS, "Publishes a spectrum entry ({{ sink_fields|join(', ') }}) to a stream."},
+    {"stream_pub_spectrum_block", stream_pub_spectrum_block, METH_VARARGS, "Publishes one spectrum entry per row of a 2-D {{ sink_fields[-1] }} block to a stream."},
+{%- for d in devices %}
+{%-   for v in d.vectors if v.type == 'stream' and v.defs %}
+    {"stream_pub_{{ v.symbol }}", stream_pub_{{ v.symbol }}, METH_VARARGS, "Publishes an entry ({{ v.defs|map(attribute = 'name')|join(', ') }}) to {{ d.name }}::{{ v.name }}."},
+{%-   endfor %}
+{%- endfor %}
     {"start", worker_start, METH_VARARGS, "Starts the node."},
     {"stop", worker_stop, METH_NOARGS, "Stops the node."},
     {NULL, NULL, 0, NULL},
@@ -591,6 +1731,13 @@ PyMODINIT_FUNC PyInit_{{ descr.nodeName }}()
 
     if(module != NULL)
     {
+        if(stream_fields_initialize() > 0 && PyErr_WarnEx(PyExc_RuntimeWarning, "nyx_hash() differs from the generated stream field hashes, using the runtime values", 1) < 0)
+        {
+            Py_DECREF(module);
+
+            return NULL;
+        }
+
         PyModule_AddIntConstant(module, "NYX_STATE_IDLE", NYX_STATE_IDLE);
         PyModule_AddIntConstant(module, "NYX_STATE_OK", NYX_STATE_OK);
         PyModule_AddIntConstant(module, "NYX_STATE_BUSY", NYX_STATE_BUSY);
@@ -610,12 +1757,33 @@ PyMODINIT_FUNC PyInit_{{ descr.nodeName }}()
 
         if self._override_main or not os.path.isfile(filename):
 
-            with open(filename, 'wt', encoding = 'utf-8') as f:
+            stream_fields = list(SINK_FIELDS)
 
-                f.write(self.render(
-                    template,
-                    devices = self._devices
-                ))
+            for device in self._devices:
+
+                for vector in device.vectors:
+
+                    if vector.type == 'stream':
+
+                        stream_fields.extend(df.name for df in vector.defs if df.name not in stream_fields)
+
+            self.render_file(
+                filename,
+                template,
+                devices = self._devices,
+                seed = NSS_HASH_SEED,
+                sink_fields = SINK_FIELDS,
+                stream_fields = [(name, nyx_hash(name.encode('utf-8'))) for name in stream_fields],
+                stream_field_index = {name: i for i, name in enumerate(stream_fields)},
+                pending = [(vector, df) for device in self._devices for vector in device.vectors for df in vector.defs if df.ctype],
+                pending_capacity = 1 << (max(1, int(self._descr.get('updateQueueSize', UPDATE_QUEUE_SIZE))) - 1).bit_length(),
+                pending_latency = max(1, min(int(self._descr.get('updateLatency', UPDATE_LATENCY)), int(self._descr.get('nodeTimeout', UPDATE_LATENCY)))),
+                dispatch = [(vector, df) for device in self._devices for vector in device.vectors for df in vector.defs if df.callback and df.ctype],
+                dispatch_interval = int(1.0e9 / float(self._descr['callbackRate'])) if self._descr.get('callbackRate') else 0,
+                adaptive = self._poll_strategy() == 'adaptive',
+                poll_timeouts = self._poll_timeouts(),
+                buffer_suffixes = [BUFFER_LIMITS[suffix] for suffix in sorted({df.callback_field for device in self._devices for vector in device.vectors if vector.type in ['number', 'switch', 'light'] for df in vector.defs})]
+            )
 
     ####################################################################################################################
 
@@ -628,62 +1796,89 @@ PyMODINIT_FUNC PyInit_{{ descr.nodeName }}()
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-{%- set ns = namespace(any_callbacks = false) -%}
 {#--------------------------------------------------------------------------------------------------------------------#}
 {%- for v in device.vectors -%}
 {%-   for df in v.defs if df.callback -%}
-{%-     set ns.any_callbacks = true -%}
-{%-     if v.type == 'number' -%}
-{%-       set subtype = get_number_type(df.format) -%}
-{%-       if   subtype == NYX_NUMBER_INT    -%}{% set ctype = 'int'           %}{% set pfmt = '(i)' %}
-{%-       elif subtype == NYX_NUMBER_UINT   -%}{% set ctype = 'unsigned int'  %}{% set pfmt = '(i)' %}
-{%-       elif subtype == NYX_NUMBER_LONG   -%}{% set ctype = 'long'          %}{% set pfmt = '(l)' %}
-{%-       elif subtype == NYX_NUMBER_ULONG  -%}{% set ctype = 'unsigned long' %}{% set pfmt = '(l)' %}
-{%-       elif subtype == NYX_NUMBER_DOUBLE -%}{% set ctype = 'double'        %}{% set pfmt = '(d)' %}
-{%-       endif -%}
-{%-     elif v.type in ['light','switch']   -%}{% set ctype = 'int'   %}{% set pfmt = '(i)' %}
-{%-     elif v.type == 'text'               -%}{% set ctype = 'STR_t' %}{% set pfmt = '(s)' %}
-{%-     elif v.type == 'blob'               -%}{% set ctype = None    %}{% set pfmt = '(O)' %}
-{%-     endif -%}
 {#------------------------------------------------------------------------------------------------------------------- #}
 {%      if v.type == 'blob' -%}
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def_vector, size_t size, BUFF_t buff)
+static bool _{{ df.local_symbol }}_callback(nyx_dict_t *vector, nyx_dict_t *def_vector, size_t size, BUFF_t buff)
 {
-    if(vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}_python_callback != NULL)
+    if(vector_{{ df.symbol }}_python_callback != NULL)
 {%-     else -%}
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def_vector, {{ ctype }} new_value, {{ ctype }} old_value)
+static bool _{{ df.local_symbol }}_callback(nyx_dict_t *vector, nyx_dict_t *def_vector, {{ df.ctype }} new_value, {{ df.ctype }} old_value)
 {
 {%-       if v.type != 'text' %}
-    if(new_value != old_value && vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}_python_callback != NULL)
+    if(new_value != old_value && vector_{{ df.symbol }}_python_callback != NULL)
 {%-       else %}
-    if((strcmp(new_value, old_value) != 0 && vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}_python_callback != NULL)
+    if(strcmp(new_value, old_value) != 0 && vector_{{ df.symbol }}_python_callback != NULL)
 {%-       endif %}
 {%-     endif %}
     {
         /*------------------------------------------------------------------------------------------------------------*/
         /* !!! AUTOGENERATED CODE !!!                                                                                 */
         /*------------------------------------------------------------------------------------------------------------*/
-
-        PyGILState_STATE gstate = PyGILState_Ensure();
 {%     if v.type == 'blob' %}
-        PyObject *py_bytes = PyBytes_FromStringAndSize((const char *) buff, (Py_ssize_t) size);
-        PyObject *args = Py_BuildValue("{{ pfmt }}", py_bytes);
-        Py_DECREF(py_bytes);
-{%-     else %}
-        PyObject *args = Py_BuildValue("{{ pfmt }}", new_value);
-{%-     endif %}
-        
-        PyObject *result = PyObject_CallObject(vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}_python_callback, args);
-        
-        Py_DECREF(args);
-        
-        if(result == NULL) {
-            PyErr_Print();
+        PyGILState_STATE gstate = PyGILState_Ensure();
+{%       if descr.blobCopy|default(true) %}
+        PyObject *py_buff = PyBytes_FromStringAndSize((const char *) buff, (Py_ssize_t) size);
+{%-      else %}
+        /* zero-copy: the memoryview is only valid during the callback, use bytes(value) to keep the data */
+
+        PyObject *py_buff = PyMemoryView_FromMemory((char *) buff, (Py_ssize_t) size, PyBUF_READ);
+{%-      endif %}
+
+        PyObject *args = py_buff != NULL ? PyTuple_Pack(1, py_buff) : NULL;
+
+        if(args != NULL) {
+
+            PyObject *result = PyObject_CallObject(vector_{{ df.symbol }}_python_callback, args);
+
+            Py_DECREF(args);
+
+            if(result == NULL) {
+                PyErr_Print();
+            } else {
+                Py_DECREF(result);
+            }
+
         } else {
-            Py_DECREF(result);
+            PyErr_Print();
+        }
+
+        if(py_buff != NULL) {
+{%-      if not descr.blobCopy|default(true) %}
+
+            /* invalidate the view: release() fails if the callback still holds an export of it, and views sliced */
+            /* from it stay registered in its managed buffer                                                       */
+
+            _PyManagedBufferObject *mbuf = ((PyMemoryViewObject *) py_buff)->mbuf;
+
+            Py_INCREF(mbuf);
+
+            PyObject *released = PyObject_CallMethod(py_buff, "release", NULL);
+
+            bool kept = released == NULL || mbuf->exports > 0;
+
+            Py_DECREF(mbuf);
+
+            if(kept) {
+
+                PyErr_Clear();
+
+                if(PyErr_WarnEx(PyExc_RuntimeWarning, "a BLOB callback kept an export of its zero-copy memoryview, which now refers to freed memory: copy the data with bytes(value) or enable blobCopy", 1) < 0) {
+                    PyErr_Print();
+                }
+            }
+
+            Py_XDECREF(released);
+{%       endif %}
+            Py_DECREF(py_buff);
         }
 
         PyGILState_Release(gstate);
+{%-     else %}
+        dispatch_{{ df.symbol }}(new_value);
+{%-     endif %}
         
         /*------------------------------------------------------------------------------------------------------------*/
         /* USER FREE CODE                                                                                             */
@@ -701,39 +1896,27 @@ static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector,
 
 {%   endfor -%}
 {%-   if v.callback and v.type != 'stream' %}
-static void _{{ v.name|lower }}_callback(nyx_dict_t *vector, bool modified)
+static void _{{ v.ident }}_callback(nyx_dict_t *vector, bool modified)
 {
 }
 {%-   endif -%}
 {%- endfor -%}
 
-{%- if not ns.any_callbacks %}
+{%- if not device.has_def_callbacks %}
 /* TO BE IMPLEMENTED */
 {%- endif %}
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-void device_{{ device.name|lower }}_initialize(nyx_node_t *node)
+void device_{{ device.ident }}_initialize(nyx_node_t *node)
 {
 {%- for v in device.vectors -%}
-{%-   for df in v.defs if df.callback -%}
-{%-     if v.type == 'number' -%}
-{%          set subtype = get_number_type(df.format) -%}
-{%-         if   subtype == NYX_NUMBER_INT   %}    vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._int    = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-         elif subtype == NYX_NUMBER_UINT  %}    vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._uint   = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-         elif subtype == NYX_NUMBER_LONG  %}    vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._long   = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-         elif subtype == NYX_NUMBER_ULONG %}    vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._ulong  = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-         elif subtype == NYX_NUMBER_DOUBLE %}   vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._double = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-         endif -%}
-{%-     elif v.type == 'text'   %}    vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._str   = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-     elif v.type == 'light'  %}    vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._int   = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-     elif v.type == 'switch' %}    vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._int   = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-     elif v.type == 'blob'   %}    vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._blob  = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-     endif -%}
-{%    endfor -%}
+{%-   for df in v.defs if df.callback %}
+    vector_{{ df.symbol }}->base.in_callback._{{ df.callback_field }} = _{{ df.local_symbol }}_callback;
+{%-   endfor -%}
 {%-   if v.callback and v.type != 'stream' %}
 
-    vector_{{ device.name|lower }}_{{ v.name|lower }}->base.in_callback._vector = _{{ v.name|lower }}_callback;
+    vector_{{ v.symbol }}->base.in_callback._vector = _{{ v.ident }}_callback;
 {%    endif -%}
 {%- endfor %}
 
@@ -742,7 +1925,7 @@ void device_{{ device.name|lower }}_initialize(nyx_node_t *node)
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-void device_{{ device.name|lower }}_finalize(nyx_node_t *node)
+void device_{{ device.ident }}_finalize(nyx_node_t *node)
 {
     /* TO BE IMPLEMENTED */
 }
@@ -752,16 +1935,15 @@ void device_{{ device.name|lower }}_finalize(nyx_node_t *node)
 
         for device in self._devices:
 
-            filename = os.path.join(self._driver_path, 'src', f'device_{device["name"].lower()}.{self._src_ext}')
+            filename = os.path.join(self._driver_path, 'src', f'device_{device.ident}.{self._src_ext}')
 
             if self._override_device or not os.path.isfile(filename):
 
-                with open(filename, 'wt', encoding = 'utf-8') as f:
-
-                    f.write(self.render(
-                        template,
-                        device = device
-                    ))
+                self.render_file(
+                    filename,
+                    template,
+                    device = device
+                )
 
     ####################################################################################################################
 
@@ -771,6 +1953,7 @@ void device_{{ device.name|lower }}_finalize(nyx_node_t *node)
 ########################################################################################################################
 
 import atexit
+import typing
 import {{ descr.nodeName }} as _mod
 
 import numpy as np
@@ -798,7 +1981,7 @@ def send_message(device, message):
 
 ########################################################################################################################
 
-def stream_pub(device_name, stream_name, max_len, fields: dict[str, bytes]):
+def stream_pub(device_name, stream_name, max_len, fields: typing.Dict[str, typing.Union[bytes, memoryview, np.ndarray]]):
 
     _mod.stream_pub(device_name, stream_name, max_len, fields)
 
@@ -817,24 +2000,26 @@ class nyx_sink(gr.sync_block):
         self.frequency = float(frequency)
         self.fft_size  = int(fft_size)
 
+        self._samples = np.empty((0, self.fft_size), dtype = np.float32)
+
     def work(self, input_items, output_items):
 
         samp_rate = np.float32(self.samp_rate).tobytes()
         frequency = np.float32(self.frequency).tobytes()
 
-        for msg in input_items[0]:
+        block = input_items[0]
 
-            samples = np.round(msg, decimals = 1).tobytes()
+        if self._samples.shape[0] < len(block):
 
-            data = {
-                "samp_rate": samp_rate,
-                "frequency": frequency,
-                "samples": samples,
-            }
+            self._samples = np.empty((len(block), self.fft_size), dtype = np.float32)
+
+        samples = self._samples[: len(block)]
 
-            _mod.stream_pub(self.device_name, self.stream_name, 100, data)
+        np.round(block, decimals = 1, out = samples)
 
-        self.consume(0, len(input_items[0]))
+        _mod.stream_pub_spectrum_block(self.device_name, self.stream_name, 100, samp_rate, frequency, samples)
+
+        self.consume(0, len(block))
 
         return 0
 
@@ -843,21 +2028,19 @@ class nyx_sink(gr.sync_block):
 
         filename = os.path.join(self._driver_path, 'src', '__init__.py')
 
-        with open(filename, 'wt', encoding = 'utf-8') as f:
-
-            f.write(self.render(template_init))
+        self.render_file(filename, template_init)
 
         parameter_list = []
         callback_regs  = []
 
         for d in self._devices:
-            for v in d['vectors']:
-                for df in v['defs']:
-                    if df.get('callback', False):
-                        ns = f"{d['name'].lower()}_{v['name'].lower()}_{df['name'].lower()}"
+            for v in d.vectors:
+                for df in v.defs:
+                    if df.callback:
+                        ns = df.symbol
                         parameter_list.append(f'''
   - id: {ns}_variable
-    label: '{d["name"]}:{v["name"]}:{df["name"]}'
+    label: '{d.name}:{v.name}:{df.name}'
     category: 'Callbacks'
     dtype: _multiline
     default: ''
@@ -923,9 +2106,7 @@ file_format: 1
 
         filename = os.path.join(self._driver_path, 'grc', f'nyx_{self._descr["nodeName"].lower()}.block.yml')
 
-        with open(filename, 'wt', encoding = 'utf-8') as f:
-
-            f.write(template_grc_core)
+        self.write_file(filename, template_grc_core)
 
         template_grc_sink = f'''
 id: nyx_{self._descr["nodeName"].replace("-", "_").lower()}_sink
@@ -975,8 +2156,6 @@ file_format: 1
 
         filename = os.path.join(self._driver_path, 'grc', f'nyx_{self._descr["nodeName"].lower()}_sink.block.yml')
 
-        with open(filename, 'wt', encoding = 'utf-8') as f:
-
-            f.write(template_grc_sink)
+        self.write_file(filename, template_grc_sink)
 
 ########################################################################################################################
@@ -5,15 +5,28 @@ import os
 
 ########################################################################################################################
 
+from ..model import VECTOR_TYPES
+from ..formats import LONG_LONG_LENGTHS
+from ..lookup import build_device_lookups
 from ..abstract_generator import AbstractGenerator, generator_config
 
 ########################################################################################################################
 
+POLL_STRATEGIES = ('fixed', 'adaptive')
+
+POLL_MIN_TIMEOUT = 10
+
+########################################################################################################################
+
 @generator_config(name = 'posix-c', null = 'NULL', src_ext = 'c', head_ext = 'h')
 class PosixCGenerator(AbstractGenerator):
 
     ####################################################################################################################
 
+    _long_bits = 64
+
+    ####################################################################################################################
+
     # noinspection PyUnresolvedReferences
     def __init__(self, args, descr):
 
@@ -21,8 +34,54 @@ class PosixCGenerator(AbstractGenerator):
 
     ####################################################################################################################
 
+    def _poll_strategy(self) -> str:
+
+        strategy = self._descr.get('pollStrategy', 'fixed')
+
+        if strategy not in POLL_STRATEGIES:
+
+            raise ValueError(f'Invalid poll strategy `{strategy}` (expected one of {", ".join(POLL_STRATEGIES)})')
+
+        return strategy
+
+    ####################################################################################################################
+
+    def _poll_timeouts(self) -> tuple:
+
+        poll_min_timeout = int(self._descr.get('pollMinTimeout', POLL_MIN_TIMEOUT))
+
+        poll_max_timeout = int(self._descr.get('pollMaxTimeout', 0))
+
+        if poll_max_timeout and poll_max_timeout < poll_min_timeout:
+
+            raise ValueError(f'Invalid poll timeouts (pollMaxTimeout {poll_max_timeout} < pollMinTimeout {poll_min_timeout})')
+
+        return poll_min_timeout, poll_max_timeout
+
+    ####################################################################################################################
+
+    def _check_number_formats(self) -> None:
+
+        if self._long_bits >= 64:
+
+            return
+
+        for device in self._devices:
+
+            for vector in device.vectors:
+
+                for df in vector.defs:
+
+                    if df.number is not None and df.number.length in LONG_LONG_LENGTHS:
+
+                        raise ValueError(f'{device.name}::{vector.name}::{df.name}: 64-bit length modifier `{df.number.length}` not supported, `long` is {self._long_bits}-bit on {self._name}: {df["format"]}')
+
+    ####################################################################################################################
+
     def generate(self) -> None:
 
+        self._check_number_formats()
+
         self._generate_cmake()
         self._generate_header()
         self._generate_main()
@@ -38,7 +97,7 @@ class PosixCGenerator(AbstractGenerator):
         template = '''
 ########################################################################################################################
 
-cmake_minimum_required(VERSION 3.5)
+cmake_minimum_required(VERSION 3.9)
 
 ########################################################################################################################
 
@@ -46,8 +105,9 @@ project({{ descr.nodeName|lower }} C)
 
 set(CMAKE_C_STANDARD 99)
 
-add_compile_options(-Wall -Wno-unknown-pragmas -Wno-unused-function -O3)
+add_compile_options(-Wall -Wno-unknown-pragmas -Wno-unused-function)
 
+{{ build }}
 ########################################################################################################################
 
 find_package(NyxNode REQUIRED)
@@ -55,7 +115,9 @@ find_package(NyxNode REQUIRED)
 ########################################################################################################################
 
 set(SOURCE_FILES
-    {{ cmake_files|join('\\n    ') }}
+{%- for cmake_file in cmake_files %}
+    {{ cmake_file }}
+{%- endfor %}
     ./src/autogen/glue.{{ src_ext }}
     ./src/main.{{ src_ext }}
 )
@@ -75,17 +137,26 @@ target_link_libraries({{ descr.nodeName|lower }} PRIVATE NyxNode::nyx-node-{{ 's
 
         if self._override_cmake or not os.path.isfile(filename):
 
-            with open(filename, 'wt', encoding = 'utf-8') as f:
-
-                f.write(self.render(
-                    template,
-                    cmake_files = [os.path.join('.', 'src', f'device_{device["name"].lower()}.{self._src_ext}') for device in self._devices]
-                ))
+            self.render_file(
+                filename,
+                template,
+                cmake_files = [os.path.join('.', 'src', f'device_{device.ident}.{self._src_ext}') for device in self._devices],
+                build = self._render_cmake_build('C')
+            )
 
     ####################################################################################################################
 
     def _generate_header(self) -> None:
 
+        template_device = '''
+{%- for v in d.vectors -%}
+{%-   for df in v.defs %}
+extern nyx_dict_t *vector_{{ df.symbol }};
+{%-   endfor %}
+extern nyx_dict_t *vector_{{ v.symbol }};
+{%  endfor -%}
+'''[1:]
+
         template = '''
 /* !!! AUTOGENERATED FILE !!! */
 /*--------------------------------------------------------------------------------------------------------------------*/
@@ -96,25 +167,31 @@ target_link_libraries({{ descr.nodeName|lower }} PRIVATE NyxNode::nyx-node-{{ 's
 /*--------------------------------------------------------------------------------------------------------------------*/
 
 #include <unistd.h>
+{%- if descr.lookupTables|default(false) %}
+#include <string.h>
+{%- endif %}
 
 #include <nyx_node.h>
 
 /*--------------------------------------------------------------------------------------------------------------------*/
-{%  for d in devices -%}
-{%-   for v in d.vectors -%}
-{%-     for df in v.defs %}
-extern nyx_dict_t *vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }};
-{%-     endfor %}
-extern nyx_dict_t *vector_{{ d.name|lower }}_{{ v.name|lower }};
-{%    endfor -%}
+{%  for fragment in declarations -%}
+{{ fragment }}
 {%- endfor %}
 /*--------------------------------------------------------------------------------------------------------------------*/
 {%  for d in devices %}
-void device_{{ d.name|lower }}_initialize(nyx_node_t *node);
+void device_{{ d.ident }}_initialize(nyx_node_t *node);
+{%- endfor %}
+{%  for d in devices %}
+void device_{{ d.ident }}_finalize(nyx_node_t *node);
 {%- endfor %}
+{%- if descr.lookupTables|default(false) %}
 {%  for d in devices %}
-void device_{{ d.name|lower }}_finalize(nyx_node_t *node);
+nyx_dict_t *device_{{ d.ident }}_find_vector(STR_t name);
 {%- endfor %}
+{%  for d in devices %}
+nyx_dict_t *device_{{ d.ident }}_find_prop(STR_t vector, STR_t name);
+{%- endfor %}
+{%- endif %}
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 
@@ -135,12 +212,12 @@ void nyx_device_finalize(nyx_node_t *node);
 
         filename = os.path.join(self._driver_path, 'src', 'autogen', f'glue.{self._head_ext}')
 
-        with open(filename, 'wt', encoding = 'utf-8') as f:
-
-            f.write(self.render(
-                template,
-                devices = self._devices
-            ))
+        self.render_file(
+            filename,
+            template,
+            devices = self._devices,
+            declarations = [self.render_fragment(template_device, d = device) for device in self._devices]
+        )
 
     ####################################################################################################################
 
@@ -157,11 +234,10 @@ void nyx_device_finalize(nyx_node_t *node);
 
         filename = os.path.join(self._driver_path, 'src', f'credentials.{self._head_ext}')
 
-        with open(filename, 'wt', encoding = 'utf-8') as f:
-
-            f.write(self.render(
-                template
-            ))
+        self.render_file(
+            filename,
+            template
+        )
 
         ################################################################################################################
         # main.c                                                                                                       #
@@ -173,6 +249,10 @@ void nyx_device_finalize(nyx_node_t *node);
 #include <stdio.h>
 #include <stdlib.h>
 #include <signal.h>
+{%- if adaptive %}
+#include <stdint.h>
+#include <time.h>
+{%- endif %}
 
 #include "autogen/glue.{{ head_ext }}"
 #include "credentials.{{ head_ext }}"
@@ -186,8 +266,55 @@ static void signal_handler(int signo)
     s_signo = signo;
 }
 
+/*--------------------------------------------------------------------------------------------------------------------*/
+{%- if adaptive %}
+/* ADAPTIVE POLL                                                                                                      */
+/*--------------------------------------------------------------------------------------------------------------------*/
+/*                                                                                                                    */
+/* nyx_node_poll() returns before its timeout when the node handled some I/O. In that case the next poll uses the     */
+/* minimum timeout, otherwise the timeout doubles up to the maximum timeout. The adaptive strategy mostly lowers the  */
+/* latency of a busy node: it only saves wake-ups on an idle node when the maximum exceeds the node timeout.          */
+/*                                                                                                                    */
 /*--------------------------------------------------------------------------------------------------------------------*/
 
+#define POLL_MIN_TIMEOUT {{ poll_timeouts[0] }}
+{%- if poll_timeouts[1] %}
+
+#define POLL_MAX_TIMEOUT {{ poll_timeouts[1] }}
+{%- endif %}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static uint64_t poll_clock_us(void)
+{
+    struct timespec ts;
+
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+
+    return (uint64_t) ts.tv_sec * 1000000U + (uint64_t) ts.tv_nsec / 1000U;
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static int poll_adaptive(nyx_node_t *node, int poll_timeout, int max_timeout, bool active)
+{
+    uint64_t poll_start = poll_clock_us();
+
+    nyx_node_poll(node, poll_timeout);
+
+    if(active || poll_clock_us() - poll_start < (uint64_t) poll_timeout * 1000U)
+    {
+        return POLL_MIN_TIMEOUT < max_timeout ? POLL_MIN_TIMEOUT : max_timeout;
+    }
+    else
+    {
+        return 2 * poll_timeout < max_timeout ? 2 * poll_timeout : max_timeout;
+    }
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+{%- endif %}
+
 static void print_usage(
     STR_t prog,
     STR_t indi_url,
@@ -293,7 +420,7 @@ int main(int argc, char **argv)
     nyx_dict_t *vector_list[] = {
 {%- for d in devices -%}
 {%-   for v in d.vectors %}
-        vector_{{ d.name|lower }}_{{ v.name|lower }},
+        vector_{{ v.symbol }},
 {%-   endfor -%}
 {%- endfor %}
         {{ null }},
@@ -318,7 +445,19 @@ int main(int argc, char **argv)
     signal(SIGTERM, signal_handler);
     
     nyx_device_initialize(node);
+{%- if adaptive %}
+
+    int poll_max_timeout = {% if poll_timeouts[1] %}POLL_MAX_TIMEOUT{% else %}node_timeout{% endif %};
+
+    int poll_timeout = POLL_MIN_TIMEOUT < poll_max_timeout ? POLL_MIN_TIMEOUT : poll_max_timeout;
+
+    while(s_signo == 0)
+    {
+        poll_timeout = poll_adaptive(node, poll_timeout, poll_max_timeout, false);
+    }
+{% else %}
     while(s_signo == 0) nyx_node_poll(node, node_timeout);
+{%- endif %}
     nyx_device_finalize(node);
 
     nyx_node_finalize(node, true);
@@ -341,12 +480,13 @@ int main(int argc, char **argv)
 
         if self._override_main or not os.path.isfile(filename):
 
-            with open(filename, 'wt', encoding = 'utf-8') as f:
-
-                f.write(self.render(
-                    template,
-                    devices = self._devices
-                ))
+            self.render_file(
+                filename,
+                template,
+                devices = self._devices,
+                adaptive = self._poll_strategy() == 'adaptive',
+                poll_timeouts = self._poll_timeouts()
+            )
 
     ####################################################################################################################
 
@@ -354,133 +494,134 @@ int main(int argc, char **argv)
 
         ################################################################################################################
 
-        template = '''
-/* !!! AUTOGENERATED FILE !!! */
-/*--------------------------------------------------------------------------------------------------------------------*/
-
-#include "glue.{{ head_ext }}"
+        template_definitions = '''
+{%- for v in d.vectors -%}
+{%-   for df in v.defs %}
+nyx_dict_t *vector_{{ df.symbol }} = {{ null }};
+{%-   endfor %}
+nyx_dict_t *vector_{{ v.symbol }} = {{ null }};
+{%  endfor -%}
+'''[1:]
 
-/*--------------------------------------------------------------------------------------------------------------------*/
-{%  for d in devices -%}
-{%-   for v in d.vectors -%}
-{%-     for df in v.defs %}
-nyx_dict_t *vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }} = {{ null }};
-{%-     endfor %}
-nyx_dict_t *vector_{{ d.name|lower }}_{{ v.name|lower }} = {{ null }};
-{%    endfor -%}
-{%- endfor %}
-/*--------------------------------------------------------------------------------------------------------------------*/
+        ################################################################################################################
 
-void nyx_glue_initialize()
-{
-    /*----------------------------------------------------------------------------------------------------------------*/
-    /* INITIALIZE VECTORS                                                                                             */
-    /*----------------------------------------------------------------------------------------------------------------*/
+        template_initializations = '''
+{%- for v in d.vectors %}
 
-{%- for d in devices -%}
-{%-   for v in d.vectors %}
+    /* VECTOR {{ d.upper_ident }}::{{ v.upper_ident }} */
+{%    for df in v.defs -%}
+{%-     if v.type == 'number' %}
+    vector_{{ df.symbol }} = nyx_number_prop_new_{{ df.number.suffix }}("{{ df.name }}", "{{ df.label }}", "{{ df.format }}", {{ df.min }}, {{ df.max }}, {{ df.step }}, {{ df.value }});
+{%-     elif v.type == 'text' %}
+    vector_{{ df.symbol }} = nyx_text_prop_new("{{ df.name }}", "{{ df.label }}", "{{ df.value }}");
+{%-     elif v.type == 'light' %}
+    vector_{{ df.symbol }} = nyx_light_prop_new("{{ df.name }}", "{{ df.label }}", {{ df.value }});
+{%-     elif v.type == 'switch' %}
+    vector_{{ df.symbol }} = nyx_switch_prop_new("{{ df.name }}", "{{ df.label }}", {{ df.value }});
+{%-     elif v.type == 'blob' %}
+    vector_{{ df.symbol }} = nyx_blob_prop_new("{{ df.name }}", "{{ df.label }}", "{{ df.format }}", {{ df.value }});
+{%-     elif v.type == 'stream' %}
+    vector_{{ df.symbol }} = nyx_stream_prop_new("{{ df.name }}", "{{ df.label }}");
+{%-     endif -%}
+{%-   endfor %}
 
-    /* VECTOR {{ d.name|upper }}::{{ v.name|upper }} */
-{%      for df in v.defs -%}
-{%-       if v.type == 'number' -%}
-{%          set subtype = get_number_type(df.format) -%}
-{%-         if subtype == NYX_NUMBER_INT %}
-    vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }} = nyx_number_prop_new_int("{{ df.name }}", "{{ df.label }}", "{{ df.format }}", {{ df.min }}, {{ df.max }}, {{ df.step }}, {{ df.value }});
-{%-         elif subtype == NYX_NUMBER_UINT %}
-    vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }} = nyx_number_prop_new_uint("{{ df.name }}", "{{ df.label }}", "{{ df.format }}", {{ df.min }}, {{ df.max }}, {{ df.step }}, {{ df.value }});
-{%-         elif subtype == NYX_NUMBER_LONG %}
-    vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }} = nyx_number_prop_new_long("{{ df.name }}", "{{ df.label }}", "{{ df.format }}", {{ df.min }}, {{ df.max }}, {{ df.step }}, {{ df.value }});
-{%-         elif subtype == NYX_NUMBER_ULONG %}
-    vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }} = nyx_number_prop_new_ulong("{{ df.name }}", "{{ df.label }}", "{{ df.format }}", {{ df.min }}, {{ df.max }}, {{ df.step }}, {{ df.value }});
-{%-         elif subtype == NYX_NUMBER_DOUBLE %}
-    vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }} = nyx_number_prop_new_double("{{ df.name }}", "{{ df.label }}", "{{ df.format }}", {{ df.min }}, {{ df.max }}, {{ df.step }}, {{ df.value }});
-{%-         endif -%}
-{%-       elif v.type == 'text' %}
-    vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }} = nyx_text_prop_new("{{ df.name }}", "{{ df.label }}", "{{ df.value }}");
-{%-       elif v.type == 'light' %}
-    vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }} = nyx_light_prop_new("{{ df.name }}", "{{ df.label }}", {{ df.value }});
-{%-       elif v.type == 'switch' %}
-    vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }} = nyx_switch_prop_new("{{ df.name }}", "{{ df.label }}", {{ df.value }});
-{%-       elif v.type == 'blob' %}
-    vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }} = nyx_blob_prop_new("{{ df.name }}", "{{ df.label }}", "{{ df.format }}", {{ df.value }});
-{%-       elif v.type == 'stream' %}
-    vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }} = nyx_stream_prop_new("{{ df.name }}", "{{ df.label }}");
-{%-       endif -%}
-{%-     endfor %}
-
-    nyx_dict_t *{{ d.name|lower }}_{{ v.name|lower }}_props[] = {
-{%-     for df in v.defs %}
-        vector_{{ d.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }},
-{%-     endfor %}
+    nyx_dict_t *{{ v.symbol }}_props[] = {
+{%-   for df in v.defs %}
+        vector_{{ df.symbol }},
+{%-   endfor %}
         {{ null }},
     };
 
-    nyx_opts_t {{ d.name|lower }}_{{ v.name|lower }}_opts = {
+    nyx_opts_t {{ v.symbol }}_opts = {
         .group = {% if (v.group|default('')|trim)|length > 0 %}"{{ v.group|trim }}"{% else %}{{ null }}{% endif %},
         .label = {% if (v.label|default('')|trim)|length > 0 %}"{{ v.label|trim }}"{% else %}{{ null }}{% endif %},
         .hints = {% if (v.hints|default('')|trim)|length > 0 %}"{{ v.hints|trim }}"{% else %}{{ null }}{% endif %},
         .message = {% if (v.message|default('')|trim)|length > 0 %}"{{ v.message|trim }}"{% else %}{{ null }}{% endif %},
         .timeout = {% if v.timeout|default(None) is not none %}{{ v.timeout }}{% else %}0{% endif %},
     };
-{%      if v.type == 'number' %}
-    vector_{{ d.name|lower }}_{{ v.name|lower }} = nyx_number_vector_new(
+{%    if v.type == 'number' %}
+    vector_{{ v.symbol }} = nyx_number_vector_new(
         "{{ d.name }}",
         "{{ v.name }}",
         {{ v.state }},
         {{ v.perm }},
-        {{ d.name|lower }}_{{ v.name|lower }}_props,
-        &{{ d.name|lower }}_{{ v.name|lower }}_opts
+        {{ v.symbol }}_props,
+        &{{ v.symbol }}_opts
     );
-{%-     elif v.type == 'text' %}
-    vector_{{ d.name|lower }}_{{ v.name|lower }} = nyx_text_vector_new(
+{%-   elif v.type == 'text' %}
+    vector_{{ v.symbol }} = nyx_text_vector_new(
         "{{ d.name }}",
         "{{ v.name }}",
         {{ v.state }},
         {{ v.perm }},
-        {{ d.name|lower }}_{{ v.name|lower }}_props,
-        &{{ d.name|lower }}_{{ v.name|lower }}_opts
+        {{ v.symbol }}_props,
+        &{{ v.symbol }}_opts
     );
-{%-     elif v.type == 'light' %}
-    vector_{{ d.name|lower }}_{{ v.name|lower }} = nyx_light_vector_new(
+{%-   elif v.type == 'light' %}
+    vector_{{ v.symbol }} = nyx_light_vector_new(
         "{{ d.name }}",
         "{{ v.name }}",
         {{ v.state }},
-        {{ d.name|lower }}_{{ v.name|lower }}_props,
-        &{{ d.name|lower }}_{{ v.name|lower }}_opts
+        {{ v.symbol }}_props,
+        &{{ v.symbol }}_opts
     );
-{%-     elif v.type == 'switch' %}
-    vector_{{ d.name|lower }}_{{ v.name|lower }} = nyx_switch_vector_new(
+{%-   elif v.type == 'switch' %}
+    vector_{{ v.symbol }} = nyx_switch_vector_new(
         "{{ d.name }}",
         "{{ v.name }}",
         {{ v.state }},
         {{ v.perm }},
         {{ v.rule }},
-        {{ d.name|lower }}_{{ v.name|lower }}_props,
-        &{{ d.name|lower }}_{{ v.name|lower }}_opts
+        {{ v.symbol }}_props,
+        &{{ v.symbol }}_opts
     );
-{%-     elif v.type == 'blob' %}
-    vector_{{ d.name|lower }}_{{ v.name|lower }} = nyx_blob_vector_new(
+{%-   elif v.type == 'blob' %}
+    vector_{{ v.symbol }} = nyx_blob_vector_new(
         "{{ d.name }}",
         "{{ v.name }}",
         {{ v.state }},
         {{ v.perm }},
-        {{ d.name|lower }}_{{ v.name|lower }}_props,
-        &{{ d.name|lower }}_{{ v.name|lower }}_opts
+        {{ v.symbol }}_props,
+        &{{ v.symbol }}_opts
     );
-{%-     elif v.type == 'stream' %}
-    vector_{{ d.name|lower }}_{{ v.name|lower }} = nyx_stream_vector_new(
+{%-   elif v.type == 'stream' %}
+    vector_{{ v.symbol }} = nyx_stream_vector_new(
         "{{ d.name }}",
         "{{ v.name }}",
         {{ v.state }},
-        {{ d.name|lower }}_{{ v.name|lower }}_props,
-        &{{ d.name|lower }}_{{ v.name|lower }}_opts
+        {{ v.symbol }}_props,
+        &{{ v.symbol }}_opts
     );
-{%-     endif -%}
-{%-     if d.disabled|default(false) or v.disabled|default(false) %}
+{%-   endif -%}
+{%-   if d.disabled|default(false) or v.disabled|default(false) %}
 
-    vector_{{ d.name|lower }}_{{ v.name|lower }}->base.flags |= NYX_FLAGS_DISABLED;
-{%-     endif %}
-{%-   endfor -%}
+    vector_{{ v.symbol }}->base.flags |= NYX_FLAGS_DISABLED;
+{%-   endif %}
+{%- endfor -%}
+'''[1:]
+
+        ################################################################################################################
+
+        template = '''
+/* !!! AUTOGENERATED FILE !!! */
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+#include "glue.{{ head_ext }}"
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+{%  for fragment in definitions -%}
+{{ fragment }}
+{%- endfor %}
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+void nyx_glue_initialize()
+{
+    /*----------------------------------------------------------------------------------------------------------------*/
+    /* INITIALIZE VECTORS                                                                                             */
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+{%- for fragment in initializations -%}
+{{ fragment }}
 {%- endfor %}
 
     /*----------------------------------------------------------------------------------------------------------------*/
@@ -494,7 +635,7 @@ void nyx_device_initialize(nyx_node_t *node)
     /* INITIALIZE HARDWARE                                                                                            */
     /*----------------------------------------------------------------------------------------------------------------*/
 {%  for d in devices %}
-    device_{{ d.name|lower }}_initialize(node);
+    device_{{ d.ident }}_initialize(node);
 {%- endfor %}
 
     /*----------------------------------------------------------------------------------------------------------------*/
@@ -508,23 +649,133 @@ void nyx_device_finalize(nyx_node_t *node)
     /* FINALIZE HARDWARE                                                                                              */
     /*----------------------------------------------------------------------------------------------------------------*/
 {%  for d in devices %}
-    device_{{ d.name|lower }}_finalize(node);
+    device_{{ d.ident }}_finalize(node);
 {%- endfor %}
 
     /*----------------------------------------------------------------------------------------------------------------*/
 }
 
 /*--------------------------------------------------------------------------------------------------------------------*/
+{%- for fragment in lookups %}
+{{ fragment }}
+/*--------------------------------------------------------------------------------------------------------------------*/
+{%- endfor %}
 '''[1:]
 
         filename = os.path.join(self._driver_path, 'src', 'autogen', f'glue.{self._src_ext}')
 
-        with open(filename, 'wt', encoding = 'utf-8') as f:
+        self.render_file(
+            filename,
+            template,
+            devices = self._devices,
+            definitions = [self.render_fragment(template_definitions, d = device) for device in self._devices],
+            initializations = [self.render_fragment(template_initializations, d = device) for device in self._devices],
+            lookups = self._render_lookups()
+        )
 
-            f.write(self.render(
-                template,
-                devices = self._devices
-            ))
+    ####################################################################################################################
+
+    def _render_lookups(self) -> list:
+
+        ################################################################################################################
+
+        if not self._descr.get('lookupTables', False):
+
+            return []
+
+        ################################################################################################################
+
+        template_hash = '''
+
+#define GLUE_HASH_BASIS 0x811C9DC5U
+
+#define GLUE_HASH_PRIME 0x01000193U
+
+static uint32_t glue_hash(STR_t s1, STR_t s2, uint32_t h)
+{
+    for(; *s1 != '\\0'; s1++)
+    {
+        h = (h ^ (uint8_t) *s1) * GLUE_HASH_PRIME;
+    }
+
+    if(s2 != {{ null }})
+    {
+        h *= GLUE_HASH_PRIME;
+
+        for(; *s2 != '\\0'; s2++)
+        {
+            h = (h ^ (uint8_t) *s2) * GLUE_HASH_PRIME;
+        }
+    }
+
+    h ^= h >> 16;
+    h *= 0x85EBCA6BU;
+    h ^= h >> 13;
+    h *= 0xC2B2AE35U;
+    h ^= h >> 16;
+
+    return h;
+}
+'''[1:]
+
+        ################################################################################################################
+
+        template_device = '''
+
+nyx_dict_t *device_{{ d.ident }}_find_vector(STR_t name)
+{
+{%- if vector_slots %}
+    static const uint32_t seeds[] = {
+{%-   for row in vector_seeds|batch(8) %}
+        {{ row|join(', ') }},
+{%-   endfor %}
+    };
+
+    static const struct { STR_t name; nyx_dict_t **vector; } slots[] = {
+{%-   for v in vector_slots %}
+        {"{{ v.name }}", &vector_{{ v.symbol }}},
+{%-   endfor %}
+    };
+
+    uint32_t seed = seeds[glue_hash(name, {{ null }}, GLUE_HASH_BASIS) % {{ vector_seeds|length }}];
+
+    uint32_t i = glue_hash(name, {{ null }}, seed) % {{ vector_slots|length }};
+
+    return strcmp(slots[i].name, name) == 0 ? *slots[i].vector : {{ null }};
+{%- else %}
+    return {{ null }};
+{%- endif %}
+}
+
+nyx_dict_t *device_{{ d.ident }}_find_prop(STR_t vector, STR_t name)
+{
+{%- if prop_slots %}
+    static const uint32_t seeds[] = {
+{%-   for row in prop_seeds|batch(8) %}
+        {{ row|join(', ') }},
+{%-   endfor %}
+    };
+
+    static const struct { STR_t vector; STR_t name; nyx_dict_t **prop; } slots[] = {
+{%-   for v, df in prop_slots %}
+        {"{{ v.name }}", "{{ df.name }}", &vector_{{ df.symbol }}},
+{%-   endfor %}
+    };
+
+    uint32_t seed = seeds[glue_hash(vector, name, GLUE_HASH_BASIS) % {{ prop_seeds|length }}];
+
+    uint32_t i = glue_hash(vector, name, seed) % {{ prop_slots|length }};
+
+    return strcmp(slots[i].name, name) == 0 && strcmp(slots[i].vector, vector) == 0 ? *slots[i].prop : {{ null }};
+{%- else %}
+    return {{ null }};
+{%- endif %}
+}
+'''[1:]
+
+        ################################################################################################################
+
+        return [self.render_fragment(template_hash)] + [self.render_fragment(template_device, d = device, **build_device_lookups(device)) for device in self._devices]
 
     ####################################################################################################################
 
@@ -539,34 +790,13 @@ void nyx_device_finalize(nyx_node_t *node)
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-{%- set ns = namespace(any_callbacks = false) -%}
-
 {%- for v in device.vectors -%}
 {%-   for df in v.defs if df.callback -%}
-{#-     ------------------------------------------------------------------------------------------------------------ -#}
-{%-     set ns.any_callbacks = true -%}
 {#-     ------------------------------------------------------------------------------------------------------------- #}
-{%      if v.type == 'number' -%}
-{%          set subtype = get_number_type(df.format) -%}
-{%-         if subtype == NYX_NUMBER_INT %}
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def, int new_value, int old_value)
-{%-         elif subtype == NYX_NUMBER_UINT %}
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def, unsigned int new_value, unsigned int old_value)
-{%-         elif subtype == NYX_NUMBER_LONG %}
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def, long new_value, long old_value)
-{%-         elif subtype == NYX_NUMBER_ULONG %}
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def, unsigned long new_value, unsigned long old_value)
-{%-         elif subtype == NYX_NUMBER_DOUBLE %}
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def, double new_value, double old_value)
-{%-         endif -%}
-{%-     elif v.type == 'text' %}
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def, STR_t new_value, STR_t old_value)
-{%-     elif v.type == 'light' %}
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def, int new_value, int old_value)
-{%-     elif v.type == 'switch' %}
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def, int new_value, int old_value)
-{%-     elif v.type == 'switch' %}
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def, size_t size, BUFF_t buff)
+{%      if v.type == 'blob' %}
+static bool _{{ df.local_symbol }}_callback(nyx_dict_t *vector, nyx_dict_t *def, size_t size, BUFF_t buff)
+{%-     else %}
+static bool _{{ df.local_symbol }}_callback(nyx_dict_t *vector, nyx_dict_t *def, {{ df.ctype }} new_value, {{ df.ctype }} old_value)
 {%-     endif %}
 {
     /* TO BE IMPLEMENTED */
@@ -579,54 +809,31 @@ static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector,
 {%-   endfor -%}
 
 {%-   if v.callback and v.type != 'stream' -%}
-{#-     ------------------------------------------------------------------------------------------------------------ -#}
-{%-     set ns.any_callbacks = true -%}
 {#-     ------------------------------------------------------------------------------------------------------------- #}
 
-static void _{{ v.name|lower }}_callback(nyx_dict_t *vector, bool modified)
+static void _{{ v.ident }}_callback(nyx_dict_t *vector, bool modified)
 {
     /* TO BE IMPLEMENTED */
 }
 {%-   endif -%}
 {%- endfor -%}
 
-{%- if not ns.any_callbacks %}
+{%- if not device.has_callbacks %}
 
 /* TO BE IMPLEMENTED */
 {%- endif %}
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-void device_{{ device.name|lower }}_initialize(nyx_node_t *node)
+void device_{{ device.ident }}_initialize(nyx_node_t *node)
 {
 {%- for v in device.vectors -%}
 {%-   for df in v.defs if df.callback %}
-{%-     if v.type == 'number' -%}
-{%          set subtype = get_number_type(df.format) -%}
-{%-         if subtype == NYX_NUMBER_INT %}
-    vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._int = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-         elif subtype == NYX_NUMBER_UINT %}
-    vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._uint = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-         elif subtype == NYX_NUMBER_LONG %}
-    vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._long = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-         elif subtype == NYX_NUMBER_ULONG %}
-    vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._ulong = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-         elif subtype == NYX_NUMBER_DOUBLE %}
-    vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._double = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-         endif -%}
-{%-     elif v.type == 'text' %}
-    vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._str = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-     elif v.type == 'light' %}
-    vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._int = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-     elif v.type == 'switch' %}
-    vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._int = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-     elif v.type == 'blob' %}
-    vector_{{ device.name|lower }}_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._blob = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-     endif -%}
+    vector_{{ df.symbol }}->base.in_callback._{{ df.callback_field }} = _{{ df.local_symbol }}_callback;
 {%-   endfor -%}
 {%-   if v.callback and v.type != 'stream' %}
 
-    vector_{{ device.name|lower }}_{{ v.name|lower }}->base.in_callback._vector = _{{ v.name|lower }}_callback;
+    vector_{{ v.symbol }}->base.in_callback._vector = _{{ v.ident }}_callback;
 {%    endif -%}
 {%- endfor %}
     /* TO BE IMPLEMENTED */
@@ -634,7 +841,7 @@ void device_{{ device.name|lower }}_initialize(nyx_node_t *node)
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-void device_{{ device.name|lower }}_finalize(nyx_node_t *node)
+void device_{{ device.ident }}_finalize(nyx_node_t *node)
 {
     /* TO BE IMPLEMENTED */
 }
@@ -644,15 +851,14 @@ void device_{{ device.name|lower }}_finalize(nyx_node_t *node)
 
         for device in self._devices:
 
-            filename = os.path.join(self._driver_path, 'src', f'device_{device["name"].lower()}.{self._src_ext}')
+            filename = os.path.join(self._driver_path, 'src', f'device_{device.ident}.{self._src_ext}')
 
             if self._override_device or not os.path.isfile(filename):
 
-                with open(filename, 'wt', encoding = 'utf-8') as f:
-
-                    f.write(self.render(
-                        template,
-                        device = device
-                    ))
+                self.render_file(
+                    filename,
+                    template,
+                    device = device
+                )
 
 ########################################################################################################################
@@ -2,13 +2,19 @@
 ########################################################################################################################
 
 import os
+import re
 
 ########################################################################################################################
 
+from ..lookup import build_device_lookups
 from ..abstract_generator import AbstractGenerator, generator_config
 
 ########################################################################################################################
 
+PUBLISH_INTERVAL = 10
+
+########################################################################################################################
+
 @generator_config(name = 'posix-c++', null = 'nullptr', src_ext = 'cpp', head_ext = 'hpp')
 class PosixCPPGenerator(AbstractGenerator):
 
@@ -31,6 +37,10 @@ class PosixCPPGenerator(AbstractGenerator):
         self._generate_credentials()
         self._generate_main()
 
+        if self._descr.get('deviceThreads', False):
+
+            self._generate_worker()
+
     ####################################################################################################################
 
     def _generate_cmake(self) -> None:
@@ -38,7 +48,7 @@ class PosixCPPGenerator(AbstractGenerator):
         template = '''
 ########################################################################################################################
 
-cmake_minimum_required(VERSION 3.5)
+cmake_minimum_required(VERSION 3.9)
 
 ########################################################################################################################
 
@@ -46,18 +56,23 @@ project({{ descr.nodeName|lower }} CXX)
 
 set(CMAKE_CXX_STANDARD 17)
 
-add_compile_options(-Wall -Wno-unknown-pragmas -Wno-unused-function -O0 -g)
+add_compile_options(-Wall -Wno-unknown-pragmas -Wno-unused-function)
 
+{{ build }}
 ########################################################################################################################
 
 find_package(NyxNode REQUIRED)
+{%- if descr.deviceThreads|default(false) %}
+
+find_package(Threads REQUIRED)
+{%- endif %}
 
 ########################################################################################################################
 
 set(SOURCE_FILES
 {%- for d in devices %}
-    ./src/autogen/glue_{{ d.name|lower }}.{{ src_ext }}
-    ./src/device_{{ d.name|lower }}.{{ src_ext }}
+    ./src/autogen/glue_{{ d.ident }}.{{ src_ext }}
+    ./src/device_{{ d.ident }}.{{ src_ext }}
 {%- endfor %}
     ./src/driver.{{ src_ext }}
     ./src/main.{{ src_ext }}
@@ -69,7 +84,7 @@ add_executable({{ descr.nodeName|lower }} ${SOURCE_FILES})
 
 target_include_directories({{ descr.nodeName|lower }} PRIVATE ${NYXNODE_INCLUDE_DIR} ./include)
 
-target_link_libraries({{ descr.nodeName|lower }} PRIVATE NyxNode::nyx-node-{{ 'static' if descr.static else 'shared' }})
+target_link_libraries({{ descr.nodeName|lower }} PRIVATE NyxNode::nyx-node-{{ 'static' if descr.static else 'shared' }}{% if descr.deviceThreads|default(false) %} Threads::Threads{% endif %})
 
 ########################################################################################################################
 '''[1:]
@@ -78,12 +93,12 @@ target_link_libraries({{ descr.nodeName|lower }} PRIVATE NyxNode::nyx-node-{{ 's
 
         if self._override_cmake or not os.path.isfile(filename):
 
-            with open(filename, 'wt', encoding = 'utf-8') as f:
-
-                f.write(self.render(
-                    template,
-                    devices = self._devices
-                ))
+            self.render_file(
+                filename,
+                template,
+                devices = self._devices,
+                build = self._render_cmake_build('CXX')
+            )
 
     ####################################################################################################################
 
@@ -92,12 +107,16 @@ target_link_libraries({{ descr.nodeName|lower }} PRIVATE NyxNode::nyx-node-{{ 's
         template = '''
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-#ifndef NYX_{{ descr.nodeName|upper }}_{{ device.name|upper }}_{{ head_ext|upper }}
-#define NYX_{{ descr.nodeName|upper }}_{{ device.name|upper }}_{{ head_ext|upper }}
+#ifndef NYX_{{ descr.nodeName|upper }}_{{ device.upper_ident }}_{{ head_ext|upper }}
+#define NYX_{{ descr.nodeName|upper }}_{{ device.upper_ident }}_{{ head_ext|upper }}
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 
 #include <nyx_node.hpp>
+{%- if descr.deviceThreads|default(false) %}
+
+#include "worker.{{ head_ext }}"
+{%- endif %}
 {%- if (device.additionalHeaders|default('')|trim)|length > 0 %}
 
 {{ device.additionalHeaders|trim }}
@@ -109,12 +128,12 @@ namespace nyx_{{ descr.nodeName|lower }} {
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-class Device{{ device.name|pascalcase }} : public {% if (device.parentClass|default('')|trim)|length > 0 %}"{{ device.parentClass|trim }}"{% else %}Nyx::BaseDevice{% endif %}
+class Device{{ device.pascal_ident }} : public {% if (device.parentClass|default('')|trim)|length > 0 %}"{{ device.parentClass|trim }}"{% else %}Nyx::BaseDevice{% endif %}
 {
 public:
     /*----------------------------------------------------------------------------------------------------------------*/
 
-    Device{{ device.name|pascalcase }}();
+    Device{{ device.pascal_ident }}();
 
     /*----------------------------------------------------------------------------------------------------------------*/
 
@@ -122,47 +141,58 @@ public:
     {
         return "{{ device.name }}";
     }
+{%- if descr.lookupTables|default(false) %}
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    nyx_dict_t *findVector(STR_t vectorName) const;
+
+    nyx_dict_t *findProp(STR_t vectorName, STR_t propName) const;
+{%- endif %}
 
     /*----------------------------------------------------------------------------------------------------------------*/
 {%  for v in device.vectors -%}
 {%-   for df in v.defs if df.callback %}
 
-{%-     if v.type == 'number' -%}
-{%          set subtype = get_number_type(df.format) -%}
-{%-         if subtype == NYX_NUMBER_INT %}
-    bool on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(nyx_dict_t *vector, nyx_dict_t *def, int newValue, int oldValue);
-{%-         elif subtype == NYX_NUMBER_UINT %}
-    bool on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(nyx_dict_t *vector, nyx_dict_t *def, unsigned int newValue, unsigned int oldValue);
-{%-         elif subtype == NYX_NUMBER_LONG %}
-    bool on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(nyx_dict_t *vector, nyx_dict_t *def, long newValue, long oldValue);
-{%-         elif subtype == NYX_NUMBER_ULONG %}
-    bool on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(nyx_dict_t *vector, nyx_dict_t *def, unsigned long newValue, unsigned long oldValue);
-{%-         elif subtype == NYX_NUMBER_DOUBLE %}
-    bool on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(nyx_dict_t *vector, nyx_dict_t *def, double newValue, double oldValue);
-{%-         endif %}
-{%-     elif v.type == 'text' %}
-    bool on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(nyx_dict_t *vector, nyx_dict_t *def, STR_t newValue, STR_t oldValue);
-{%-     elif v.type == 'switch' %}
-    bool on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(nyx_dict_t *vector, nyx_dict_t *def, int newValue, int oldValue);
-{%-     elif v.type == 'light' %}
-    bool on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(nyx_dict_t *vector, nyx_dict_t *def, int newValue, int oldValue);
+{%-     if descr.deviceThreads|default(false) and v.type == 'blob' %}
+    void on{{ df.pascal_symbol }}Changed(size_t size, BUFF_t buff);
+{%-     elif descr.deviceThreads|default(false) %}
+    void on{{ df.pascal_symbol }}Changed({{ df.ctype }} newValue, {{ df.ctype }} oldValue);
 {%-     elif v.type == 'blob' %}
-    bool on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(nyx_dict_t *vector, nyx_dict_t *def, size_t size, BUFF_t buff);
+    bool on{{ df.pascal_symbol }}Changed(nyx_dict_t *vector, nyx_dict_t *def, size_t size, BUFF_t buff);
+{%-     else %}
+    bool on{{ df.pascal_symbol }}Changed(nyx_dict_t *vector, nyx_dict_t *def, {{ df.ctype }} newValue, {{ df.ctype }} oldValue);
 {%-     endif %}
 {%-   endfor %}
-{%-   if v.callback and v.type != 'stream' %}
-    void on{{ v.name|pascalcase }}Changed(nyx_dict_t *vector, bool modified);
+{%-   if v.callback and v.type != 'stream' and descr.deviceThreads|default(false) %}
+    void on{{ v.pascal_ident }}Changed(bool modified);
+{%-   elif v.callback and v.type != 'stream' %}
+    void on{{ v.pascal_ident }}Changed(nyx_dict_t *vector, bool modified);
 {%-   endif %}
 {% endfor %}
     /*----------------------------------------------------------------------------------------------------------------*/
+{%- if descr.deviceThreads|default(false) %}
+{%-   if device.vectors|selectattr('type', 'in', ['number', 'text', 'light', 'switch'])|first is defined %}
+{%    for v in device.vectors if v.type in ['number', 'text', 'light', 'switch'] %}
+{%-     for df in v.defs %}
+    void publish{{ df.pascal_symbol }}({{ df.ctype }} value);
+{%-     endfor %}
+{% endfor %}
+    /*----------------------------------------------------------------------------------------------------------------*/
+{%-   endif %}
+
+    DeviceWorker worker;
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+{%- endif %}
 
 protected:
     /*----------------------------------------------------------------------------------------------------------------*/
 {%  for v in device.vectors %}
 {%-   for df in v.defs %}
-    nyx_dict_t *vector_{{ v.name|lower }}_{{ df.name|lower }} = {{ null }};
+    nyx_dict_t *vector_{{ df.local_symbol }} = {{ null }};
 {%-   endfor %}
-    nyx_dict_t *vector_{{ v.name|lower }} = {{ null }};
+    nyx_dict_t *vector_{{ v.ident }} = {{ null }};
 {% endfor %}
     /*----------------------------------------------------------------------------------------------------------------*/
 
@@ -176,6 +206,12 @@ private:
     void initialize(nyx_node_t *node) override;
 
     void finalize(nyx_node_t *node) override;
+{%- if descr.deviceThreads|default(false) %}
+
+    void onInitialize(nyx_node_t *node);
+
+    void onFinalize(nyx_node_t *node);
+{%- endif %}
 
     /*----------------------------------------------------------------------------------------------------------------*/
 };
@@ -186,23 +222,66 @@ private:
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-#endif /* NYX_{{ descr.nodeName|upper }}_{{ device.name|upper }}_{{ head_ext|upper }} */
+#endif /* NYX_{{ descr.nodeName|upper }}_{{ device.upper_ident }}_{{ head_ext|upper }} */
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 '''[1:]
 
         for device in self._devices:
 
-            filename = os.path.join(self._driver_path, 'include', f'device_{device["name"].lower()}.{self._head_ext}')
+            filename = os.path.join(self._driver_path, 'include', f'device_{device.ident}.{self._head_ext}')
 
             if self._override_device or not os.path.isfile(filename):
 
-                with open(filename, 'wt', encoding = 'utf-8') as f:
+                self.render_file(
+                    filename,
+                    template,
+                    device = device
+                )
+
+            else:
+
+                self._check_device_header(filename, template, device)
+
+    ####################################################################################################################
+
+    def _check_device_header(self, filename: str, template: str, device) -> None:
 
-                    f.write(self.render(
-                        template,
-                        device = device
-                    ))
+        ################################################################################################################
+        # THE GLUE IS ALWAYS REGENERATED, THE DEVICE HEADER IS NOT: CHECK THAT IT DECLARES WHAT THE GLUE OPTIONS NEED  #
+        ################################################################################################################
+
+        names = []
+
+        if self._descr.get('lookupTables', False):
+
+            names += ['findVector', 'findProp']
+
+        if self._descr.get('deviceThreads', False):
+
+            names += [r'publish\w+', r'on\w+Changed', 'onInitialize', 'onFinalize', 'DeviceWorker', 'worker']
+
+        if not names:
+
+            return
+
+        ################################################################################################################
+
+        pattern = re.compile(r'\b(?:' + '|'.join(names) + r')\b')
+
+        with open(filename, 'rt', encoding = 'utf-8') as f:
+
+            existing = {' '.join(line.split()) for line in f}
+
+        ################################################################################################################
+
+        for line in self.render(template, device = device).splitlines():
+
+            line = ' '.join(line.split())
+
+            if pattern.search(line) and line not in existing:
+
+                raise ValueError(f'{filename}: missing `{line}`, add it or regenerate the device files with --override-device')
 
     ####################################################################################################################
 
@@ -212,7 +291,16 @@ private:
 /* !!! AUTOGENERATED FILE !!! */
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-#include "../../include/device_{{ device.name|lower }}.{{ head_ext }}"
+#include "../../include/device_{{ device.ident }}.{{ head_ext }}"
+{%- if threads %}
+
+#include <string>
+#include <vector>
+{%- endif %}
+{%- if lookup %}
+
+#include <cstring>
+{%- endif %}
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 
@@ -223,42 +311,43 @@ namespace nyx_{{ descr.nodeName|lower }} {
 /*--------------------------------------------------------------------------------------------------------------------*/
 {%- for v in device.vectors -%}
 {%-   for df in v.defs if df.callback -%}
-{%-     if v.type == 'number' -%}
-{%-         set subtype = get_number_type(df.format) -%}
-{%-         if subtype == NYX_NUMBER_INT %}
+{%-     if v.type == 'blob' %}
 
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def, int new_value, int old_value)
-{%-         elif subtype == NYX_NUMBER_UINT %}
+static bool _{{ df.local_symbol }}_callback(nyx_dict_t *vector, nyx_dict_t *def, size_t size, BUFF_t buff)
+{%-     else %}
 
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def, unsigned int new_value, unsigned int old_value)
-{%-         elif subtype == NYX_NUMBER_LONG %}
+static bool _{{ df.local_symbol }}_callback(nyx_dict_t *vector, nyx_dict_t *def, {{ df.ctype }} new_value, {{ df.ctype }} old_value)
+{%-     endif %}
+{
+{%-     if threads %}
+    Device{{ device.pascal_ident }} *self = static_cast<Device{{ device.pascal_ident }} *>(vector->base.ctx);
+{%-       if v.type == 'blob' %}
 
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def, long new_value, long old_value)
-{%-         elif subtype == NYX_NUMBER_ULONG %}
+    std::vector<uint8_t> data((uint8_t *) buff, (uint8_t *) buff + size);
 
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def, unsigned long new_value, unsigned long old_value)
-{%-         elif subtype == NYX_NUMBER_DOUBLE %}
+    self->worker.post([self, data = std::move(data)]() mutable {
+        self->on{{ df.pascal_symbol }}Changed(data.size(), static_cast<BUFF_t>(data.data()));
+    });
+{%-       elif v.type == 'text' %}
 
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def, double new_value, double old_value)
-{%-         endif -%}
-{%-     elif v.type == 'text' %}
+    std::string new_text(new_value != {{ null }} ? new_value : "");
+    std::string old_text(old_value != {{ null }} ? old_value : "");
 
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def, STR_t new_value, STR_t old_value)
-{%-     elif v.type == 'switch' %}
+    self->worker.post([self, new_text = std::move(new_text), old_text = std::move(old_text)]() {
+        self->on{{ df.pascal_symbol }}Changed(new_text.c_str(), old_text.c_str());
+    });
+{%-       else %}
 
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def, int new_value, int old_value)
-{%-     elif v.type == 'light' %}
+    self->worker.post([self, new_value, old_value]() {
+        self->on{{ df.pascal_symbol }}Changed(new_value, old_value);
+    });
+{%-       endif %}
 
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def, int new_value, int old_value)
+    return true;
 {%-     elif v.type == 'blob' %}
-
-static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector, nyx_dict_t *def, size_t size, BUFF_t buff)
-{%-     endif %}
-{
-{%-     if v.type == 'blob' %}
-    return static_cast<Device{{ device.name|pascalcase }} *>(vector->base.ctx)->on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(vector, def, size, buff);
+    return static_cast<Device{{ device.pascal_ident }} *>(vector->base.ctx)->on{{ df.pascal_symbol }}Changed(vector, def, size, buff);
 {%-     else %}
-    return static_cast<Device{{ device.name|pascalcase }} *>(vector->base.ctx)->on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(vector, def, new_value, old_value);
+    return static_cast<Device{{ device.pascal_ident }} *>(vector->base.ctx)->on{{ df.pascal_symbol }}Changed(vector, def, new_value, old_value);
 {%-     endif %}
 }
 {%-   endfor %}
@@ -269,90 +358,115 @@ static bool _{{ v.name|lower }}_{{ df.name|lower }}_callback(nyx_dict_t *vector,
 /*--------------------------------------------------------------------------------------------------------------------*/
 {%- for v in device.vectors if v.callback and v.type != 'stream' %}
 
-static void _{{ v.name|lower }}_callback(nyx_dict_t *vector, bool modified)
+static void _{{ v.ident }}_callback(nyx_dict_t *vector, bool modified)
 {
-    Device{{ device.name|pascalcase }} *self = (Device{{ device.name|pascalcase }} *) vector->base.ctx;
+    Device{{ device.pascal_ident }} *self = (Device{{ device.pascal_ident }} *) vector->base.ctx;
 
     if(self != {{ null }})
     {
-        self->on{{ v.name|pascalcase }}Changed(vector, modified);
+{%-   if threads %}
+        self->worker.post([self, modified]() {
+            self->on{{ v.pascal_ident }}Changed(modified);
+        });
+{%-   else %}
+        self->on{{ v.pascal_ident }}Changed(vector, modified);
+{%-   endif %}
     }
 }
 {%- endfor %}
+{%- if threads %}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+/* PUBLISH HELPERS                                                                                                    */
+/*--------------------------------------------------------------------------------------------------------------------*/
+{%-   for v in device.vectors if v.type in ['number', 'text', 'light', 'switch'] %}
+{%-     for df in v.defs %}
+
+void Device{{ device.pascal_ident }}::publish{{ df.pascal_symbol }}({{ df.ctype }} value)
+{
+{%-       if v.type == 'number' %}
+    this->worker.publish([this, value]() {
+        nyx_number_prop_set_{{ df.number.suffix }}(this->vector_{{ df.local_symbol }}, value);
+    });
+{%-       elif v.type == 'text' %}
+    this->worker.publish([this, text = std::string(value != {{ null }} ? value : "")]() {
+        nyx_text_prop_set(this->vector_{{ df.local_symbol }}, text.c_str());
+    });
+{%-       elif v.type == 'light' %}
+    this->worker.publish([this, value]() {
+        nyx_light_prop_set(this->vector_{{ df.local_symbol }}, static_cast<nyx_state_t>(value));
+    });
+{%-       elif v.type == 'switch' %}
+    this->worker.publish([this, value]() {
+        nyx_switch_prop_set(this->vector_{{ df.local_symbol }}, static_cast<nyx_onoff_t>(value));
+    });
+{%-       endif %}
+}
+{%-     endfor %}
+{%-   endfor %}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+/* WORKER                                                                                                             */
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+void Device{{ device.pascal_ident }}::initialize(nyx_node_t *node)
+{
+    this->worker.start(node);
+
+    this->onInitialize(node);
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+void Device{{ device.pascal_ident }}::finalize(nyx_node_t *node)
+{
+    this->onFinalize(node);
+
+    this->worker.stop();
+}
+{%- endif %}
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 /* GLUE                                                                                                               */
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-void Device{{ device.name|pascalcase }}::glueInitialize()
+void Device{{ device.pascal_ident }}::glueInitialize()
 {
 {%- for v in device.vectors %}
     /*----------------------------------------------------------------------------------------------------------------*/
-    /* VECTOR {{ device.name|upper }}::{{ v.name|upper }} */
+    /* VECTOR {{ device.upper_ident }}::{{ v.upper_ident }} */
     /*----------------------------------------------------------------------------------------------------------------*/
 {%    for df in v.defs -%}
-{%-     if v.type == 'number' -%}
-{%-         set subtype = get_number_type(df.format) -%}
-{%-         if subtype == NYX_NUMBER_INT %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }} = nyx_number_prop_new_int("{{ df.name }}", {% if (df.label|default('')|trim)|length > 0 %}"{{ df.label|trim }}"{% else %}{{ null }}{% endif %}, "{{ df.format }}", {{ df.min }}, {{ df.max }}, {{ df.step }}, {{ df.value }});
-{%-         elif subtype == NYX_NUMBER_UINT %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }} = nyx_number_prop_new_uint("{{ df.name }}", {% if (df.label|default('')|trim)|length > 0 %}"{{ df.label|trim }}"{% else %}{{ null }}{% endif %}, "{{ df.format }}", {{ df.min }}, {{ df.max }}, {{ df.step }}, {{ df.value }});
-{%-         elif subtype == NYX_NUMBER_LONG %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }} = nyx_number_prop_new_long("{{ df.name }}", {% if (df.label|default('')|trim)|length > 0 %}"{{ df.label|trim }}"{% else %}{{ null }}{% endif %}, "{{ df.format }}", {{ df.min }}, {{ df.max }}, {{ df.step }}, {{ df.value }});
-{%-         elif subtype == NYX_NUMBER_ULONG %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }} = nyx_number_prop_new_ulong("{{ df.name }}", {% if (df.label|default('')|trim)|length > 0 %}"{{ df.label|trim }}"{% else %}{{ null }}{% endif %}, "{{ df.format }}", {{ df.min }}, {{ df.max }}, {{ df.step }}, {{ df.value }});
-{%-         elif subtype == NYX_NUMBER_DOUBLE %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }} = nyx_number_prop_new_double("{{ df.name }}", {% if (df.label|default('')|trim)|length > 0 %}"{{ df.label|trim }}"{% else %}{{ null }}{% endif %}, "{{ df.format }}", {{ df.min }}, {{ df.max }}, {{ df.step }}, {{ df.value }});
-{%-         endif -%}
+{%-     if v.type == 'number' %}
+    this->vector_{{ df.local_symbol }} = nyx_number_prop_new_{{ df.number.suffix }}("{{ df.name }}", {% if (df.label|default('')|trim)|length > 0 %}"{{ df.label|trim }}"{% else %}{{ null }}{% endif %}, "{{ df.format }}", {{ df.min }}, {{ df.max }}, {{ df.step }}, {{ df.value }});
 {%-     elif v.type == 'text' %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }} = nyx_text_prop_new("{{ df.name }}", {% if (df.label|default('')|trim)|length > 0 %}"{{ df.label|trim }}"{% else %}{{ null }}{% endif %}, "{{ df.value }}");
+    this->vector_{{ df.local_symbol }} = nyx_text_prop_new("{{ df.name }}", {% if (df.label|default('')|trim)|length > 0 %}"{{ df.label|trim }}"{% else %}{{ null }}{% endif %}, "{{ df.value }}");
 {%-     elif v.type == 'light' %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }} = nyx_light_prop_new("{{ df.name }}", {% if (df.label|default('')|trim)|length > 0 %}"{{ df.label|trim }}"{% else %}{{ null }}{% endif %}, {{ df.value }});
+    this->vector_{{ df.local_symbol }} = nyx_light_prop_new("{{ df.name }}", {% if (df.label|default('')|trim)|length > 0 %}"{{ df.label|trim }}"{% else %}{{ null }}{% endif %}, {{ df.value }});
 {%-     elif v.type == 'switch' %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }} = nyx_switch_prop_new("{{ df.name }}", {% if (df.label|default('')|trim)|length > 0 %}"{{ df.label|trim }}"{% else %}{{ null }}{% endif %}, {{ df.value }});
+    this->vector_{{ df.local_symbol }} = nyx_switch_prop_new("{{ df.name }}", {% if (df.label|default('')|trim)|length > 0 %}"{{ df.label|trim }}"{% else %}{{ null }}{% endif %}, {{ df.value }});
 {%-     elif v.type == 'blob' %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }} = nyx_blob_prop_new("{{ df.name }}", {% if (df.label|default('')|trim)|length > 0 %}"{{ df.label|trim }}"{% else %}{{ null }}{% endif %}, "{{ df.format }}", {{ df.value }});
+    this->vector_{{ df.local_symbol }} = nyx_blob_prop_new("{{ df.name }}", {% if (df.label|default('')|trim)|length > 0 %}"{{ df.label|trim }}"{% else %}{{ null }}{% endif %}, "{{ df.format }}", {{ df.value }});
 {%-     elif v.type == 'stream' %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }} = nyx_stream_prop_new("{{ df.name }}", {% if (df.label|default('')|trim)|length > 0 %}"{{ df.label|trim }}"{% else %}{{ null }}{% endif %});
+    this->vector_{{ df.local_symbol }} = nyx_stream_prop_new("{{ df.name }}", {% if (df.label|default('')|trim)|length > 0 %}"{{ df.label|trim }}"{% else %}{{ null }}{% endif %});
 {%-     endif %}
-{%-     if df.callback -%}
-{%-       if v.type == 'number' -%}
-{%-           set subtype = get_number_type(df.format) -%}
-{%            if subtype == NYX_NUMBER_INT %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._int = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-           elif subtype == NYX_NUMBER_UINT %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._uint = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-           elif subtype == NYX_NUMBER_LONG %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._long = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-           elif subtype == NYX_NUMBER_ULONG %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._ulong = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-           elif subtype == NYX_NUMBER_DOUBLE %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._double = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-           endif %}
-{%-       elif v.type == 'text' %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._str = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-       elif v.type == 'light' %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._int = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-       elif v.type == 'switch' %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._int = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-       elif v.type == 'blob' %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }}->base.in_callback._blob = _{{ v.name|lower }}_{{ df.name|lower }}_callback;
-{%-       endif -%}
+{%-     if df.callback %}
+    this->vector_{{ df.local_symbol }}->base.in_callback._{{ df.callback_field }} = _{{ df.local_symbol }}_callback;
 {%-     endif %}
-    this->vector_{{ v.name|lower }}_{{ df.name|lower }}->base.ctx = static_cast<void *>(this);
+    this->vector_{{ df.local_symbol }}->base.ctx = static_cast<void *>(this);
 {%    endfor %}
     /*----------------------------------------------------------------------------------------------------------------*/
 
-    static nyx_dict_t *{{ v.name|lower }}_props[] = {
+    static nyx_dict_t *{{ v.ident }}_props[] = {
 {%-     for df in v.defs %}
-        this->vector_{{ v.name|lower }}_{{ df.name|lower }},
+        this->vector_{{ df.local_symbol }},
 {%-    endfor %}
         {{ null }},
     };
 
     /*----------------------------------------------------------------------------------------------------------------*/
 
-    nyx_opts_t {{ v.name|lower }}_opts = {
+    nyx_opts_t {{ v.ident }}_opts = {
         .group = {% if (v.group|default('')|trim)|length > 0 %}"{{ v.group|trim }}"{% else %}{{ null }}{% endif %},
         .label = {% if (v.label|default('')|trim)|length > 0 %}"{{ v.label|trim }}"{% else %}{{ null }}{% endif %},
         .hints = {% if (v.hints|default('')|trim)|length > 0 %}"{{ v.hints|trim }}"{% else %}{{ null }}{% endif %},
@@ -362,75 +476,161 @@ void Device{{ device.name|pascalcase }}::glueInitialize()
 
     /*----------------------------------------------------------------------------------------------------------------*/
 {%    if v.type == 'number' %}
-    this->vector_{{ v.name|lower }} = nyx_number_vector_new(
+    this->vector_{{ v.ident }} = nyx_number_vector_new(
         this->name(),
         "{{ v.name }}",
         {{ v.state }},
         {{ v.perm }},
-        {{ v.name|lower }}_props,
-        &{{ v.name|lower }}_opts
+        {{ v.ident }}_props,
+        &{{ v.ident }}_opts
     );
 {%    elif v.type == 'text' %}
-    this->vector_{{ v.name|lower }} = nyx_text_vector_new(
+    this->vector_{{ v.ident }} = nyx_text_vector_new(
         this->name(),
         "{{ v.name }}",
         {{ v.state }},
         {{ v.perm }},
-        {{ v.name|lower }}_props,
-        &{{ v.name|lower }}_opts
+        {{ v.ident }}_props,
+        &{{ v.ident }}_opts
     );
 {%    elif v.type == 'light' %}
-    this->vector_{{ v.name|lower }} = nyx_light_vector_new(
+    this->vector_{{ v.ident }} = nyx_light_vector_new(
         this->name(),
         "{{ v.name }}",
         {{ v.state }},
-        {{ v.name|lower }}_props,
-        &{{ v.name|lower }}_opts
+        {{ v.ident }}_props,
+        &{{ v.ident }}_opts
     );
 {%    elif v.type == 'switch' %}
-    this->vector_{{ v.name|lower }} = nyx_switch_vector_new(
+    this->vector_{{ v.ident }} = nyx_switch_vector_new(
         this->name(),
         "{{ v.name }}",
         {{ v.state }},
         {{ v.perm }},
         {{ v.rule }},
-        {{ v.name|lower }}_props,
-        &{{ v.name|lower }}_opts
+        {{ v.ident }}_props,
+        &{{ v.ident }}_opts
     );
 {%    elif v.type == 'blob' %}
-    this->vector_{{ v.name|lower }} = nyx_blob_vector_new(
+    this->vector_{{ v.ident }} = nyx_blob_vector_new(
         this->name(),
         "{{ v.name }}",
         {{ v.state }},
         {{ v.perm }},
-        {{ v.name|lower }}_props,
-        &{{ v.name|lower }}_opts
+        {{ v.ident }}_props,
+        &{{ v.ident }}_opts
     );
 {%    elif v.type == 'stream' %}
-    this->vector_{{ v.name|lower }} = nyx_stream_vector_new(
+    this->vector_{{ v.ident }} = nyx_stream_vector_new(
         this->name(),
         "{{ v.name }}",
         {{ v.state }},
-        {{ v.name|lower }}_props,
-        &{{ v.name|lower }}_opts
+        {{ v.ident }}_props,
+        &{{ v.ident }}_opts
     );
 {%   endif %}
 {%- if v.callback and v.type != 'stream' %}
-    this->vector_{{ v.name|lower }}->base.in_callback._vector = _{{ v.name|lower }}_callback;
+    this->vector_{{ v.ident }}->base.in_callback._vector = _{{ v.ident }}_callback;
 {%-  endif %}
 {%- if device.disabled|default(false) or v.disabled|default(false) %}
-    this->vector_{{ v.name|lower }}->base.flags |= NYX_FLAGS_DISABLED;
+    this->vector_{{ v.ident }}->base.flags |= NYX_FLAGS_DISABLED;
 {%-   endif %}
-    this->vector_{{ v.name|lower }}->base.ctx = static_cast<void *>(this);
+    this->vector_{{ v.ident }}->base.ctx = static_cast<void *>(this);
 
     /*----------------------------------------------------------------------------------------------------------------*/
 
-    this->registerVector(this->vector_{{ v.name|lower }});
+    this->registerVector(this->vector_{{ v.ident }});
 {% endfor %}
     /*----------------------------------------------------------------------------------------------------------------*/
 }
 
 /*--------------------------------------------------------------------------------------------------------------------*/
+{%- if lookup %}
+/* LOOKUP                                                                                                             */
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+static uint32_t _lookup_hash(STR_t s1, STR_t s2, uint32_t h)
+{
+    for(; *s1 != '\\0'; s1++)
+    {
+        h = (h ^ (uint8_t) *s1) * 0x01000193U;
+    }
+
+    if(s2 != {{ null }})
+    {
+        h *= 0x01000193U;
+
+        for(; *s2 != '\\0'; s2++)
+        {
+            h = (h ^ (uint8_t) *s2) * 0x01000193U;
+        }
+    }
+
+    h ^= h >> 16;
+    h *= 0x85EBCA6BU;
+    h ^= h >> 13;
+    h *= 0xC2B2AE35U;
+    h ^= h >> 16;
+
+    return h;
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+nyx_dict_t *Device{{ device.pascal_ident }}::findVector(STR_t vectorName) const
+{
+{%-   if lookup.vector_slots %}
+    static const uint32_t seeds[] = {
+{%-     for row in lookup.vector_seeds|batch(8) %}
+        {{ row|join(', ') }},
+{%-     endfor %}
+    };
+
+    static const struct { STR_t name; nyx_dict_t *Device{{ device.pascal_ident }}::*vector; } slots[] = {
+{%-     for v in lookup.vector_slots %}
+        {"{{ v.name }}", &Device{{ device.pascal_ident }}::vector_{{ v.ident }}},
+{%-     endfor %}
+    };
+
+    uint32_t seed = seeds[_lookup_hash(vectorName, {{ null }}, 0x811C9DC5U) % {{ lookup.vector_seeds|length }}];
+
+    uint32_t i = _lookup_hash(vectorName, {{ null }}, seed) % {{ lookup.vector_slots|length }};
+
+    return strcmp(slots[i].name, vectorName) == 0 ? this->*slots[i].vector : {{ null }};
+{%-   else %}
+    return {{ null }};
+{%-   endif %}
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+nyx_dict_t *Device{{ device.pascal_ident }}::findProp(STR_t vectorName, STR_t propName) const
+{
+{%-   if lookup.prop_slots %}
+    static const uint32_t seeds[] = {
+{%-     for row in lookup.prop_seeds|batch(8) %}
+        {{ row|join(', ') }},
+{%-     endfor %}
+    };
+
+    static const struct { STR_t vector; STR_t name; nyx_dict_t *Device{{ device.pascal_ident }}::*prop; } slots[] = {
+{%-     for v, df in lookup.prop_slots %}
+        {"{{ v.name }}", "{{ df.name }}", &Device{{ device.pascal_ident }}::vector_{{ df.local_symbol }}},
+{%-     endfor %}
+    };
+
+    uint32_t seed = seeds[_lookup_hash(vectorName, propName, 0x811C9DC5U) % {{ lookup.prop_seeds|length }}];
+
+    uint32_t i = _lookup_hash(vectorName, propName, seed) % {{ lookup.prop_slots|length }};
+
+    return strcmp(slots[i].name, propName) == 0 && strcmp(slots[i].vector, vectorName) == 0 ? this->*slots[i].prop : {{ null }};
+{%-   else %}
+    return {{ null }};
+{%-   endif %}
+}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+{%- endif %}
 
 } /* namespace nyx_{{ descr.nodeName|lower }} */
 
@@ -439,14 +639,15 @@ void Device{{ device.name|pascalcase }}::glueInitialize()
 
         for device in self._devices:
 
-            filename = os.path.join(self._driver_path, 'src', 'autogen', f'glue_{device["name"].lower()}.{self._src_ext}')
+            filename = os.path.join(self._driver_path, 'src', 'autogen', f'glue_{device.ident}.{self._src_ext}')
 
-            with open(filename, 'wt', encoding = 'utf-8') as f:
-
-                f.write(self.render(
-                    template,
-                    device = device
-                ))
+            self.render_file(
+                filename,
+                template,
+                device = device,
+                lookup = build_device_lookups(device) if self._descr.get('lookupTables', False) else None,
+                threads = self._descr.get('deviceThreads', False)
+            )
 
     ####################################################################################################################
 
@@ -455,7 +656,7 @@ void Device{{ device.name|pascalcase }}::glueInitialize()
         template = '''
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-#include "../include/device_{{ device.name|lower }}.{{ head_ext }}"
+#include "../include/device_{{ device.ident }}.{{ head_ext }}"
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 
@@ -463,21 +664,21 @@ namespace nyx_{{ descr.nodeName|lower }} {
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-Device{{ device.name|pascalcase }}::Device{{ device.name|pascalcase }}()
+Device{{ device.pascal_ident }}::Device{{ device.pascal_ident }}()
 {
     this->glueInitialize();
 }
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-void Device{{ device.name|pascalcase }}::initialize(nyx_node_t *node)
+void Device{{ device.pascal_ident }}::{% if descr.deviceThreads|default(false) %}onInitialize{% else %}initialize{% endif %}(nyx_node_t *node)
 {
     /* TO BE IMPLEMENTED */
 }
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 
-void Device{{ device.name|pascalcase }}::finalize(nyx_node_t *node)
+void Device{{ device.pascal_ident }}::{% if descr.deviceThreads|default(false) %}onFinalize{% else %}finalize{% endif %}(nyx_node_t *node)
 {
     /* TO BE IMPLEMENTED */
 }
@@ -485,48 +686,32 @@ void Device{{ device.name|pascalcase }}::finalize(nyx_node_t *node)
 /*--------------------------------------------------------------------------------------------------------------------*/
 {%- for v in device.vectors -%}
 {%-   for df in v.defs if df.callback -%}
-{%-     if v.type == 'number' -%}
-{%-         set subtype = get_number_type(df.format) -%}
-{%-         if subtype == NYX_NUMBER_INT %}
-
-bool Device{{ device.name|pascalcase }}::on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(nyx_dict_t *vector, nyx_dict_t *def, int newValue, int oldValue)
-{%-         elif subtype == NYX_NUMBER_UINT %}
-
-bool Device{{ device.name|pascalcase }}::on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(nyx_dict_t *vector, nyx_dict_t *def, unsigned int newValue, unsigned int oldValue)
-{%-         elif subtype == NYX_NUMBER_LONG %}
+{%-     if descr.deviceThreads|default(false) and v.type == 'blob' %}
 
-bool Device{{ device.name|pascalcase }}::on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(nyx_dict_t *vector, nyx_dict_t *def, long newValue, long oldValue)
-{%-         elif subtype == NYX_NUMBER_ULONG %}
+void Device{{ device.pascal_ident }}::on{{ df.pascal_symbol }}Changed(size_t size, BUFF_t buff)
+{%-     elif descr.deviceThreads|default(false) %}
 
-bool Device{{ device.name|pascalcase }}::on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(nyx_dict_t *vector, nyx_dict_t *def, unsigned long newValue, unsigned long oldValue)
-{%-         elif subtype == NYX_NUMBER_DOUBLE %}
-
-bool Device{{ device.name|pascalcase }}::on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(nyx_dict_t *vector, nyx_dict_t *def, double newValue, double oldValue)
-{%-         endif %}
-{%-     elif v.type == 'text' %}
-
-bool Device{{ device.name|pascalcase }}::on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(nyx_dict_t *vector, nyx_dict_t *def, STR_t newValue, STR_t oldValue)
-{%-     elif v.type == 'switch' %}
-
-bool Device{{ device.name|pascalcase }}::on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(nyx_dict_t *vector, nyx_dict_t *def, int newValue, int oldValue)
-{%-     elif v.type == 'light' %}
-
-bool Device{{ device.name|pascalcase }}::on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(nyx_dict_t *vector, nyx_dict_t *def, int newValue, int oldValue)
+void Device{{ device.pascal_ident }}::on{{ df.pascal_symbol }}Changed({{ df.ctype }} newValue, {{ df.ctype }} oldValue)
 {%-     elif v.type == 'blob' %}
 
-bool Device{{ device.name|pascalcase }}::on{{ v.name|pascalcase }}{{ df.name|pascalcase }}Changed(nyx_dict_t *vector, nyx_dict_t *def, size_t size, BUFF_t buff)
+bool Device{{ device.pascal_ident }}::on{{ df.pascal_symbol }}Changed(nyx_dict_t *vector, nyx_dict_t *def, size_t size, BUFF_t buff)
+{%-     else %}
+
+bool Device{{ device.pascal_ident }}::on{{ df.pascal_symbol }}Changed(nyx_dict_t *vector, nyx_dict_t *def, {{ df.ctype }} newValue, {{ df.ctype }} oldValue)
 {%-     endif %}
 {
     /* TO BE IMPLEMENTED */
+{%-     if not descr.deviceThreads|default(false) %}
 
     return true;
+{%-     endif %}
 }
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 {%-   endfor -%}
 {%-   if v.callback and v.type != 'stream' %}
 
-void Device{{ device.name|pascalcase }}::on{{ v.name|pascalcase }}Changed(nyx_dict_t *vector, bool modified)
+void Device{{ device.pascal_ident }}::on{{ v.pascal_ident }}Changed({% if not descr.deviceThreads|default(false) %}nyx_dict_t *vector, {% endif %}bool modified)
 {
     /* TO BE IMPLEMENTED */
 }
@@ -542,16 +727,15 @@ void Device{{ device.name|pascalcase }}::on{{ v.name|pascalcase }}Changed(nyx_di
 
         for device in self._devices:
 
-            filename = os.path.join(self._driver_path, 'src', f'device_{device["name"].lower()}.{self._src_ext}')
+            filename = os.path.join(self._driver_path, 'src', f'device_{device.ident}.{self._src_ext}')
 
             if self._override_device or not os.path.isfile(filename):
 
-                with open(filename, 'wt', encoding = 'utf-8') as f:
-
-                    f.write(self.render(
-                        template,
-                        device = device
-                    ))
+                self.render_file(
+                    filename,
+                    template,
+                    device = device
+                )
 
     ####################################################################################################################
 
@@ -616,11 +800,10 @@ protected:
 
         if self._override_main or not os.path.isfile(filename):
 
-            with open(filename, 'wt', encoding = 'utf-8') as f:
-
-                f.write(self.render(
-                    template
-                ))
+            self.render_file(
+                filename,
+                template
+            )
 
     ####################################################################################################################
 
@@ -633,7 +816,7 @@ protected:
 
 /*--------------------------------------------------------------------------------------------------------------------*/
 {%  for d in devices %}
-#include "../include/device_{{ d.name|lower }}.{{ head_ext }}"
+#include "../include/device_{{ d.ident }}.{{ head_ext }}"
 {%- endfor %}
 
 /*--------------------------------------------------------------------------------------------------------------------*/
@@ -649,7 +832,7 @@ namespace nyx_{{ descr.nodeName|lower }} {
 void Driver::glueInitialize()
 {
 {%- for d in devices %}
-    this->registerDevice(std::unique_ptr<Nyx::BaseDevice>(new Device{{ d.name|pascalcase }}()));
+    this->registerDevice(std::unique_ptr<Nyx::BaseDevice>(new Device{{ d.pascal_ident }}()));
 {%- endfor %}
 }
 
@@ -706,12 +889,11 @@ int Driver::nodeTimeoutMS() const
 
         if self._override_main or not os.path.isfile(filename):
 
-            with open(filename, 'wt', encoding = 'utf-8') as f:
-
-                f.write(self.render(
-                    template,
-                    devices = self._devices
-                ))
+            self.render_file(
+                filename,
+                template,
+                devices = self._devices
+            )
 
     ####################################################################################################################
 
@@ -724,11 +906,280 @@ int Driver::nodeTimeoutMS() const
 
         filename = os.path.join(self._driver_path, 'src', f'credentials.{self._head_ext}')
 
-        with open(filename, 'wt', encoding = 'utf-8') as f:
+        self.render_file(
+            filename,
+            template
+        )
 
-            f.write(self.render(
-                template
-            ))
+    ####################################################################################################################
+
+    def _generate_worker(self) -> None:
+
+        template = '''
+/* !!! AUTOGENERATED FILE !!! */
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+#ifndef NYX_{{ descr.nodeName|upper }}_WORKER_{{ head_ext|upper }}
+#define NYX_{{ descr.nodeName|upper }}_WORKER_{{ head_ext|upper }}
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+#include <deque>
+#include <mutex>
+#include <thread>
+#include <functional>
+#include <condition_variable>
+
+#include <nyx_node.hpp>
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+namespace nyx_{{ descr.nodeName|lower }} {
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+/* DEVICE WORKER                                                                                                      */
+/*--------------------------------------------------------------------------------------------------------------------*/
+/* The node thread queues the property and vector callbacks of a device with post(), and the worker thread of the     */
+/* device runs them in order, so a slow handler only delays its own device. Handlers must not call nyx-node: they     */
+/* queue their updates with publish(), and the node thread applies them from a periodic timer and in stop(). The      */
+/* handlers run after nyx-node accepted the new value: they cannot reject it and do not receive the Nyx objects. The  */
+/* regenerated glue starts the worker before onInitialize() and stops it after onFinalize(): stop() runs the queued   */
+/* handlers, then applies the pending updates. The destructor also runs the queued handlers, but discards the pending */
+/* updates, as the node may already be gone.                                                                          */
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+class DeviceWorker
+{
+public:
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    ~DeviceWorker()
+    {
+        this->join();
+
+        this->detach();
+
+        this->discard();
+    }
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    void start(nyx_node_t *node)
+    {
+        if(this->thread.joinable())
+        {
+            return;
+        }
+
+        this->running = true;
+
+        this->thread = std::thread(&DeviceWorker::run, this);
+
+        if(this->timer == nullptr)
+        {
+            /* nyx-node cannot remove a timer: its context is never freed, detach() only unlinks it from the worker */
+
+            this->timer = new TimerContext();
+
+            this->timer->worker = this;
+
+            nyx_node_add_timer(node, {{ publish_interval }}, DeviceWorker::flushCallback, static_cast<void *>(this->timer));
+        }
+    }
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    void stop()
+    {
+        this->join();
+
+        this->detach();
+
+        this->flush();
+    }
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    void post(std::function<void()> task)
+    {
+        std::unique_lock<std::mutex> lock(this->task_mutex);
+
+        if(!this->running)
+        {
+            lock.unlock();
+
+            task();
+
+            return;
+        }
+
+        this->tasks.push_back(std::move(task));
+
+        lock.unlock();
+
+        this->task_cond.notify_one();
+    }
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    void publish(std::function<void()> update)
+    {
+        std::lock_guard<std::mutex> lock(this->update_mutex);
+
+        this->updates.push_back(std::move(update));
+    }
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    void flush()
+    {
+        std::deque<std::function<void()>> pending;
+
+        {
+            std::lock_guard<std::mutex> lock(this->update_mutex);
+
+            pending.swap(this->updates);
+        }
+
+        for(std::function<void()> &update : pending)
+        {
+            update();
+        }
+    }
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+private:
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    struct TimerContext
+    {
+        std::mutex mutex;
+
+        DeviceWorker *worker = nullptr;
+    };
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    std::thread thread;
+
+    bool running = false;
+
+    TimerContext *timer = nullptr;
+
+    std::mutex task_mutex;
+
+    std::condition_variable task_cond;
+
+    std::deque<std::function<void()>> tasks;
+
+    std::mutex update_mutex;
+
+    std::deque<std::function<void()>> updates;
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    static void flushCallback(void *arg)
+    {
+        TimerContext *context = static_cast<TimerContext *>(arg);
+
+        std::lock_guard<std::mutex> lock(context->mutex);
+
+        if(context->worker != nullptr)
+        {
+            context->worker->flush();
+        }
+    }
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    void detach()
+    {
+        if(this->timer != nullptr)
+        {
+            std::lock_guard<std::mutex> lock(this->timer->mutex);
+
+            this->timer->worker = nullptr;
+        }
+
+        this->timer = nullptr;
+    }
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    void discard()
+    {
+        std::lock_guard<std::mutex> lock(this->update_mutex);
+
+        this->updates.clear();
+    }
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    void join()
+    {
+        {
+            std::lock_guard<std::mutex> lock(this->task_mutex);
+
+            this->running = false;
+        }
+
+        this->task_cond.notify_one();
+
+        if(this->thread.joinable())
+        {
+            this->thread.join();
+        }
+    }
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+
+    void run()
+    {
+        std::unique_lock<std::mutex> lock(this->task_mutex);
+
+        for(;;)
+        {
+            this->task_cond.wait(lock, [this]() { return !this->tasks.empty() || !this->running; });
+
+            if(this->tasks.empty())
+            {
+                break;
+            }
+
+            std::function<void()> task = std::move(this->tasks.front());
+
+            this->tasks.pop_front();
+
+            lock.unlock();
+
+            task();
+
+            lock.lock();
+        }
+    }
+
+    /*----------------------------------------------------------------------------------------------------------------*/
+};
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+} /* namespace nyx_{{ descr.nodeName|lower }} */
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+
+#endif /* NYX_{{ descr.nodeName|upper }}_WORKER_{{ head_ext|upper }} */
+
+/*--------------------------------------------------------------------------------------------------------------------*/
+'''[1:]
+
+        filename = os.path.join(self._driver_path, 'include', f'worker.{self._head_ext}')
+
+        self.render_file(
+            filename,
+            template,
+            publish_interval = int(self._descr.get('publishInterval', PUBLISH_INTERVAL))
+        )
 
     ####################################################################################################################
 
@@ -757,11 +1208,10 @@ int main(int argc, char **argv)
 
         if self._override_main or not os.path.isfile(filename):
 
-            with open(filename, 'wt', encoding = 'utf-8') as f:
-
-                f.write(self.render(
-                    template,
-                    devices = self._devices
-                ))
+            self.render_file(
+                filename,
+                template,
+                devices = self._devices
+            )
 
 ########################################################################################################################
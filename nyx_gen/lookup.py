@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import typing
+
+########################################################################################################################
+
+if typing.TYPE_CHECKING:
+
+    from .model import Device
+
+########################################################################################################################
+
+HASH_BASIS = 0x811C9DC5
+
+HASH_PRIME = 0x01000193
+
+MAX_SEED = 0x00100000
+
+########################################################################################################################
+
+NSS_HASH_SEED = 0x5358594E
+
+########################################################################################################################
+
+class PerfectHash(typing.NamedTuple):
+
+    seeds: typing.List[int]
+    slots: typing.List[int]
+
+########################################################################################################################
+
+def lookup_hash(data: bytes, h: int = HASH_BASIS) -> int:
+
+    ####################################################################################################################
+    # FNV-1A                                                                                                           #
+    ####################################################################################################################
+
+    for byte in data:
+
+        h = ((h ^ byte) * HASH_PRIME) & 0xFFFFFFFF
+
+    ####################################################################################################################
+    # MURMUR3 FINALIZER                                                                                                #
+    ####################################################################################################################
+
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & 0xFFFFFFFF
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & 0xFFFFFFFF
+    h ^= h >> 16
+
+    return h
+
+########################################################################################################################
+
+def nyx_hash(data: bytes, seed: int = NSS_HASH_SEED) -> int:
+
+    ####################################################################################################################
+    # MURMURHASH2, SAME AS NYX_HASH() IN NYX-NODE                                                                      #
+    ####################################################################################################################
+
+    m = 0x5BD1E995
+
+    h = (seed ^ len(data)) & 0xFFFFFFFF
+
+    n = len(data) & ~3
+
+    for i in range(0, n, 4):
+
+        k = (int.from_bytes(data[i: i + 4], 'little') * m) & 0xFFFFFFFF
+        k ^= k >> 24
+        k = (k * m) & 0xFFFFFFFF
+
+        h = ((h * m) & 0xFFFFFFFF) ^ k
+
+    ####################################################################################################################
+
+    tail = data[n:]
+
+    if len(tail) == 3:
+        h ^= tail[2] << 16
+    if len(tail) >= 2:
+        h ^= tail[1] << 8
+    if len(tail) >= 1:
+        h ^= tail[0]
+        h = (h * m) & 0xFFFFFFFF
+
+    ####################################################################################################################
+
+    h ^= h >> 13
+    h = (h * m) & 0xFFFFFFFF
+    h ^= h >> 15
+
+    return h
+
+########################################################################################################################
+
+def lookup_key(*names: str) -> bytes:
+
+    return b'\0'.join(name.encode('utf-8') for name in names)
+
+########################################################################################################################
+
+def build_perfect_hash(keys: typing.List[bytes]) -> PerfectHash:
+
+    ####################################################################################################################
+
+    n = len(keys)
+
+    if n == 0:
+
+        return PerfectHash([], [])
+
+    if len(set(keys)) != n:
+
+        raise ValueError('Duplicate lookup keys')
+
+    ####################################################################################################################
+
+    buckets = [[] for _ in range((n + 1) // 2)]
+
+    for i, key in enumerate(keys):
+
+        buckets[lookup_hash(key) % len(buckets)].append(i)
+
+    ####################################################################################################################
+
+    seeds = [0] * len(buckets)
+
+    slots = [-1] * n
+
+    for b in sorted(range(len(buckets)), key = lambda b: -len(buckets[b])):
+
+        bucket = buckets[b]
+
+        if not bucket:
+
+            break
+
+        for seed in range(1, MAX_SEED):
+
+            positions = [lookup_hash(keys[i], seed) % n for i in bucket]
+
+            if len(set(positions)) == len(positions) and all(slots[p] < 0 for p in positions):
+
+                break
+
+        else:
+
+            raise ValueError('Cannot build the perfect hash table')
+
+        seeds[b] = seed
+
+        for i, p in zip(bucket, positions):
+
+            slots[p] = i
+
+    ####################################################################################################################
+
+    return PerfectHash(seeds, slots)
+
+########################################################################################################################
+
+def build_device_lookups(device: 'Device') -> dict:
+
+    ####################################################################################################################
+
+    vectors = device.vectors
+
+    defs = [(vector, df) for vector in vectors for df in vector.defs]
+
+    ####################################################################################################################
+
+    vector_hash = build_perfect_hash([lookup_key(vector.name) for vector in vectors])
+
+    prop_hash = build_perfect_hash([lookup_key(vector.name, df.name) for vector, df in defs])
+
+    ####################################################################################################################
+
+    return {
+        'vector_seeds': vector_hash.seeds,
+        'vector_slots': [vectors[i] for i in vector_hash.slots],
+        'prop_seeds': prop_hash.seeds,
+        'prop_slots': [defs[i] for i in prop_hash.slots],
+    }
+
+########################################################################################################################
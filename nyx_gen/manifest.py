@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import os
+import json
+import typing
+import hashlib
+
+########################################################################################################################
+
+MANIFEST_FILENAME = '.nyx-gen-manifest.json'
+
+MANIFEST_VERSION = 2
+
+########################################################################################################################
+
+def content_digest(content: str) -> str:
+
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+########################################################################################################################
+
+class Manifest:
+
+    ####################################################################################################################
+
+    def __init__(self, root: str, cache_dir: typing.Optional[str] = None):
+
+        self._root = root
+
+        self._path = os.path.join(root, MANIFEST_FILENAME)
+
+        self._fragment_dir = os.path.join(cache_dir, 'fragments') if cache_dir else None
+
+        self._files: typing.Dict[str, dict] = {}
+
+        self._fragments: typing.Dict[str, str] = {}
+
+        self._used_fragments: typing.Dict[str, str] = {}
+
+    ####################################################################################################################
+
+    def _key(self, filename: str) -> str:
+
+        return os.path.relpath(filename, self._root).replace(os.sep, '/')
+
+    ####################################################################################################################
+
+    def load(self) -> None:
+
+        try:
+
+            with open(self._path, 'rt', encoding = 'utf-8') as f:
+
+                data = json.load(f)
+
+            if data.get('version') == MANIFEST_VERSION:
+
+                self._files = data.get('files', {})
+
+                self._fragments = data.get('fragments', {})
+
+        except (IOError, ValueError, AttributeError):
+
+            self._files = {}
+
+            self._fragments = {}
+
+    ####################################################################################################################
+
+    def save(self) -> None:
+
+        files = {key: entry for key, entry in sorted(self._files.items()) if os.path.isfile(os.path.join(self._root, key))}
+
+        temp_path = f'{self._path}.tmp'
+
+        with open(temp_path, 'wt', encoding = 'utf-8') as f:
+
+            json.dump({'version': MANIFEST_VERSION, 'files': files, 'fragments': self._used_fragments}, f, indent = 1)
+
+        os.replace(temp_path, self._path)
+
+    ####################################################################################################################
+
+    def _fragment_path(self, digest: str) -> str:
+
+        return os.path.join(self._fragment_dir, f'{digest}.txt')
+
+    ####################################################################################################################
+
+    def get_fragment(self, key: str) -> typing.Optional[str]:
+
+        ################################################################################################################
+
+        digest = self._fragments.get(key)
+
+        if digest is None or self._fragment_dir is None:
+
+            return None
+
+        ################################################################################################################
+
+        try:
+
+            with open(self._fragment_path(digest), 'rt', encoding = 'utf-8', newline = '') as f:
+
+                result = f.read()
+
+        except (IOError, UnicodeDecodeError):
+
+            return None
+
+        if content_digest(result) != digest:
+
+            return None
+
+        ################################################################################################################
+
+        self._used_fragments[key] = digest
+
+        return result
+
+    ####################################################################################################################
+
+    def set_fragment(self, key: str, text: str) -> None:
+
+        ################################################################################################################
+
+        if self._fragment_dir is None:
+
+            return
+
+        ################################################################################################################
+
+        digest = content_digest(text)
+
+        path = self._fragment_path(digest)
+
+        if not os.path.isfile(path):
+
+            temp_path = f'{path}.{os.getpid()}.tmp'
+
+            try:
+
+                os.makedirs(self._fragment_dir, exist_ok = True)
+
+                with open(temp_path, 'wt', encoding = 'utf-8', newline = '') as f:
+
+                    f.write(text)
+
+                os.replace(temp_path, path)
+
+            except OSError:
+
+                if os.path.exists(temp_path):
+
+                    os.unlink(temp_path)
+
+                return
+
+        ################################################################################################################
+
+        self._fragments[key] = self._used_fragments[key] = digest
+
+    ####################################################################################################################
+
+    def update(self, filename: str, digest: str, inputs: typing.Optional[str] = None) -> None:
+
+        st = os.stat(filename)
+
+        self._files[self._key(filename)] = {
+            'sha256': digest,
+            'inputs': inputs,
+            'size': st.st_size,
+            'mtime_ns': st.st_mtime_ns,
+        }
+
+    ####################################################################################################################
+
+    def is_fresh(self, filename: str, inputs: str) -> bool:
+
+        ################################################################################################################
+
+        entry = self._files.get(self._key(filename))
+
+        if entry is None or entry.get('inputs') != inputs:
+
+            return False
+
+        ################################################################################################################
+
+        try:
+
+            st = os.stat(filename)
+
+        except OSError:
+
+            return False
+
+        ################################################################################################################
+
+        return entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns
+
+    ####################################################################################################################
+
+    def is_up_to_date(self, filename: str, digest: str, inputs: typing.Optional[str] = None) -> bool:
+
+        ################################################################################################################
+
+        try:
+
+            st = os.stat(filename)
+
+        except OSError:
+
+            return False
+
+        ################################################################################################################
+
+        entry = self._files.get(self._key(filename))
+
+        if entry is not None and entry['sha256'] == digest and entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns:
+
+            entry['inputs'] = inputs
+
+            return True
+
+        ################################################################################################################
+
+        try:
+
+            with open(filename, 'rt', encoding = 'utf-8') as f:
+
+                if content_digest(f.read()) != digest:
+
+                    return False
+
+        except (IOError, UnicodeDecodeError):
+
+            return False
+
+        ################################################################################################################
+
+        self.update(filename, digest, inputs)
+
+        return True
+
+########################################################################################################################
@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import typing
+
+########################################################################################################################
+
+from .formats import NumberFormat, classify_format
+
+########################################################################################################################
+
+VECTOR_TYPES = ('number', 'text', 'light', 'switch', 'blob', 'stream')
+
+########################################################################################################################
+
+_VALUE_TYPES = {
+    'text': ('STR_t', 's', 'str'),
+    'light': ('int', 'i', 'int'),
+    'switch': ('int', 'i', 'int'),
+    'blob': (None, 'O', 'blob'),
+    'stream': (None, None, None),
+}
+
+########################################################################################################################
+
+def pascalcase(s: str) -> str:
+
+    return ''.join(part.capitalize() for part in s.split('_') if part)
+
+########################################################################################################################
+
+def _check_unique(elements: typing.List['Element'], where: str) -> None:
+
+    seen = set()
+
+    for element in elements:
+
+        if element.ident in seen:
+
+            raise ValueError(f'Duplicate name `{element.name}` in {where}')
+
+        seen.add(element.ident)
+
+########################################################################################################################
+
+class Element:
+
+    ####################################################################################################################
+
+    __slots__ = ('_data', 'name', 'ident', 'upper_ident', 'pascal_ident')
+
+    ####################################################################################################################
+
+    def __init__(self, data: dict):
+
+        self._data = data
+
+        self.name: str = data['name']
+
+        self.ident: str = self.name.lower()
+        self.upper_ident: str = self.name.upper()
+        self.pascal_ident: str = pascalcase(self.name)
+
+    ####################################################################################################################
+
+    def __getitem__(self, key: str) -> typing.Any:
+
+        for cls in type(self).__mro__:
+
+            if key in getattr(cls, '__slots__', ()) and not key.startswith('_'):
+
+                return getattr(self, key)
+
+        return self._data[key]
+
+    ####################################################################################################################
+
+    def get(self, key: str, default: typing.Any = None) -> typing.Any:
+
+        try:
+
+            return self[key]
+
+        except KeyError:
+
+            return default
+
+    ####################################################################################################################
+
+    def to_dict(self) -> dict:
+
+        return self._data
+
+########################################################################################################################
+
+class Def(Element):
+
+    ####################################################################################################################
+
+    __slots__ = ('symbol', 'local_symbol', 'pascal_symbol', 'number', 'subtype', 'ctype', 'py_code', 'callback_field', 'callback')
+
+    ####################################################################################################################
+
+    def __init__(self, data: dict, device: 'Device', vector: 'Vector'):
+
+        super().__init__(data)
+
+        self.symbol: str = f'{vector.symbol}_{self.ident}'
+        self.local_symbol: str = f'{vector.ident}_{self.ident}'
+        self.pascal_symbol: str = f'{vector.pascal_ident}{self.pascal_ident}'
+
+        if vector.type == 'number':
+
+            try:
+
+                self.number: typing.Optional[NumberFormat] = classify_format(data['format'])
+
+            except ValueError as e:
+
+                raise ValueError(f'{device.name}::{vector.name}::{self.name}: {e.__str__()}') from None
+
+            self.subtype: typing.Optional[int] = self.number.subtype
+            self.ctype: typing.Optional[str] = self.number.ctype
+            self.py_code: typing.Optional[str] = self.number.py_code
+            self.callback_field: typing.Optional[str] = self.number.suffix
+
+        else:
+
+            self.number = None
+            self.subtype = None
+            self.ctype, self.py_code, self.callback_field = _VALUE_TYPES[vector.type]
+
+        self.callback: bool = bool(data.get('callback', False)) and vector.type != 'stream'
+
+########################################################################################################################
+
+class Vector(Element):
+
+    ####################################################################################################################
+
+    __slots__ = ('type', 'symbol', 'callback', 'defs', 'has_def_callbacks')
+
+    ####################################################################################################################
+
+    def __init__(self, data: dict, device: 'Device'):
+
+        super().__init__(data)
+
+        self.type: str = data['type']
+
+        if self.type not in VECTOR_TYPES:
+
+            raise ValueError(f'Invalid type `{self.type}` for vector {device.name}::{self.name}')
+
+        self.symbol: str = f'{device.ident}_{self.ident}'
+
+        self.callback: bool = bool(data.get('callback', False)) and self.type != 'stream'
+
+        ################################################################################################################
+
+        self.defs: typing.List[Def] = [Def(df, device, self) for df in sorted(data['defs'].values(), key = lambda x: x['rank'])]
+
+        _check_unique(self.defs, f'vector {device.name}::{self.name}')
+
+        self.has_def_callbacks: bool = any(df.callback for df in self.defs)
+
+########################################################################################################################
+
+class Device(Element):
+
+    ####################################################################################################################
+
+    __slots__ = ('vectors', 'has_def_callbacks', 'has_callbacks')
+
+    ####################################################################################################################
+
+    def __init__(self, data: dict):
+
+        super().__init__(data)
+
+        self.vectors: typing.List[Vector] = [Vector(v, self) for v in sorted(data['vectors'].values(), key = lambda x: x['rank'])]
+
+        _check_unique(self.vectors, f'device {self.name}')
+
+        self.has_def_callbacks: bool = any(v.has_def_callbacks for v in self.vectors)
+
+        self.has_callbacks: bool = self.has_def_callbacks or any(v.callback and v.type != 'stream' for v in self.vectors)
+
+########################################################################################################################
+
+class Node(Element):
+
+    ####################################################################################################################
+
+    __slots__ = ('devices', )
+
+    ####################################################################################################################
+
+    def __init__(self, data: dict):
+
+        super().__init__(dict(data, name = data['nodeName']))
+
+        self.devices: typing.List[Device] = [Device(d) for d in sorted(data['devices'].values(), key = lambda x: x['rank'])]
+
+        _check_unique(self.devices, f'node {self.name}')
+
+########################################################################################################################
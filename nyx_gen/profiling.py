@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import os
+import json
+import time
+import typing
+import functools
+import threading
+import contextlib
+import tracemalloc
+
+########################################################################################################################
+
+class Section:
+
+    ####################################################################################################################
+
+    __slots__ = ('name', 'kind', 'depth', 'start', 'duration', 'base_memory', 'peak_memory')
+
+    ####################################################################################################################
+
+    def __init__(self, name: str, kind: str, depth: int, start: float, base_memory: int):
+
+        self.name = name
+        self.kind = kind
+        self.depth = depth
+        self.start = start
+        self.duration = 0.0
+        self.base_memory = base_memory
+        self.peak_memory = base_memory
+
+########################################################################################################################
+
+class Profiler:
+
+    ####################################################################################################################
+
+    def __init__(self, trace_memory: bool = True):
+
+        self._trace_memory = trace_memory
+
+        self._origin = time.perf_counter()
+
+        self._stack: typing.List[Section] = []
+
+        self.sections: typing.List[Section] = []
+
+    ####################################################################################################################
+
+    def start(self) -> None:
+
+        if self._trace_memory and not tracemalloc.is_tracing():
+
+            tracemalloc.start()
+
+        self._origin = time.perf_counter()
+
+    ####################################################################################################################
+
+    def stop(self) -> None:
+
+        if self._trace_memory and tracemalloc.is_tracing():
+
+            tracemalloc.stop()
+
+    ####################################################################################################################
+
+    def _memory(self) -> typing.Tuple[int, int]:
+
+        return tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+
+    ####################################################################################################################
+
+    def _reset_peak(self) -> None:
+
+        ################################################################################################################
+
+        current, peak = self._memory()
+
+        for section in self._stack:
+
+            section.peak_memory = max(section.peak_memory, peak)
+
+        ################################################################################################################
+
+        if hasattr(tracemalloc, 'reset_peak') and tracemalloc.is_tracing():
+
+            tracemalloc.reset_peak()
+
+    ####################################################################################################################
+
+    @contextlib.contextmanager
+    def section(self, name: str, kind: str) -> typing.Iterator[Section]:
+
+        ################################################################################################################
+
+        self._reset_peak()
+
+        section = Section(name, kind, len(self._stack), time.perf_counter() - self._origin, self._memory()[0])
+
+        self.sections.append(section)
+
+        self._stack.append(section)
+
+        ################################################################################################################
+
+        try:
+
+            yield section
+
+        finally:
+
+            section.duration = time.perf_counter() - self._origin - section.start
+
+            self._reset_peak()
+
+            self._stack.pop()
+
+    ####################################################################################################################
+
+    def wrap(self, name: str, kind: str, func: typing.Callable) -> typing.Callable:
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+
+            with self.section(name, kind):
+
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    ####################################################################################################################
+
+    def format_table(self) -> str:
+
+        ################################################################################################################
+
+        rows = [('Section', 'Kind', 'Time (ms)', 'Peak (KiB)')]
+
+        for section in self.sections:
+
+            rows.append((
+                '  ' * section.depth + section.name,
+                section.kind,
+                f'{1000.0 * section.duration:.2f}',
+                f'{(section.peak_memory - section.base_memory) / 1024.0:.1f}' if self._trace_memory else '-',
+            ))
+
+        ################################################################################################################
+
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+
+        lines = ['  '.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip() for row in rows]
+
+        lines.insert(1, '  '.join('-' * width for width in widths))
+
+        ################################################################################################################
+
+        return '\n'.join(lines)
+
+    ####################################################################################################################
+
+    def write_chrome_trace(self, filename: str) -> None:
+
+        ################################################################################################################
+
+        events = []
+
+        for section in self.sections:
+
+            events.append({
+                'name': section.name,
+                'cat': section.kind,
+                'ph': 'X',
+                'ts': 1.0e6 * section.start,
+                'dur': 1.0e6 * section.duration,
+                'pid': os.getpid(),
+                'tid': threading.get_ident(),
+                'args': {'peak_kib': (section.peak_memory - section.base_memory) / 1024.0},
+            })
+
+        ################################################################################################################
+
+        with open(filename, 'wt', encoding = 'utf-8') as f:
+
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+########################################################################################################################
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import typing
+import importlib
+import collections.abc
+import importlib.metadata as metadata
+
+########################################################################################################################
+
+if typing.TYPE_CHECKING:
+
+    from .abstract_generator import AbstractGenerator
+
+########################################################################################################################
+
+ENTRY_POINT_GROUP = 'nyx_gen.generators'
+
+########################################################################################################################
+
+BUILTIN_GENERATORS = {
+    'posix-c': 'nyx_gen.generators.posix_c:PosixCGenerator',
+    'posix-c++': 'nyx_gen.generators.posix_cpp:PosixCPPGenerator',
+    'gnuradio': 'nyx_gen.generators.gnuradio:GNURadioGenerator',
+    'arduino-eth': 'nyx_gen.generators.arduino_eth:ArduinoEthGenerator',
+    'arduino-wifi': 'nyx_gen.generators.arduino_wifi:ArduinoWifiGenerator',
+}
+
+########################################################################################################################
+
+class GeneratorRegistry(collections.abc.Mapping):
+
+    ####################################################################################################################
+
+    def __init__(self, table: typing.Dict[str, str]):
+
+        self._table = dict(table)
+
+        self._classes: typing.Dict[str, typing.Type['AbstractGenerator']] = {}
+
+        self._entry_points_loaded = False
+
+    ####################################################################################################################
+
+    def _load_entry_points(self) -> None:
+
+        if not self._entry_points_loaded:
+
+            self._entry_points_loaded = True
+
+            try:
+
+                entry_points = metadata.entry_points()
+
+                if hasattr(entry_points, 'select'):
+                    entry_points = entry_points.select(group = ENTRY_POINT_GROUP)
+                else:
+                    entry_points = entry_points.get(ENTRY_POINT_GROUP, [])
+
+            except Exception:
+
+                entry_points = []
+
+            for entry_point in entry_points:
+
+                self._table.setdefault(entry_point.name, entry_point.value)
+
+    ####################################################################################################################
+
+    def register(self, name: str, path: str) -> None:
+
+        self._table[name] = path
+
+        self._classes.pop(name, None)
+
+    ####################################################################################################################
+
+    def __getitem__(self, name: str) -> typing.Type['AbstractGenerator']:
+
+        ################################################################################################################
+
+        if name in self._classes:
+
+            return self._classes[name]
+
+        ################################################################################################################
+
+        if name not in self._table:
+
+            self._load_entry_points()
+
+            if name not in self._table:
+
+                raise KeyError(name)
+
+        ################################################################################################################
+
+        module_name, _, class_name = self._table[name].partition(':')
+
+        result = self._classes[name] = getattr(importlib.import_module(module_name), class_name)
+
+        return result
+
+    ####################################################################################################################
+
+    def __contains__(self, name: object) -> bool:
+
+        if name not in self._table:
+
+            self._load_entry_points()
+
+        return name in self._table
+
+    ####################################################################################################################
+
+    def __iter__(self) -> typing.Iterator[str]:
+
+        self._load_entry_points()
+
+        return iter(list(self._table))
+
+    ####################################################################################################################
+
+    def __len__(self) -> int:
+
+        self._load_entry_points()
+
+        return len(self._table)
+
+########################################################################################################################
+
+def detect_generators() -> GeneratorRegistry:
+
+    return GeneratorRegistry(BUILTIN_GENERATORS)
+
+########################################################################################################################
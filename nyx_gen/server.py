@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import os
+import sys
+import json
+import time
+import typing
+import argparse
+import socketserver
+
+########################################################################################################################
+
+from . import generators
+
+########################################################################################################################
+
+DEFAULT_OPTIONS = {
+    'output': '.',
+    'override_project': False,
+    'override_device': False,
+    'override_main': False,
+    'override_cmake': False,
+    'build_profile': None,
+    'march': None,
+    'incremental': False,
+    'jobs': 1,
+}
+
+########################################################################################################################
+
+def run_job(job: dict) -> dict:
+
+    ####################################################################################################################
+
+    t0 = time.perf_counter()
+
+    result = {'id': job.get('id')}
+
+    ####################################################################################################################
+
+    try:
+
+        ################################################################################################################
+
+        if 'descr' in job:
+
+            descr = job['descr']
+
+        elif 'descrFile' in job:
+
+            with open(job['descrFile'], 'rt') as f:
+
+                descr = json.load(f)
+
+        else:
+
+            raise ValueError('Missing `descr` or `descrFile`')
+
+        ################################################################################################################
+
+        options = dict(DEFAULT_OPTIONS)
+
+        for key, value in job.get('options', {}).items():
+
+            if key not in DEFAULT_OPTIONS:
+
+                raise ValueError(f'Invalid option: {key}')
+
+            options[key] = value
+
+        # outputs are rendered serially: a process pool per job would cost more than it saves
+
+        options['jobs'] = 1
+
+        ################################################################################################################
+
+        if not isinstance(descr, dict):
+
+            raise ValueError('Description must be a JSON object')
+
+        if 'mode' not in descr:
+
+            raise ValueError('Missing `mode` in the description')
+
+        if descr['mode'] not in generators:
+
+            raise ValueError(f'Invalid code generator: {descr["mode"]}')
+
+        ################################################################################################################
+
+        t1 = time.perf_counter()
+
+        generator = generators[descr['mode']](argparse.Namespace(**options), descr)
+
+        generator.run()
+
+        t2 = time.perf_counter()
+
+        ################################################################################################################
+
+        result['status'] = 'ok'
+        result['files'] = generator.written_files
+        result['unchanged'] = generator.unchanged_files
+        result['timings'] = {
+            'load': 1000.0 * (t1 - t0),
+            'generate': 1000.0 * (t2 - t1),
+            'total': 1000.0 * (t2 - t0),
+        }
+
+        ################################################################################################################
+
+    except Exception as e:
+
+        result['status'] = 'error'
+        result['error'] = e.__str__()
+
+    ####################################################################################################################
+
+    return result
+
+########################################################################################################################
+
+def process_line(line: str) -> typing.Optional[str]:
+
+    ####################################################################################################################
+
+    line = line.strip()
+
+    if not line:
+
+        return None
+
+    ####################################################################################################################
+
+    try:
+
+        job = json.loads(line)
+
+        if not isinstance(job, dict):
+
+            raise ValueError('Job must be a JSON object')
+
+    except ValueError as e:
+
+        return json.dumps({'id': None, 'status': 'error', 'error': f'Invalid JSON: {e.__str__()}'})
+
+    ####################################################################################################################
+
+    return json.dumps(run_job(job))
+
+########################################################################################################################
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+
+    ####################################################################################################################
+
+    def handle(self) -> None:
+
+        for raw in self.rfile:
+
+            reply = process_line(raw.decode('utf-8'))
+
+            if reply is not None:
+
+                self.wfile.write(f'{reply}\n'.encode('utf-8'))
+
+                self.wfile.flush()
+
+########################################################################################################################
+
+def serve(socket_path: typing.Optional[str] = None) -> int:
+
+    ####################################################################################################################
+    # STDIN / STDOUT                                                                                                   #
+    ####################################################################################################################
+
+    if socket_path is None:
+
+        try:
+
+            for line in sys.stdin:
+
+                reply = process_line(line)
+
+                if reply is not None:
+
+                    sys.stdout.write(f'{reply}\n')
+
+                    sys.stdout.flush()
+
+        except KeyboardInterrupt:
+
+            pass
+
+        return 0
+
+    ####################################################################################################################
+    # UNIX SOCKET                                                                                                      #
+    ####################################################################################################################
+
+    if not hasattr(socketserver, 'UnixStreamServer'):
+
+        print('Unix sockets are not supported on this platform')
+
+        return 1
+
+    ####################################################################################################################
+
+    if os.path.exists(socket_path):
+
+        os.unlink(socket_path)
+
+    ####################################################################################################################
+
+    try:
+
+        with socketserver.UnixStreamServer(socket_path, _RequestHandler) as server:
+
+            server.serve_forever()
+
+    except KeyboardInterrupt:
+
+        pass
+
+    finally:
+
+        if os.path.exists(socket_path):
+
+            os.unlink(socket_path)
+
+    ####################################################################################################################
+
+    return 0
+
+########################################################################################################################
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import os
+import stat
+import argparse
+
+import pytest
+
+########################################################################################################################
+
+from nyx_gen import generators
+from nyx_gen.bench import synthesize_description
+from nyx_gen.server import DEFAULT_OPTIONS
+
+########################################################################################################################
+
+def _generator(tmp_path):
+
+    return generators['posix-c'](argparse.Namespace(**dict(DEFAULT_OPTIONS, output = str(tmp_path / 'out'))), synthesize_description('posix-c', 1, 1, 1))
+
+########################################################################################################################
+
+def _fail(i: int) -> str:
+
+    if i == 3:
+
+        raise RuntimeError('template failure')
+
+    return f'line {i}'
+
+########################################################################################################################
+
+def test_failed_write_keeps_old_file(tmp_path):
+
+    filename = tmp_path / 'main.c'
+
+    filename.write_text('old content\n', encoding = 'utf-8')
+
+    generator = _generator(tmp_path)
+
+    ####################################################################################################################
+
+    with pytest.raises(RuntimeError, match = 'template failure'):
+
+        # the first chunks are already streamed to the temporary file when the template fails
+
+        generator.render_file(str(filename), '{% for i in range(5) %}{{ fail(i) }}\n{% endfor %}', fail = _fail)
+
+    assert filename.read_text(encoding = 'utf-8') == 'old content\n'
+
+    assert os.listdir(tmp_path) == ['main.c']
+
+    assert generator.written_files == []
+
+########################################################################################################################
+
+def test_failed_write_creates_nothing(tmp_path):
+
+    generator = _generator(tmp_path)
+
+    with pytest.raises(RuntimeError):
+
+        generator.render_file(str(tmp_path / 'main.c'), '{{ fail(3) }}', fail = _fail)
+
+    assert os.listdir(tmp_path) == []
+
+########################################################################################################################
+
+def test_write_replaces_and_keeps_mode(tmp_path):
+
+    filename = tmp_path / 'run.sh'
+
+    filename.write_text('old content\n', encoding = 'utf-8')
+
+    os.chmod(filename, 0o750)
+
+    generator = _generator(tmp_path)
+
+    generator.render_file(str(filename), '{% for i in range(3) %}{{ fail(i) }}\n{% endfor %}', fail = _fail)
+
+    assert filename.read_text(encoding = 'utf-8') == 'line 0\nline 1\nline 2\n'
+
+    assert stat.S_IMODE(os.stat(filename).st_mode) == 0o750
+
+    assert os.listdir(tmp_path) == ['run.sh']
+
+    assert generator.written_files == [str(filename)]
+
+########################################################################################################################
+
+def test_new_file_mode(tmp_path):
+
+    umask = os.umask(0o022)
+
+    try:
+
+        _generator(tmp_path).render_file(str(tmp_path / 'main.c'), 'int main;\n')
+
+    finally:
+
+        os.umask(umask)
+
+    # mkstemp creates 0600 files: the new file must get the usual mode instead
+
+    assert stat.S_IMODE(os.stat(tmp_path / 'main.c').st_mode) == 0o644
+
+########################################################################################################################
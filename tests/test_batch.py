@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import json
+
+########################################################################################################################
+
+from nyx_gen.bench import synthesize_description
+from nyx_gen.batch import collect_descriptions, run_batch
+
+########################################################################################################################
+
+def _write_description(path, mode: str, node_name: str) -> str:
+
+    descr = synthesize_description(mode, 1, 2, 1)
+
+    descr['nodeName'] = node_name
+
+    path.write_text(json.dumps(descr), encoding = 'utf-8')
+
+    return str(path)
+
+########################################################################################################################
+
+def test_collect_descriptions(tmp_path):
+
+    a = _write_description(tmp_path / 'a.json', 'posix-c', 'A')
+    b = _write_description(tmp_path / 'b.json', 'posix-c', 'B')
+
+    (tmp_path / 'notes.txt').write_text('', encoding = 'utf-8')
+
+    assert collect_descriptions([str(tmp_path), a]) == [a, b]
+
+########################################################################################################################
+
+def test_shared_output_folder(tmp_path):
+
+    a = _write_description(tmp_path / 'a.json', 'posix-c', 'Node')
+    b = _write_description(tmp_path / 'b.json', 'gnuradio', 'Node')
+    c = _write_description(tmp_path / 'c.json', 'posix-c', 'Other')
+
+    results = run_batch([a, b, c], {'output': str(tmp_path / 'out')})
+
+    assert [result['id'] for result in results] == [a, b, c]
+    assert [result['status'] for result in results] == ['error', 'error', 'ok']
+
+    assert b in results[0]['error']
+    assert a in results[1]['error']
+
+    assert not (tmp_path / 'out' / 'Node').exists()
+    assert (tmp_path / 'out' / 'Other').is_dir()
+
+########################################################################################################################
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import sys
+import json
+
+import pytest
+
+########################################################################################################################
+
+from nyx_gen import cli
+from nyx_gen.bench import synthesize_description
+
+########################################################################################################################
+
+@pytest.mark.parametrize('command', ['serve', 'batch', 'bench'])
+def test_description_named_after_command(tmp_path, monkeypatch, command):
+
+    descr = synthesize_description('posix-c', 1, 1, 1)
+
+    (tmp_path / command).write_text(json.dumps(descr), encoding = 'utf-8')
+
+    monkeypatch.chdir(tmp_path)
+
+    monkeypatch.setattr(sys, 'argv', ['nyx-gen', command, '--output', str(tmp_path / 'out')])
+
+    assert not cli.main()
+
+    assert (tmp_path / 'out' / descr['nodeName']).is_dir()
+
+########################################################################################################################
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import shutil
+import subprocess
+
+import pytest
+
+########################################################################################################################
+
+from nyx_gen.bench import synthesize_description
+from nyx_gen.server import run_job
+
+########################################################################################################################
+
+REPORT = '''
+get_directory_property(NYX_COMPILE_OPTIONS COMPILE_OPTIONS)
+
+message(STATUS "NYX_REPORT|${CMAKE_BUILD_TYPE}|${CMAKE_INTERPROCEDURAL_OPTIMIZATION}|${CMAKE_%s_FLAGS}|${NYX_COMPILE_OPTIONS}")
+'''
+
+########################################################################################################################
+
+def _generate(tmp_path, mode: str, descr_overrides: dict = None, **options) -> dict:
+
+    descr = synthesize_description(mode, 1, 2, 1)
+
+    descr.update(descr_overrides or {})
+
+    return run_job({'descr': descr, 'options': dict(options, output = str(tmp_path / 'out'))})
+
+########################################################################################################################
+
+def _configure(tmp_path, mode: str, descr_overrides: dict = None, cmake_args: tuple = (), **options) -> list:
+
+    result = _generate(tmp_path, mode, descr_overrides, **options)
+
+    assert result['status'] == 'ok', result.get('error')
+
+    with open(tmp_path / 'out' / 'BenchNode' / 'CMakeLists.txt', 'rt', encoding = 'utf-8') as f:
+
+        cmake_lists = f.read()
+
+    ####################################################################################################################
+
+    # nyx-node is not available here: only configure the project up to its dependencies
+
+    lang = 'CXX' if mode == 'posix-c++' else 'C'
+
+    (tmp_path / 'project').mkdir()
+
+    (tmp_path / 'project' / 'CMakeLists.txt').write_text(cmake_lists[: cmake_lists.index('find_package(')] + REPORT % lang, encoding = 'utf-8')
+
+    output = subprocess.run(['cmake', *cmake_args, '-S', str(tmp_path / 'project'), '-B', str(tmp_path / 'build')], check = True, capture_output = True, text = True).stdout
+
+    return next(line for line in output.splitlines() if 'NYX_REPORT|' in line).split('|')[1:]
+
+########################################################################################################################
+
+@pytest.mark.parametrize('mode', ['posix-c', 'posix-c++', 'gnuradio', 'arduino-eth'])
+def test_invalid_profile(tmp_path, mode):
+
+    result = _generate(tmp_path, mode, {'buildProfile': 'Fastest'})
+
+    if mode.startswith('arduino'):
+        assert result['status'] == 'ok', result.get('error') # no CMake project
+    else:
+        assert result['status'] == 'error'
+        assert 'Invalid build profile `Fastest`' in result['error']
+
+########################################################################################################################
+
+def test_option_precedence(tmp_path):
+
+    assert _generate(tmp_path, 'posix-c', {'buildProfile': 'Debug'}, build_profile = 'LTO', march = 'native')['status'] == 'ok'
+
+    with open(tmp_path / 'out' / 'BenchNode' / 'CMakeLists.txt', 'rt', encoding = 'utf-8') as f:
+
+        cmake_lists = f.read()
+
+    assert 'set(NYX_BUILD_PROFILE "LTO" CACHE STRING' in cmake_lists
+    assert 'set(NYX_MARCH "native" CACHE STRING' in cmake_lists
+
+    assert '-O0' not in cmake_lists and '-O3' not in cmake_lists
+
+########################################################################################################################
+
+@pytest.mark.skipif(shutil.which('cmake') is None, reason = 'no cmake')
+@pytest.mark.parametrize('profile, build_type, ipo, flags', [
+    (None, 'Release', '', ''),
+    ('Debug', 'Debug', '', ''),
+    ('Release', 'Release', '', ''),
+    ('RelWithDebInfo', 'RelWithDebInfo', '', ''),
+    ('LTO', 'Release', 'ON', ''),
+    ('PGO-instrument', 'Release', '', '-fprofile-generate={build}/pgo -fprofile-update=atomic'),
+    ('PGO-use', 'Release', 'ON', '-fprofile-use={build}/pgo'),
+])
+def test_profile(tmp_path, profile, build_type, ipo, flags):
+
+    report = _configure(tmp_path, 'posix-c', {} if profile is None else {'buildProfile': profile})
+
+    assert report[: 2] == [build_type, ipo]
+
+    assert report[2].split() == flags.format(build = tmp_path / 'build').split()
+
+    assert '-march' not in report[3]
+
+########################################################################################################################
+
+@pytest.mark.skipif(shutil.which('cmake') is None, reason = 'no cmake')
+@pytest.mark.parametrize('mode', ['posix-c++', 'gnuradio'])
+def test_other_modes(tmp_path, mode):
+
+    report = _configure(tmp_path, mode, build_profile = 'PGO-use', march = 'native')
+
+    assert report[: 2] == ['Release', 'ON']
+
+    assert report[2].split() == [f'-fprofile-use={tmp_path / "build"}/pgo']
+
+    assert '-march=native' in report[3].split(';')
+
+########################################################################################################################
+
+@pytest.mark.skipif(shutil.which('cmake') is None, reason = 'no cmake')
+def test_configure_time_override(tmp_path):
+
+    report = _configure(tmp_path, 'posix-c', {'buildProfile': 'Debug'}, ('-DNYX_BUILD_PROFILE=LTO', '-DCMAKE_BUILD_TYPE=RelWithDebInfo'))
+
+    assert report[: 2] == ['RelWithDebInfo', 'ON']
+
+########################################################################################################################
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import pytest
+
+########################################################################################################################
+
+from nyx_gen.bench import synthesize_description
+from nyx_gen.server import run_job
+from nyx_gen.formats import NYX_NUMBER_INT, NYX_NUMBER_UINT, NYX_NUMBER_LONG, NYX_NUMBER_ULONG, NYX_NUMBER_DOUBLE, classify_format
+
+########################################################################################################################
+
+@pytest.fixture(autouse = True)
+def clear_cache():
+
+    # warnings are only issued when a format is classified for the first time
+
+    classify_format.cache_clear()
+
+    yield
+
+    classify_format.cache_clear()
+
+########################################################################################################################
+
+@pytest.mark.parametrize('fmt, subtype', [
+    ('%d', NYX_NUMBER_INT),
+    ('%i', NYX_NUMBER_INT),
+    ('%+05hd', NYX_NUMBER_INT),
+    ('%ld', NYX_NUMBER_LONG),
+    ('%lld', NYX_NUMBER_LONG),
+    ('%zd', NYX_NUMBER_LONG),
+    ('%u', NYX_NUMBER_UINT),
+    ('%#x', NYX_NUMBER_UINT),
+    ('%08X', NYX_NUMBER_UINT),
+    ('%lu', NYX_NUMBER_ULONG),
+    ('%llo', NYX_NUMBER_ULONG),
+    ('%f', NYX_NUMBER_DOUBLE),
+    ('%.3f', NYX_NUMBER_DOUBLE),
+    ('%lf', NYX_NUMBER_DOUBLE),
+    ('%-10.2e', NYX_NUMBER_DOUBLE),
+    ('%G', NYX_NUMBER_DOUBLE),
+    ('%a', NYX_NUMBER_DOUBLE),
+    ('%m', NYX_NUMBER_DOUBLE),
+    ('%010.6m', NYX_NUMBER_DOUBLE),
+    ('%9.3m', NYX_NUMBER_DOUBLE),
+    ('100%% %d', NYX_NUMBER_INT),
+    ('T = %.1f K', NYX_NUMBER_DOUBLE),
+])
+def test_accepted(fmt, subtype, recwarn):
+
+    result = classify_format(fmt)
+
+    assert result.subtype == subtype
+    assert result.sexagesimal == fmt.endswith('m')
+
+    assert len(recwarn) == 0
+
+########################################################################################################################
+
+@pytest.mark.parametrize('fmt, ctype, suffix, py_code', [
+    ('%d', 'int', 'int', 'i'),
+    ('%u', 'unsigned int', 'uint', 'i'),
+    ('%ld', 'long', 'long', 'l'),
+    ('%lu', 'unsigned long', 'ulong', 'l'),
+    ('%f', 'double', 'double', 'd'),
+])
+def test_types(fmt, ctype, suffix, py_code):
+
+    result = classify_format(fmt)
+
+    assert (result.ctype, result.suffix, result.py_code) == (ctype, suffix, py_code)
+
+########################################################################################################################
+
+@pytest.mark.parametrize('fmt', [
+    '',
+    'abc',
+    '100%%',
+    '%s',
+    '%c',
+    '%p',
+    '%Lf',
+    '%hf',
+    '%Ld',
+    '%lm',
+])
+def test_rejected(fmt):
+
+    with pytest.raises(ValueError):
+
+        classify_format(fmt)
+
+########################################################################################################################
+
+@pytest.mark.parametrize('fmt, subtype, message', [
+    ('%d %f', NYX_NUMBER_INT, 'Multiple conversions'),
+    ('%f/%f', NYX_NUMBER_DOUBLE, 'Multiple conversions'),
+    ('%*d', NYX_NUMBER_INT, 'Variable width or precision'),
+    ('%.*f', NYX_NUMBER_DOUBLE, 'Variable width or precision'),
+    ('%*.*m', NYX_NUMBER_DOUBLE, 'Variable width or precision'),
+    ('%.4m', NYX_NUMBER_DOUBLE, 'sexagesimal precision'),
+    ('%%d', NYX_NUMBER_INT, 'literal percent sign'),
+    ('%% %%lu', NYX_NUMBER_ULONG, 'literal percent sign'),
+])
+def test_permissive(fmt, subtype, message):
+
+    with pytest.warns(UserWarning, match = message):
+
+        assert classify_format(fmt).subtype == subtype
+
+########################################################################################################################
+
+@pytest.mark.parametrize('fmt, length', [
+    ('%d', None),
+    ('%ld', 'l'),
+    ('%lld', 'll'),
+    ('%jd', 'j'),
+    ('%zu', 'z'),
+    ('%td', 't'),
+])
+def test_length(fmt, length):
+
+    assert classify_format(fmt).length == length
+
+########################################################################################################################
+
+@pytest.mark.parametrize('mode, fmt, ok', [
+    ('posix-c', '%lld', True),
+    ('gnuradio', '%jd', True),
+    ('arduino-eth', '%ld', True),
+    ('arduino-eth', '%zu', True),
+    ('arduino-eth', '%lld', False),
+    ('arduino-wifi', '%jx', False),
+])
+def test_long_long_targets(tmp_path, mode, fmt, ok):
+
+    descr = synthesize_description(mode, 1, 6, 1)
+
+    vector = next(vector for vector in descr['devices']['d0']['vectors'].values() if vector['type'] == 'number')
+
+    vector['defs']['d0']['format'] = fmt
+
+    result = run_job({'descr': descr, 'options': {'output': str(tmp_path)}})
+
+    if ok:
+        assert result['status'] == 'ok', result.get('error')
+    else:
+        assert result['status'] == 'error'
+        assert '64-bit length modifier' in result['error']
+
+########################################################################################################################
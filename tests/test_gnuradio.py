@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import re
+import ast
+
+import pytest
+
+########################################################################################################################
+
+from nyx_gen.bench import synthesize_description
+from nyx_gen.server import run_job
+from nyx_gen.lookup import nyx_hash
+
+########################################################################################################################
+
+def _generate(tmp_path, **overrides) -> dict:
+
+    descr = synthesize_description('gnuradio', 1, 8, 2)
+
+    descr.update(overrides)
+
+    result = run_job({'descr': descr, 'options': {'output': str(tmp_path)}})
+
+    assert result['status'] == 'ok', result.get('error')
+
+    sources = {}
+
+    for filename in ['main.c', 'device_device_0.c', '__init__.py']:
+
+        with open(tmp_path / 'BenchNode' / 'src' / filename, 'rt', encoding = 'utf-8') as f:
+
+            sources[filename] = f.read()
+
+    return sources
+
+########################################################################################################################
+
+def _function(source: str, name: str) -> str:
+
+    return re.search(r'\n[^\n]*\b' + name + r'\(.*?\n}\n', source, re.S).group(0)
+
+########################################################################################################################
+
+def test_stream_field_hashes(tmp_path):
+
+    main = _generate(tmp_path)['main.c']
+
+    names = re.findall(r'"(\w+)"', re.search(r'stream_field_names\[] = {(.*?)};', main, re.S).group(1))
+
+    hashes = re.findall(r'0x([0-9A-F]{8})U, /\* (\w+) \*/', re.search(r'stream_field_hashes\[] = {(.*?)};', main, re.S).group(1))
+
+    assert names == ['samp_rate', 'frequency', 'samples', 'DEF_0', 'DEF_1']
+
+    assert [(int(value, 16), name) for value, name in hashes] == [(nyx_hash(name.encode()), name) for name in names]
+
+    ####################################################################################################################
+
+    for name in ['stream_pub_spectrum', 'stream_pub_spectrum_block', 'stream_pub_device_0_vector_5']:
+
+        assert 'nyx_hash(' not in _function(main, name)
+
+########################################################################################################################
+
+def test_sink_publishes_whole_block(tmp_path):
+
+    sources = _generate(tmp_path)
+
+    sink = next(node for node in ast.parse(sources['__init__.py']).body if isinstance(node, ast.ClassDef) and node.name == 'nyx_sink')
+
+    work = next(node for node in sink.body if isinstance(node, ast.FunctionDef) and node.name == 'work')
+
+    calls = [ast.unparse(node.func) for node in ast.walk(work) if isinstance(node, ast.Call) and ast.unparse(node.func).startswith('_mod.')]
+
+    assert calls == ['_mod.stream_pub_spectrum_block']
+
+    assert not any(isinstance(node, (ast.For, ast.While, ast.comprehension)) for node in ast.walk(work))
+
+    ####################################################################################################################
+
+    block = _function(sources['main.c'], 'stream_pub_spectrum_block')
+
+    assert 'views[2].ndim != 2' in block
+
+    assert re.search(r'for\(Py_ssize_t row = 0; row < n_rows; row\+\+\)\s*{[^}]*nyx_nss_pub\(', block)
+
+    assert '{"stream_pub_spectrum_block", stream_pub_spectrum_block, METH_VARARGS' in sources['main.c']
+
+########################################################################################################################
+
+def test_gil_released_around_node_calls(tmp_path):
+
+    main = _generate(tmp_path)['main.c']
+
+    functions = re.findall(r'\nstatic PyObject \*(\w+)\(PyObject \*self, PyObject \*\w+\)\n{\n(.*?)\n}\n', main, re.S)
+
+    checked = set()
+
+    for name, body in functions:
+
+        regions = re.findall(r'Py_BEGIN_ALLOW_THREADS\n(.*?)Py_END_ALLOW_THREADS', body, re.S)
+
+        for call in re.findall(r'\b(nyx_(?:node_send_\w+|nss_pub))\(', body):
+
+            assert any(call in region and region.lstrip().startswith('pthread_mutex_lock(&node_lock);') and region.rstrip().endswith('pthread_mutex_unlock(&node_lock);') for region in regions), name
+
+            checked.add(name)
+
+        if name.startswith('_set_'):
+
+            assert 'nyx_' not in body, name # setters only queue the update for worker_routine
+
+    assert {'send_message', 'send_del_property', 'stream_pub', 'stream_pub_spectrum', 'stream_pub_spectrum_block', 'stream_pub_device_0_vector_5'} <= checked
+
+    ####################################################################################################################
+
+    body = _function(main, 'stream_pub')
+
+    assert body.index('Py_END_ALLOW_THREADS') < body.index('stream_buffers_release(views, n_fields);') # buffers stay pinned
+
+########################################################################################################################
+
+@pytest.mark.parametrize('rate, interval', [(None, None), (20, 50000000), (3, 333333333)])
+def test_callback_dispatch(tmp_path, rate, interval):
+
+    sources = _generate(tmp_path, **({} if rate is None else {'callbackRate': rate}))
+
+    main = sources['main.c']
+
+    device = sources['device_device_0.c']
+
+    ####################################################################################################################
+
+    props = re.findall(r'DISPATCH_(\w+),', re.search(r'typedef enum\n{\n(\s*DISPATCH_\w+,\n)+', main).group(0))
+
+    assert props[-1] == 'COUNT'
+
+    for prop in props[:-1]:
+
+        assert f'dispatch_{prop.lower()}(new_value);' in device
+
+    assert device.count('PyGILState_Ensure()') == 1 # only the BLOB callback is called synchronously
+
+    ####################################################################################################################
+
+    deliver = _function(main, 'dispatch_deliver')
+
+    assert deliver.count('PyGILState_Ensure()') == 1 # one GIL acquisition per batch
+
+    post = _function(main, 'dispatch_post')
+
+    assert 'free(slot->text);' in post and 'slot->value = value;' in post # the latest value replaces the pending one
+
+    ####################################################################################################################
+
+    if interval is None:
+
+        assert 'DISPATCH_INTERVAL_NS' not in main
+
+    else:
+
+        assert f'#define DISPATCH_INTERVAL_NS {interval}L' in main
+
+        assert 'nanosleep(&interval, NULL);' in _function(main, 'dispatch_routine')
+
+########################################################################################################################
+
+@pytest.mark.parametrize('blob_copy', [None, True, False])
+def test_blob_callback(tmp_path, blob_copy):
+
+    device = _generate(tmp_path, **({} if blob_copy is None else {'blobCopy': blob_copy}))['device_device_0.c']
+
+    callback = _function(device, '_vector_4_def_0_callback')
+
+    if blob_copy is False:
+
+        assert 'PyMemoryView_FromMemory((char *) buff, (Py_ssize_t) size, PyBUF_READ)' in callback
+        assert 'PyBytes_FromStringAndSize' not in callback
+
+        assert callback.index('PyObject_CallObject(') < callback.index('PyObject_CallMethod(py_buff, "release", NULL)') < callback.index('PyGILState_Release(gstate);')
+
+    else:
+
+        assert 'PyBytes_FromStringAndSize((const char *) buff, (Py_ssize_t) size)' in callback
+        assert 'PyMemoryView' not in callback
+
+########################################################################################################################
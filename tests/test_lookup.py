@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import pytest
+
+########################################################################################################################
+
+from nyx_gen.lookup import PerfectHash, build_perfect_hash, lookup_hash, lookup_key
+
+########################################################################################################################
+
+def _lookup(table: PerfectHash, key: bytes) -> int:
+
+    seed = table.seeds[lookup_hash(key) % len(table.seeds)]
+
+    return table.slots[lookup_hash(key, seed) % len(table.slots)]
+
+########################################################################################################################
+
+@pytest.mark.parametrize('n', [1, 2, 3, 7, 64, 257])
+def test_round_trip(n):
+
+    keys = [lookup_key(f'device_{i % 5}', f'VECTOR_{i}') for i in range(n)]
+
+    table = build_perfect_hash(keys)
+
+    assert len(table.slots) == n
+    assert sorted(table.slots) == list(range(n))
+
+    for i, key in enumerate(keys):
+
+        assert _lookup(table, key) == i
+
+########################################################################################################################
+
+def test_empty():
+
+    assert build_perfect_hash([]) == PerfectHash([], [])
+
+########################################################################################################################
+
+def test_duplicate_keys():
+
+    with pytest.raises(ValueError, match = 'Duplicate'):
+
+        build_perfect_hash([lookup_key('a', 'b'), lookup_key('c'), lookup_key('a', 'b')])
+
+########################################################################################################################
+
+def test_lookup_key_separates_names():
+
+    assert lookup_key('ab', 'c') != lookup_key('a', 'bc')
+
+########################################################################################################################
@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import os
+import json
+
+########################################################################################################################
+
+from nyx_gen.bench import synthesize_description
+from nyx_gen.server import run_job
+from nyx_gen.manifest import MANIFEST_FILENAME, Manifest, content_digest
+
+########################################################################################################################
+
+def _write(path, content: str) -> str:
+
+    path.write_text(content, encoding = 'utf-8')
+
+    return content_digest(content)
+
+########################################################################################################################
+
+def _touch(path) -> None:
+
+    st = os.stat(path)
+
+    os.utime(path, ns = (st.st_atime_ns, st.st_mtime_ns + 1000000000))
+
+########################################################################################################################
+
+def test_is_fresh(tmp_path):
+
+    filename = tmp_path / 'main.c'
+
+    manifest = Manifest(str(tmp_path))
+
+    assert not manifest.is_fresh(str(filename), 'inputs')
+
+    manifest.update(str(filename), _write(filename, 'int main;\n'), 'inputs')
+
+    assert manifest.is_fresh(str(filename), 'inputs')
+
+    assert not manifest.is_fresh(str(filename), 'other inputs')
+
+    _touch(filename)
+
+    assert not manifest.is_fresh(str(filename), 'inputs')
+
+    os.unlink(filename)
+
+    assert not manifest.is_fresh(str(filename), 'inputs')
+
+########################################################################################################################
+
+def test_is_up_to_date(tmp_path):
+
+    filename = tmp_path / 'main.c'
+
+    manifest = Manifest(str(tmp_path))
+
+    digest = content_digest('int main;\n')
+
+    assert not manifest.is_up_to_date(str(filename), digest)
+
+    ####################################################################################################################
+
+    _write(filename, 'int main;\n')
+
+    assert manifest.is_up_to_date(str(filename), digest, 'inputs')
+
+    assert manifest.is_fresh(str(filename), 'inputs')
+
+    ####################################################################################################################
+
+    _touch(filename)
+
+    assert manifest.is_up_to_date(str(filename), digest, 'inputs')
+
+    assert manifest.is_fresh(str(filename), 'inputs')
+
+    ####################################################################################################################
+
+    assert not manifest.is_up_to_date(str(filename), content_digest('int main(void);\n'), 'inputs')
+
+    _write(filename, 'int  main;\n')
+
+    assert not manifest.is_up_to_date(str(filename), digest, 'inputs')
+
+########################################################################################################################
+
+def test_save_load(tmp_path):
+
+    filename = tmp_path / 'main.c'
+
+    manifest = Manifest(str(tmp_path), str(tmp_path / 'cache'))
+
+    manifest.update(str(filename), _write(filename, 'int main;\n'), 'inputs')
+
+    manifest.update(str(tmp_path / 'gone.c'), _write(tmp_path / 'gone.c', ''), 'inputs')
+
+    manifest.set_fragment('used', 'text')
+
+    manifest.save()
+
+    os.unlink(tmp_path / 'gone.c')
+
+    ####################################################################################################################
+
+    manifest = Manifest(str(tmp_path), str(tmp_path / 'cache'))
+
+    manifest.load()
+
+    assert manifest.is_fresh(str(filename), 'inputs')
+
+    assert manifest.get_fragment('used') == 'text'
+
+    assert manifest.get_fragment('unknown') is None
+
+    ####################################################################################################################
+
+    manifest.save()
+
+    manifest = Manifest(str(tmp_path))
+
+    manifest.load()
+
+    assert not manifest.is_fresh(str(tmp_path / 'gone.c'), 'inputs')
+
+########################################################################################################################
+
+def test_fragment_cache(tmp_path):
+
+    manifest = Manifest(str(tmp_path), str(tmp_path / 'cache'))
+
+    manifest.set_fragment('used', 'fragment text')
+
+    manifest.save()
+
+    with open(tmp_path / MANIFEST_FILENAME, 'rt', encoding = 'utf-8') as f:
+
+        data = json.load(f)
+
+    assert data['fragments'] == {'used': content_digest('fragment text')}
+
+    ####################################################################################################################
+
+    cached = tmp_path / 'cache' / 'fragments' / f'{content_digest("fragment text")}.txt'
+
+    assert cached.read_text(encoding = 'utf-8') == 'fragment text'
+
+    cached.write_text('edited text', encoding = 'utf-8')
+
+    manifest = Manifest(str(tmp_path), str(tmp_path / 'cache'))
+
+    manifest.load()
+
+    assert manifest.get_fragment('used') is None
+
+########################################################################################################################
+
+def test_no_cache_dir(tmp_path):
+
+    manifest = Manifest(str(tmp_path))
+
+    manifest.set_fragment('used', 'text')
+
+    assert manifest.get_fragment('used') is None
+
+########################################################################################################################
+
+def test_invalid_manifest(tmp_path):
+
+    (tmp_path / MANIFEST_FILENAME).write_text('{', encoding = 'utf-8')
+
+    manifest = Manifest(str(tmp_path))
+
+    manifest.load()
+
+    assert manifest.get_fragment('any') is None
+
+########################################################################################################################
+
+def test_incremental_regeneration(tmp_path, monkeypatch):
+
+    monkeypatch.setenv('NYX_GEN_CACHE_DIR', str(tmp_path / 'cache'))
+
+    job = {
+        'descr': synthesize_description('posix-c', 2, 3, 2),
+        'options': {'output': str(tmp_path / 'out'), 'incremental': True},
+    }
+
+    first = run_job(job)
+
+    assert first['status'] == 'ok', first.get('error')
+    assert first['files']
+
+    ####################################################################################################################
+
+    second = run_job(job)
+
+    assert second['status'] == 'ok', second.get('error')
+    assert second['files'] == []
+    assert second['unchanged']
+    assert set(second['unchanged']) <= set(first['files']) # user-owned files are not even rendered again
+
+    ####################################################################################################################
+
+    glue = next(filename for filename in first['files'] if filename.endswith(os.path.join('autogen', 'glue.c')))
+
+    with open(glue, 'at', encoding = 'utf-8') as f:
+
+        f.write('/* edited */\n')
+
+    third = run_job(job)
+
+    assert third['status'] == 'ok', third.get('error')
+    assert third['files'] == [glue]
+
+    with open(glue, 'rt', encoding = 'utf-8') as f:
+
+        assert '/* edited */' not in f.read()
+
+########################################################################################################################
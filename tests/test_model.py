@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import pytest
+
+########################################################################################################################
+
+from nyx_gen.model import Node, pascalcase
+from nyx_gen.formats import NYX_NUMBER_LONG
+
+########################################################################################################################
+
+def _descr() -> dict:
+
+    return {
+        'nodeName': 'TestNode',
+        'devices': {
+            'b': {'name': 'mount_main', 'rank': 1, 'vectors': {
+                'y': {'name': 'INFO', 'type': 'text', 'rank': 1, 'callback': True, 'defs': {
+                    'n': {'name': 'NAME', 'rank': 0, 'callback': True, 'value': ''},
+                }},
+                'x': {'name': 'COORD', 'type': 'number', 'rank': 0, 'defs': {
+                    'dec': {'name': 'DEC', 'rank': 1, 'format': '%ld', 'callback': True},
+                    'ra': {'name': 'RA', 'rank': 0, 'format': '%9.6m'},
+                }},
+                's': {'name': 'SPECTRUM', 'type': 'stream', 'rank': 2, 'callback': True, 'defs': {
+                    'f': {'name': 'freq', 'rank': 0, 'callback': True},
+                }},
+            }},
+            'a': {'name': 'camera', 'rank': 0, 'vectors': {}},
+        },
+    }
+
+########################################################################################################################
+
+def test_ranks_and_names():
+
+    node = Node(_descr())
+
+    assert [device.name for device in node.devices] == ['camera', 'mount_main']
+
+    mount = node.devices[1]
+
+    assert (mount.ident, mount.upper_ident, mount.pascal_ident) == ('mount_main', 'MOUNT_MAIN', 'MountMain')
+
+    assert [vector.name for vector in mount.vectors] == ['COORD', 'INFO', 'SPECTRUM']
+
+    coord = mount.vectors[0]
+
+    assert [df.name for df in coord.defs] == ['RA', 'DEC']
+    assert [df.symbol for df in coord.defs] == ['mount_main_coord_ra', 'mount_main_coord_dec']
+    assert [df.local_symbol for df in coord.defs] == ['coord_ra', 'coord_dec']
+    assert [df.pascal_symbol for df in coord.defs] == ['CoordRa', 'CoordDec']
+
+########################################################################################################################
+
+def test_types_and_callbacks():
+
+    mount = Node(_descr()).devices[1]
+
+    coord, info, spectrum = mount.vectors
+
+    assert coord.defs[0].number.sexagesimal
+    assert coord.defs[1].subtype == NYX_NUMBER_LONG
+    assert (coord.defs[1].ctype, coord.defs[1].py_code, coord.defs[1].callback_field) == ('long', 'l', 'long')
+
+    assert info.defs[0].number is None
+    assert (info.defs[0].ctype, info.defs[0].py_code) == ('STR_t', 's')
+
+    assert coord.has_def_callbacks and not coord.callback
+    assert info.callback and info.has_def_callbacks
+
+    # stream vectors and props never have callbacks
+
+    assert not spectrum.callback
+    assert not spectrum.defs[0].callback
+    assert spectrum.defs[0].ctype is None
+
+    assert mount.has_callbacks
+    assert not Node(_descr()).devices[0].has_callbacks
+
+########################################################################################################################
+
+def test_item_access():
+
+    df = Node(_descr()).devices[1].vectors[0].defs[1]
+
+    assert df['symbol'] == df.symbol
+    assert df['format'] == '%ld'
+    assert df.get('label') is None
+    assert df.get('label', 'x') == 'x'
+
+    with pytest.raises(KeyError):
+
+        df['_data']
+
+    with pytest.raises(AttributeError):
+
+        df.unknown = 1
+
+########################################################################################################################
+
+@pytest.mark.parametrize('path, name, message', [
+    (('devices', 'a'), 'mount_main', 'Duplicate name `mount_main` in node TestNode'),
+    (('devices', 'b', 'vectors', 'y'), 'COORD', 'Duplicate name `COORD` in device mount_main'),
+    (('devices', 'b', 'vectors', 'x', 'defs', 'dec'), 'RA', 'Duplicate name `RA` in vector mount_main::COORD'),
+])
+def test_duplicates(path, name, message):
+
+    descr = _descr()
+
+    target = descr
+
+    for key in path:
+
+        target = target[key]
+
+    target['name'] = name
+
+    with pytest.raises(ValueError, match = message):
+
+        Node(descr)
+
+########################################################################################################################
+
+def test_invalid_values():
+
+    descr = _descr()
+
+    descr['devices']['b']['vectors']['y']['type'] = 'image'
+
+    with pytest.raises(ValueError, match = 'Invalid type `image` for vector mount_main::INFO'):
+
+        Node(descr)
+
+    ####################################################################################################################
+
+    descr = _descr()
+
+    descr['devices']['b']['vectors']['x']['defs']['ra']['format'] = '%s'
+
+    with pytest.raises(ValueError, match = 'mount_main::COORD::RA'):
+
+        Node(descr)
+
+########################################################################################################################
+
+def test_pascalcase():
+
+    assert pascalcase('mount__main_') == 'MountMain'
+
+########################################################################################################################
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import os
+import argparse
+
+import pytest
+
+########################################################################################################################
+
+from nyx_gen import generators
+from nyx_gen.bench import synthesize_description
+from nyx_gen.server import DEFAULT_OPTIONS
+from nyx_gen.manifest import MANIFEST_FILENAME
+
+########################################################################################################################
+
+def _generate(output, descr: dict, **options) -> dict:
+
+    generator = generators[descr['mode']](argparse.Namespace(**dict(DEFAULT_OPTIONS, output = str(output), **options)), descr)
+
+    generator.run()
+
+    result = {}
+
+    for root, _, filenames in os.walk(output):
+
+        for filename in filenames:
+
+            if filename == MANIFEST_FILENAME:
+
+                continue # holds timestamps
+
+            path = os.path.join(root, filename)
+
+            with open(path, 'rb') as f:
+
+                result[os.path.relpath(path, output)] = f.read()
+
+    return result
+
+########################################################################################################################
+
+@pytest.mark.parametrize('mode', ['posix-c', 'posix-c++', 'gnuradio', 'arduino-eth', 'arduino-wifi'])
+def test_identical_to_serial(tmp_path, mode):
+
+    descr = synthesize_description(mode, 3, 6, 2)
+
+    serial = _generate(tmp_path / 'serial', descr)
+
+    parallel = _generate(tmp_path / 'parallel', descr, jobs = 3)
+
+    assert serial
+    assert parallel == serial
+
+########################################################################################################################
+
+def test_identical_to_serial_incremental(tmp_path, monkeypatch):
+
+    monkeypatch.setenv('NYX_GEN_CACHE_DIR', str(tmp_path / 'cache'))
+
+    descr = synthesize_description('posix-c', 3, 6, 2)
+
+    serial = _generate(tmp_path / 'serial', descr, incremental = True)
+
+    parallel = _generate(tmp_path / 'parallel', descr, incremental = True, jobs = 3)
+
+    assert parallel == serial
+
+    ####################################################################################################################
+
+    descr['devices']['d1']['vectors']['v0']['label'] = 'Changed'
+
+    serial = _generate(tmp_path / 'serial', descr, incremental = True)
+
+    parallel = _generate(tmp_path / 'parallel', descr, incremental = True, jobs = 3)
+
+    assert b'Changed' in parallel[os.path.join('BenchNode', 'src', 'autogen', 'glue.c')]
+    assert parallel == serial
+
+########################################################################################################################
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import re
+import shutil
+import subprocess
+
+import pytest
+
+########################################################################################################################
+
+from nyx_gen.bench import synthesize_description
+from nyx_gen.server import run_job
+
+########################################################################################################################
+
+HARNESS = '''
+#include <stdio.h>
+#include <stdint.h>
+#include <stdbool.h>
+
+typedef struct nyx_node_s nyx_node_t;
+
+static uint64_t now_us = 0;
+
+static int n_polls = 0;
+
+static uint64_t poll_clock_us(void)
+{
+    return now_us;
+}
+
+static void nyx_node_poll(nyx_node_t *node, int timeout_ms)
+{
+    /* the 8th poll handles some I/O and returns early */
+
+    now_us += (n_polls++ == 7 ? 1U : (uint64_t) timeout_ms) * 1000U;
+}
+
+%s
+
+%s
+
+int main(void)
+{
+    int poll_timeout = POLL_MIN_TIMEOUT;
+
+    for(int i = 0; i < 10; i++)
+    {
+        printf("%%d\\n", poll_timeout);
+
+        poll_timeout = poll_adaptive(NULL, poll_timeout, 300, i == 9);
+    }
+
+    printf("%%d\\n", poll_timeout);
+
+    return 0;
+}
+'''
+
+########################################################################################################################
+
+def _generate(tmp_path, mode: str, **overrides) -> dict:
+
+    descr = synthesize_description(mode, 1, 2, 1)
+
+    descr.update(overrides)
+
+    return run_job({'descr': descr, 'options': {'output': str(tmp_path)}})
+
+########################################################################################################################
+
+def _main(tmp_path, mode: str, **overrides) -> str:
+
+    result = _generate(tmp_path, mode, **overrides)
+
+    assert result['status'] == 'ok', result.get('error')
+
+    with open(tmp_path / 'BenchNode' / 'src' / 'main.c', 'rt', encoding = 'utf-8') as f:
+
+        return f.read()
+
+########################################################################################################################
+
+@pytest.mark.parametrize('mode', ['posix-c', 'gnuradio'])
+def test_fixed(tmp_path, mode):
+
+    main = _main(tmp_path, mode)
+
+    assert '#define POLL_MIN_TIMEOUT' not in main
+    assert 'poll_adaptive' not in main
+
+########################################################################################################################
+
+@pytest.mark.parametrize('mode', ['posix-c', 'gnuradio'])
+@pytest.mark.parametrize('timeouts, defines', [
+    ({}, ['#define POLL_MIN_TIMEOUT 10']),
+    ({'pollMinTimeout': 5, 'pollMaxTimeout': 5000}, ['#define POLL_MIN_TIMEOUT 5', '#define POLL_MAX_TIMEOUT 5000']),
+])
+def test_adaptive(tmp_path, mode, timeouts, defines):
+
+    main = _main(tmp_path, mode, pollStrategy = 'adaptive', **timeouts)
+
+    assert re.findall(r'#define POLL_M\w+_TIMEOUT \d+', main) == defines
+
+    assert re.search(r'poll_timeout = poll_adaptive\(node, poll_timeout, poll_max_timeout, \w+(\(\))?\);', main)
+
+    assert ('int poll_max_timeout = POLL_MAX_TIMEOUT;' in main) == ('pollMaxTimeout' in timeouts)
+
+########################################################################################################################
+
+@pytest.mark.parametrize('mode', ['posix-c', 'gnuradio'])
+@pytest.mark.parametrize('overrides, message', [
+    ({'pollStrategy': 'eventfd'}, 'Invalid poll strategy `eventfd`'),
+    ({'pollStrategy': 'adaptive', 'pollMinTimeout': 100, 'pollMaxTimeout': 50}, 'Invalid poll timeouts'),
+])
+def test_invalid(tmp_path, mode, overrides, message):
+
+    result = _generate(tmp_path, mode, **overrides)
+
+    assert result['status'] == 'error'
+    assert message in result['error']
+
+########################################################################################################################
+
+@pytest.mark.skipif(shutil.which('cc') is None, reason = 'no C compiler')
+@pytest.mark.parametrize('mode', ['posix-c', 'gnuradio'])
+def test_backoff(tmp_path, mode):
+
+    main = _main(tmp_path / 'out', mode, pollStrategy = 'adaptive')
+
+    define = re.search(r'#define POLL_MIN_TIMEOUT \d+', main).group(0)
+
+    function = re.search(r'static int poll_adaptive\(.*?\n}\n', main, re.S).group(0)
+
+    (tmp_path / 'poll.c').write_text(HARNESS % (define, function), encoding = 'utf-8')
+
+    subprocess.run(['cc', '-o', str(tmp_path / 'poll'), str(tmp_path / 'poll.c')], check = True)
+
+    output = subprocess.run([str(tmp_path / 'poll')], check = True, capture_output = True, text = True).stdout
+
+    # doubles while idle up to the maximum, back to the minimum after an early return or an active poll
+
+    assert output.split() == ['10', '20', '40', '80', '160', '300', '300', '300', '10', '20', '10']
+
+########################################################################################################################
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import sys
+import json
+import pstats
+
+########################################################################################################################
+
+from nyx_gen import cli
+from nyx_gen.bench import synthesize_description
+from nyx_gen.profiling import Profiler
+
+########################################################################################################################
+
+def _run_cli(tmp_path, monkeypatch, *options) -> None:
+
+    descr = tmp_path / 'node.json'
+
+    descr.write_text(json.dumps(synthesize_description('posix-c', 2, 3, 1)), encoding = 'utf-8')
+
+    monkeypatch.setattr(sys, 'argv', ['nyx-gen', '--output', str(tmp_path / 'out'), *options, str(descr)])
+
+    assert not cli.main()
+
+########################################################################################################################
+
+def test_sections():
+
+    profiler = Profiler(trace_memory = True)
+
+    profiler.start()
+
+    with profiler.section('outer', 'phase'):
+
+        with profiler.section('inner', 'method'):
+
+            data = [bytes(1024) for _ in range(64)]
+
+    profiler.stop()
+
+    del data
+
+    outer, inner = profiler.sections
+
+    assert (outer.name, outer.kind, outer.depth) == ('outer', 'phase', 0)
+    assert (inner.name, inner.kind, inner.depth) == ('inner', 'method', 1)
+
+    assert outer.duration >= inner.duration > 0.0
+    assert inner.peak_memory - inner.base_memory >= 64 * 1024
+    assert outer.peak_memory - outer.base_memory >= 64 * 1024
+
+    ####################################################################################################################
+
+    lines = profiler.format_table().splitlines()
+
+    assert lines[0].split() == ['Section', 'Kind', 'Time', '(ms)', 'Peak', '(KiB)']
+    assert lines[2].split()[:2] == ['outer', 'phase']
+    assert lines[3].startswith('  inner')
+
+########################################################################################################################
+
+def test_timings(tmp_path, monkeypatch, capsys):
+
+    _run_cli(tmp_path, monkeypatch, '--timings')
+
+    rows = [line.split() for line in capsys.readouterr().out.splitlines()]
+
+    sections = {(row[0], row[1]) for row in rows if len(row) == 4}
+
+    assert {('load', 'phase'), ('import', 'phase'), ('init', 'phase'), ('generate', 'phase')} <= sections
+    assert {('_generate_glue', 'method'), ('_generate_devices', 'method')} <= sections
+    assert ('CMakeLists.txt', 'file') in sections
+
+########################################################################################################################
+
+def test_chrome_trace(tmp_path, monkeypatch):
+
+    _run_cli(tmp_path, monkeypatch, '--profile', str(tmp_path / 'trace.json'))
+
+    with open(tmp_path / 'trace.json', 'rt', encoding = 'utf-8') as f:
+
+        events = json.load(f)['traceEvents']
+
+    assert {'load', 'generate', '_generate_glue', 'CMakeLists.txt'} <= {event['name'] for event in events}
+    assert all(event['ph'] == 'X' and event['dur'] >= 0.0 for event in events)
+
+########################################################################################################################
+
+def test_cprofile(tmp_path, monkeypatch):
+
+    _run_cli(tmp_path, monkeypatch, '--profile', str(tmp_path / 'run.prof'))
+
+    stats = pstats.Stats(str(tmp_path / 'run.prof'))
+
+    assert any(name == 'run' for _, _, name in stats.stats)
+
+########################################################################################################################
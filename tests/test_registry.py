@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import os
+import sys
+import json
+import subprocess
+
+import pytest
+
+########################################################################################################################
+
+import nyx_gen
+
+from nyx_gen.registry import BUILTIN_GENERATORS, GeneratorRegistry
+
+########################################################################################################################
+
+_IMPORTED = '''
+import sys, json
+import nyx_gen
+before = sorted(name for name in sys.modules if name.startswith('nyx_gen.generators.'))
+nyx_gen.generators[sys.argv[1]]
+after = sorted(name for name in sys.modules if name.startswith('nyx_gen.generators.'))
+print(json.dumps([before, after]))
+'''
+
+########################################################################################################################
+
+@pytest.mark.parametrize('mode, modules', [
+    ('posix-c', ['nyx_gen.generators.posix_c']),
+    ('posix-c++', ['nyx_gen.generators.posix_cpp']),
+    ('gnuradio', ['nyx_gen.generators.gnuradio', 'nyx_gen.generators.posix_c']),
+    ('arduino-eth', ['nyx_gen.generators.arduino_eth', 'nyx_gen.generators.posix_c']),
+])
+def test_selected_module_only(mode, modules):
+
+    env = dict(os.environ, PYTHONPATH = os.path.dirname(os.path.dirname(nyx_gen.__file__)))
+
+    output = subprocess.run([sys.executable, '-c', _IMPORTED, mode], env = env, check = True, capture_output = True, text = True).stdout
+
+    before, after = json.loads(output)
+
+    assert before == []
+    assert after == sorted(modules)
+
+########################################################################################################################
+
+def test_mapping():
+
+    registry = GeneratorRegistry(BUILTIN_GENERATORS)
+
+    assert set(BUILTIN_GENERATORS) <= set(registry)
+    assert 'posix-c' in registry
+    assert 'cobol' not in registry
+
+    assert registry['posix-c'].__name__ == 'PosixCGenerator'
+    assert registry['posix-c'] is registry['posix-c']
+
+    with pytest.raises(KeyError):
+
+        registry['cobol']
+
+########################################################################################################################
+
+def test_register():
+
+    registry = GeneratorRegistry(BUILTIN_GENERATORS)
+
+    registry.register('posix-c', 'nyx_gen.generators.posix_cpp:PosixCPPGenerator')
+
+    assert registry['posix-c'].__name__ == 'PosixCPPGenerator'
+
+########################################################################################################################
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import json
+import concurrent.futures
+
+import pytest
+
+########################################################################################################################
+
+from nyx_gen.bench import synthesize_description
+from nyx_gen.server import process_line
+
+########################################################################################################################
+
+def _reply(job) -> dict:
+
+    return json.loads(process_line(job if isinstance(job, str) else json.dumps(job)))
+
+########################################################################################################################
+
+@pytest.mark.parametrize('line', ['', '   ', '\n'])
+def test_blank_line(line):
+
+    assert process_line(line) is None
+
+########################################################################################################################
+
+@pytest.mark.parametrize('line, message', [
+    ('{', 'Invalid JSON'),
+    ('not json', 'Invalid JSON'),
+    ('[1, 2]', 'Job must be a JSON object'),
+    ('"job"', 'Job must be a JSON object'),
+])
+def test_invalid_json(line, message):
+
+    reply = _reply(line)
+
+    assert reply['id'] is None
+    assert reply['status'] == 'error'
+    assert message in reply['error']
+
+########################################################################################################################
+
+def test_missing_description():
+
+    reply = _reply({'id': 7})
+
+    assert reply == {'id': 7, 'status': 'error', 'error': 'Missing `descr` or `descrFile`'}
+
+########################################################################################################################
+
+def test_missing_description_file(tmp_path):
+
+    reply = _reply({'id': 'a', 'descrFile': str(tmp_path / 'missing.json')})
+
+    assert reply['id'] == 'a'
+    assert reply['status'] == 'error'
+
+########################################################################################################################
+
+@pytest.mark.parametrize('descr, message', [
+    ({'nodeName': 'Node'}, 'Missing `mode` in the description'),
+    (['posix-c'], 'Description must be a JSON object'),
+])
+def test_invalid_description(tmp_path, descr, message):
+
+    reply = _reply({'id': 5, 'descr': descr, 'options': {'output': str(tmp_path)}})
+
+    assert reply == {'id': 5, 'status': 'error', 'error': message}
+
+########################################################################################################################
+
+def test_invalid_generator(tmp_path):
+
+    reply = _reply({'id': 1, 'descr': {'mode': 'cobol'}, 'options': {'output': str(tmp_path)}})
+
+    assert reply == {'id': 1, 'status': 'error', 'error': 'Invalid code generator: cobol'}
+
+########################################################################################################################
+
+def test_invalid_option(tmp_path):
+
+    reply = _reply({'id': 2, 'descr': synthesize_description('posix-c', 1, 1, 1), 'options': {'verbose': True}})
+
+    assert reply == {'id': 2, 'status': 'error', 'error': 'Invalid option: verbose'}
+
+########################################################################################################################
+
+def test_generator_error(tmp_path):
+
+    descr = synthesize_description('posix-c', 1, 1, 1)
+
+    descr['buildProfile'] = 'Fastest'
+
+    reply = _reply({'id': 3, 'descr': descr, 'options': {'output': str(tmp_path)}})
+
+    assert reply['id'] == 3
+    assert reply['status'] == 'error'
+    assert 'Invalid build profile' in reply['error']
+
+########################################################################################################################
+
+def test_success(tmp_path):
+
+    reply = _reply({'id': 4, 'descr': synthesize_description('posix-c', 1, 2, 1), 'options': {'output': str(tmp_path)}})
+
+    assert reply['id'] == 4
+    assert reply['status'] == 'ok'
+    assert reply['files']
+    assert set(reply['timings']) == {'load', 'generate', 'total'}
+
+########################################################################################################################
+
+def test_jobs_ignored(tmp_path, monkeypatch):
+
+    def no_pool(*args, **kwargs):
+
+        raise AssertionError('a job must not start a process pool')
+
+    monkeypatch.setattr(concurrent.futures, 'ProcessPoolExecutor', no_pool)
+
+    reply = _reply({'id': 6, 'descr': synthesize_description('posix-c', 1, 2, 1), 'options': {'output': str(tmp_path), 'jobs': 4}})
+
+    assert reply['status'] == 'ok', reply.get('error')
+
+########################################################################################################################
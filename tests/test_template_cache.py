@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+########################################################################################################################
+
+import os
+import sys
+import subprocess
+
+########################################################################################################################
+
+import nyx_gen
+
+from nyx_gen.abstract_generator import compile_template, get_cache_dir
+
+########################################################################################################################
+
+_RENDER = 'from nyx_gen.abstract_generator import compile_template; print(compile_template("{{ n * 2 }} items").render(n = 21))'
+
+########################################################################################################################
+
+def _render_in_subprocess(cache_dir) -> str:
+
+    env = dict(os.environ, NYX_GEN_CACHE_DIR = str(cache_dir), PYTHONPATH = os.path.dirname(os.path.dirname(nyx_gen.__file__)))
+
+    return subprocess.run([sys.executable, '-c', _RENDER], env = env, check = True, capture_output = True, text = True).stdout
+
+########################################################################################################################
+
+def test_compiled_once():
+
+    assert compile_template('{{ a }}-{{ b }}') is compile_template('{{ a }}-{{ b }}')
+
+    assert compile_template('{{ a }}-{{ b }}').render(a = 1, b = 2) == '1-2'
+
+########################################################################################################################
+
+def test_cache_dir(tmp_path, monkeypatch):
+
+    monkeypatch.setenv('NYX_GEN_CACHE_DIR', str(tmp_path / 'cache'))
+
+    assert get_cache_dir() == str(tmp_path / 'cache')
+    assert (tmp_path / 'cache').is_dir()
+
+    ####################################################################################################################
+
+    (tmp_path / 'file').write_text('', encoding = 'utf-8')
+
+    monkeypatch.setenv('NYX_GEN_CACHE_DIR', str(tmp_path / 'file' / 'cache'))
+
+    assert get_cache_dir() is None
+
+########################################################################################################################
+
+def test_bytecode_reused_across_processes(tmp_path):
+
+    assert _render_in_subprocess(tmp_path) == '42 items\n'
+
+    cached = [name for name in os.listdir(tmp_path) if name.startswith('__nyx_gen_')]
+
+    assert len(cached) == 1
+
+    mtime_ns = os.stat(tmp_path / cached[0]).st_mtime_ns
+
+    ####################################################################################################################
+
+    assert _render_in_subprocess(tmp_path) == '42 items\n'
+
+    assert os.stat(tmp_path / cached[0]).st_mtime_ns == mtime_ns
+
+########################################################################################################################
+
+def test_unusable_cache_dir(tmp_path):
+
+    (tmp_path / 'file').write_text('', encoding = 'utf-8')
+
+    assert _render_in_subprocess(tmp_path / 'file' / 'cache') == '42 items\n'
+
+########################################################################################################################